@@ -5,13 +5,18 @@ Cloudera AI Workbench MCP HTTP Server - Simplified HTTP-only implementation
 
 import os
 import json
+import asyncio
+import time
 from typing import Dict, Any
-from fastmcp import FastMCP
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+from .instrumentation import ThreadedFastMCP, ToolMetricsMiddleware, finish_call, result_text
+from .src.functions import metrics, slow_calls, timing, tracing
+from .src.functions.profiler import DEFAULT_INTERVAL, SamplingProfiler
+
 # Import all the implementation functions
 from .src.functions.upload_folder import upload_folder
 from .src.functions.upload_file import upload_file
@@ -117,6 +122,15 @@ from .src.functions.get_default_quota import get_default_quota
 from .src.functions.get_default_quotas import get_default_quotas
 from .src.functions.list_all_resource_groups import list_all_resource_groups
 from .src.functions.list_all_accelerator_node_labels import list_all_accelerator_node_labels
+from .src.functions.batch_create_job_runs import batch_create_job_runs
+from .src.functions.run_job_dag import run_job_dag
+from .src.functions.list_across_projects import list_across_projects
+from .src.functions.bulk_get_experiment_run_metrics import bulk_get_experiment_run_metrics
+from .src.functions.experiment_leaderboard import experiment_leaderboard
+from .src.functions.log_experiment_runs_buffered import log_experiment_runs_buffered
+from .src.functions.walk_project_files import walk_project_files
+from .src.functions.download_folder import download_folder
+from .src.functions.delete_project_files import delete_project_files
 
 
 def get_config() -> Dict[str, str]:
@@ -129,16 +143,18 @@ def get_config() -> Dict[str, str]:
                 return f.read().strip()
         return os.environ.get(env_var, "")
     
-    return {
-        "host": read_secret_or_env("cai_workbench_host", "CAI_WORKBENCH_HOST"),
-        "api_key": read_secret_or_env("cai_workbench_api_key", "CAI_WORKBENCH_API_KEY"),
-        "project_id": read_secret_or_env("cai_workbench_project_id", "CAI_WORKBENCH_PROJECT_ID"),
-        "team": read_secret_or_env("cai_workbench_team", "CAI_WORKBENCH_TEAM"),
-    }
+    with timing.phase("config_load"):
+        return {
+            "host": read_secret_or_env("cai_workbench_host", "CAI_WORKBENCH_HOST"),
+            "api_key": read_secret_or_env("cai_workbench_api_key", "CAI_WORKBENCH_API_KEY"),
+            "project_id": read_secret_or_env("cai_workbench_project_id", "CAI_WORKBENCH_PROJECT_ID"),
+            "team": read_secret_or_env("cai_workbench_team", "CAI_WORKBENCH_TEAM"),
+        }
 
 
 # Initialize FastMCP server for HTTP
-mcp = FastMCP("cloudera-ml-http")
+mcp = ThreadedFastMCP("cloudera-ml-http")
+mcp.add_middleware(ToolMetricsMiddleware())
 
 
 
@@ -146,14 +162,21 @@ mcp = FastMCP("cloudera-ml-http")
 # --- Tools previously in TOOL_IMPLEMENTATIONS (now proper @mcp.tool) ---
 
 @mcp.tool()
-def upload_folder_tool(folder_path: str, ignore_folders: str = None, project_id: str = None) -> str:
-    """Upload a folder to Cloudera AI."""
+def upload_folder_tool(folder_path: str, ignore_folders: str = None, project_id: str = None, resume: bool = True, reset_journal: bool = False, ignore_patterns: str = None, max_file_size: int = None, include_extensions: str = None, exclude_extensions: str = None, dedupe: bool = False) -> str:
+    """Upload a folder (gitignore/.caiignore aware, resumable, skipping content already uploaded)."""
     config = get_config()
     if project_id:
         config["project_id"] = project_id
     return json.dumps(upload_folder(config, {
         "folder_path": folder_path,
-        "ignore_folders": ignore_folders.split(",") if ignore_folders else None
+        "ignore_folders": ignore_folders.split(",") if ignore_folders else None,
+        "resume": resume,
+        "reset_journal": reset_journal,
+        "ignore_patterns": ignore_patterns,
+        "max_file_size": max_file_size,
+        "include_extensions": include_extensions,
+        "exclude_extensions": exclude_extensions,
+        "dedupe": dedupe
     }), indent=2)
 
 @mcp.tool()
@@ -234,6 +257,33 @@ def list_projects_tool() -> str:
     config = get_config()
     return json.dumps(get_project_id(config, {"project_name": "*"}), indent=2)
 
+@mcp.tool()
+def list_jobs_across_projects_tool(status: str = None, project_name: str = None, max_workers: int = 8) -> str:
+    """List jobs in every project concurrently, optionally filtered by status substrings."""
+    config = get_config()
+    return json.dumps(list_across_projects(config, {
+        "resource": "jobs", "status": status,
+        "project_name": project_name, "max_workers": max_workers
+    }), indent=2)
+
+@mcp.tool()
+def list_applications_across_projects_tool(status: str = None, project_name: str = None, max_workers: int = 8) -> str:
+    """List applications in every project concurrently, optionally filtered by status substrings."""
+    config = get_config()
+    return json.dumps(list_across_projects(config, {
+        "resource": "applications", "status": status,
+        "project_name": project_name, "max_workers": max_workers
+    }), indent=2)
+
+@mcp.tool()
+def list_model_deployments_across_projects_tool(status: str = None, project_name: str = None, max_workers: int = 8) -> str:
+    """List model deployments in every project concurrently, optionally filtered by status substrings."""
+    config = get_config()
+    return json.dumps(list_across_projects(config, {
+        "resource": "model_deployments", "status": status,
+        "project_name": project_name, "max_workers": max_workers
+    }), indent=2)
+
 @mcp.tool()
 def create_job_run_tool(project_id: str, job_id: str, runtime_identifier: str = None, environment_variables: str = None, override_config: str = None) -> str:
     """Create a run for an existing job."""
@@ -245,6 +295,30 @@ def create_job_run_tool(project_id: str, job_id: str, runtime_identifier: str =
         "override_config": override_config
     }), indent=2)
 
+@mcp.tool()
+def batch_create_job_runs_tool(job_ids: str = None, search_filter: str = None, environment_variables: str = None, job_overrides: str = None, max_workers: int = 8, project_id: str = None) -> str:
+    """Start runs for many jobs (by ID list or list_jobs search_filter) with bounded concurrency."""
+    config = get_config()
+    if project_id:
+        config["project_id"] = project_id
+    return json.dumps(batch_create_job_runs(config, {
+        "job_ids": job_ids, "search_filter": search_filter,
+        "environment_variables": environment_variables,
+        "job_overrides": job_overrides, "max_workers": max_workers
+    }), indent=2)
+
+@mcp.tool()
+def run_job_dag_tool(dag: str, on_failure: str = "fail_fast", max_parallel: int = 4, poll_interval: int = 10, timeout: int = 3600, environment_variables: str = None, job_overrides: str = None, project_id: str = None) -> str:
+    """Run a job dependency graph (JSON {job_id: [deps]}) with parallel launches and a critical-path report."""
+    config = get_config()
+    if project_id:
+        config["project_id"] = project_id
+    return json.dumps(run_job_dag(config, {
+        "dag": dag, "on_failure": on_failure, "max_parallel": max_parallel,
+        "poll_interval": poll_interval, "timeout": timeout,
+        "environment_variables": environment_variables, "job_overrides": job_overrides
+    }), indent=2)
+
 @mcp.tool()
 def list_job_runs_tool(project_id: str = None, job_id: str = None) -> str:
     """List job runs."""
@@ -349,12 +423,17 @@ def delete_experiment_run_tool(experiment_id: str, run_id: str, project_id: str
     return json.dumps(delete_experiment_run(config, {"experiment_id": experiment_id, "run_id": run_id}), indent=2)
 
 @mcp.tool()
-def delete_experiment_run_batch_tool(experiment_id: str, run_ids: str, project_id: str = None) -> str:
-    """Delete multiple experiment runs."""
+def delete_experiment_run_batch_tool(experiment_id: str, run_ids: str = None, project_id: str = None, older_than_days: float = None, status: str = None, metric_key: str = None, metric_below: float = None, metric_above: float = None, search_filter: str = None, dry_run: bool = False, chunk_size: int = 100, max_workers: int = 8) -> str:
+    """Delete experiment runs by ID or by age/status/metric selector, in concurrent chunks."""
     config = get_config()
     if project_id:
         config["project_id"] = project_id
-    return json.dumps(delete_experiment_run_batch(config, {"experiment_id": experiment_id, "run_ids": run_ids}), indent=2)
+    return json.dumps(delete_experiment_run_batch(config, {
+        "experiment_id": experiment_id, "run_ids": run_ids,
+        "older_than_days": older_than_days, "status": status, "metric_key": metric_key,
+        "metric_below": metric_below, "metric_above": metric_above, "search_filter": search_filter,
+        "dry_run": dry_run, "chunk_size": chunk_size, "max_workers": max_workers
+    }), indent=2)
 
 @mcp.tool()
 def log_experiment_run_batch_tool(experiment_id: str, run_updates: str, project_id: str = None) -> str:
@@ -364,6 +443,15 @@ def log_experiment_run_batch_tool(experiment_id: str, run_updates: str, project_
         config["project_id"] = project_id
     return json.dumps(log_experiment_run_batch(config, {"experiment_id": experiment_id, "run_updates": run_updates}), indent=2)
 
+@mcp.tool()
+def log_experiment_runs_buffered_tool(experiment_id: str, updates: str, project_id: str = None, max_batch_entries: int = 1000, max_retries: int = 3) -> str:
+    """Log per-step run updates merged per run, split into server-sized chunks and retried."""
+    config = get_config()
+    return json.dumps(log_experiment_runs_buffered(config, {
+        "project_id": project_id, "experiment_id": experiment_id, "updates": updates,
+        "max_batch_entries": max_batch_entries, "max_retries": max_retries
+    }), indent=2)
+
 @mcp.tool()
 def create_model_build_tool(project_id: str, model_id: str, file_path: str, function_name: str, kernel: str = "python3", runtime_identifier: str = None, cpu: int = 1, memory: int = 2, nvidia_gpu: int = 0) -> str:
     """Create a new model build."""
@@ -523,6 +611,15 @@ def list_project_files_tool(project_id: str, path: str = "") -> str:
     config = get_config()
     return json.dumps(list_project_files(config, {"project_id": project_id, "path": path}), indent=2)
 
+@mcp.tool()
+def walk_project_files_tool(project_id: str, path: str = "", include: str = None, exclude: str = None, max_depth: int = None, max_workers: int = 8) -> str:
+    """Recursively list project files (concurrent per level) with glob include/exclude and max depth."""
+    config = get_config()
+    return json.dumps(walk_project_files(config, {
+        "project_id": project_id, "path": path, "include": include, "exclude": exclude,
+        "max_depth": max_depth, "max_workers": max_workers
+    }), indent=2)
+
 @mcp.tool()
 def delete_project_file_tool(file_path: str, project_id: str = None) -> str:
     """Delete a file from a project."""
@@ -531,6 +628,14 @@ def delete_project_file_tool(file_path: str, project_id: str = None) -> str:
         config["project_id"] = project_id
     return json.dumps(delete_project_file(config, {"file_path": file_path}), indent=2)
 
+@mcp.tool()
+def delete_project_files_tool(paths: str, project_id: str = None, dry_run: bool = False, max_workers: int = 8) -> str:
+    """Delete many project paths or gitignore-style globs concurrently, with per-path outcomes."""
+    config = get_config()
+    return json.dumps(delete_project_files(config, {
+        "project_id": project_id, "paths": paths, "dry_run": dry_run, "max_workers": max_workers
+    }), indent=2)
+
 @mcp.tool()
 def update_project_file_metadata_tool(file_path: str, description: str = None, hidden: bool = None, project_id: str = None) -> str:
     """Update file metadata."""
@@ -604,12 +709,16 @@ async def mcp_protocol_endpoint(request):
                 }, status_code=404)
 
             try:
-                result = await tool.run(arguments)
-                return JSONResponse({
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {"content": [{"type": "text", "text": str(result)}], "isError": False}
-                })
+                started = time.perf_counter()
+                with metrics.track_tool(tool_name) as call, timing.collect(record=slow_calls.enabled()) as timer:
+                    result = await tool.run(arguments)
+                    finish_call(tool_name, arguments, result, call, timer, started)
+                    with tracing.span("serialize_response"):
+                        return JSONResponse({
+                            "jsonrpc": "2.0",
+                            "id": request_id,
+                            "result": {"content": [{"type": "text", "text": result_text(result)}], "isError": False}
+                        })
             except Exception as e:
                 return JSONResponse({
                     "jsonrpc": "2.0",
@@ -632,6 +741,49 @@ async def mcp_protocol_endpoint(request):
         }, status_code=500)
 
 
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request):
+    """Prometheus text exposition of tool, upstream API and cache metrics."""
+    from starlette.responses import PlainTextResponse
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@mcp.custom_route("/debug/profile", methods=["GET", "POST"])
+async def debug_profile(request):
+    """Sample all threads for ?seconds=S or the next ?calls=N tool calls; returns collapsed stacks."""
+    from starlette.responses import JSONResponse, PlainTextResponse
+
+    query = request.query_params
+    try:
+        calls = int(query.get("calls", 0))
+        seconds = min(float(query.get("seconds", 60 if calls else 10)), 600.0)
+        interval = float(query.get("interval_ms", DEFAULT_INTERVAL * 1000)) / 1000
+    except ValueError:
+        return JSONResponse({"status": "error", "message": "calls, seconds and interval_ms must be numbers"},
+                            status_code=400)
+
+    baseline = metrics.total_tool_calls()
+    profiler = SamplingProfiler(
+        interval=interval,
+        include_idle=query.get("include_idle") in ("1", "true"),
+        until=(lambda: metrics.total_tool_calls() - baseline >= calls) if calls else None,
+        max_seconds=seconds,
+    )
+    try:
+        profiler.start()
+    except RuntimeError as e:
+        return JSONResponse({"status": "error", "message": str(e)}, status_code=409)
+    while profiler.running:
+        await asyncio.sleep(0.05)
+
+    summary = profiler.summary()
+    return PlainTextResponse(profiler.collapsed(), headers={
+        "X-Profile-Samples": str(summary["samples"]),
+        "X-Profile-Seconds": str(summary["seconds"]),
+        "X-Profile-Tool-Calls": str(int(metrics.total_tool_calls() - baseline)),
+    })
+
+
 @mcp.custom_route("/test", methods=["GET"])
 async def test_endpoint(request):
     """Test endpoint to verify server is running."""
@@ -891,10 +1043,19 @@ def list_experiment_runs_tool(project_id: str, experiment_id: str, search_filter
     return json.dumps(result, indent=2)
 
 @mcp.tool()
-def get_experiment_run_metrics_tool(project_id: str, experiment_id: str, run_id: str, metric_key: str) -> str:
-    """
-    get_experiment_run_metrics tool.
-    """
+def experiment_leaderboard_tool(project_id: str, experiment_id: str, rank_by: str = None, minimize: str = None, metric_keys: str = None, top_n: int = 20, search_filter: str = None) -> str:
+    """Rank experiment runs by a metric with best-per-metric, summary stats and param correlations."""
+    config = get_config()
+    return json.dumps(experiment_leaderboard(config, {
+        "project_id": project_id, "experiment_id": experiment_id,
+        "rank_by": rank_by, "minimize": minimize, "metric_keys": metric_keys,
+        "top_n": top_n, "search_filter": search_filter
+    }), indent=2)
+
+@mcp.tool()
+def get_experiment_run_metrics_tool(project_id: str, experiment_id: str, run_id: str, metric_key: str,
+                                    max_points: int = None, downsample: str = "lttb") -> str:
+    """Get one run metric, optionally downsampled to max_points (lttb or minmax) with summary stats."""
     config = get_config()
     
     params_dict = {}
@@ -906,11 +1067,24 @@ def get_experiment_run_metrics_tool(project_id: str, experiment_id: str, run_id:
         params_dict['run_id'] = run_id
     if metric_key is not None:
         params_dict['metric_key'] = metric_key
+    if max_points is not None:
+        params_dict['max_points'] = max_points
+    if downsample is not None:
+        params_dict['downsample'] = downsample
 
-        
     result = get_experiment_run_metrics(config, params_dict)
     return json.dumps(result, indent=2)
 
+@mcp.tool()
+def bulk_get_experiment_run_metrics_tool(project_id: str, experiment_id: str, metric_keys: str, run_ids: str = None, reduce: str = "last", max_workers: int = 8) -> str:
+    """Fetch several metrics for many experiment runs concurrently as a run x metric matrix."""
+    config = get_config()
+    return json.dumps(bulk_get_experiment_run_metrics(config, {
+        "project_id": project_id, "experiment_id": experiment_id,
+        "metric_keys": metric_keys, "run_ids": run_ids,
+        "reduce": reduce, "max_workers": max_workers
+    }), indent=2)
+
 @mcp.tool()
 def list_all_jobs_tool(search_filter: str = None, page_size: int = None, page_token: str = None) -> str:
     """
@@ -1034,10 +1208,9 @@ def restart_model_deployment_tool(project_id: str, model_id: str, build_id: str,
     return json.dumps(result, indent=2)
 
 @mcp.tool()
-def download_project_file_tool(project_id: str, path: str) -> str:
-    """
-    download_project_file tool.
-    """
+def download_project_file_tool(project_id: str, path: str, local_path: str = None,
+                               max_bytes: int = None, preview: str = None) -> str:
+    """Download a project file inline, stream it to local_path, or preview its head/tail (max_bytes)."""
     config = get_config()
     
     params_dict = {}
@@ -1045,11 +1218,25 @@ def download_project_file_tool(project_id: str, path: str) -> str:
         params_dict['project_id'] = project_id
     if path is not None:
         params_dict['path'] = path
+    if local_path is not None:
+        params_dict['local_path'] = local_path
+    if max_bytes is not None:
+        params_dict['max_bytes'] = max_bytes
+    if preview is not None:
+        params_dict['preview'] = preview
 
-        
     result = download_project_file(config, params_dict)
     return json.dumps(result, indent=2)
 
+@mcp.tool()
+def download_folder_tool(local_dir: str, project_id: str = None, path: str = "", include: str = None, exclude: str = None, max_depth: int = None, overwrite: bool = False, max_workers: int = 8) -> str:
+    """Download a project directory concurrently, skipping files whose local size/mtime match."""
+    config = get_config()
+    return json.dumps(download_folder(config, {
+        "project_id": project_id, "local_dir": local_dir, "path": path, "include": include,
+        "exclude": exclude, "max_depth": max_depth, "overwrite": overwrite, "max_workers": max_workers
+    }), indent=2)
+
 
 @mcp.tool()
 def list_registered_models_tool(search_filter: str = None, sort: str = None, page_size: int = None, page_token: str = None) -> str:
@@ -1510,9 +1697,16 @@ def main():
     print(f"  - Debug tools:  http://localhost:{port}/debug/tools")
     print(f"  - Debug call:   http://localhost:{port}/debug/call")
     print(f"  - Test status:  http://localhost:{port}/test")
+    print(f"  - Metrics:      http://localhost:{port}/metrics")
+    print(f"  - Profile:      http://localhost:{port}/debug/profile?seconds=10")
     print("")
     print("⚠️  WARNING: No authentication - development use only!")
     
+    if tracing.configure_tracing(service_name="cai-workbench-mcp-http"):
+        print(f"Tracing enabled ({os.getenv('CAI_MCP_TRACING')})")
+    if slow_calls.configure_slow_call_log():
+        print(f"Logging tool calls slower than {slow_calls.threshold_ms():g} ms")
+
     # Run HTTP server
     mcp.run(transport="http", host=host, port=port)
 
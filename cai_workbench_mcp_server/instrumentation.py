@@ -0,0 +1,83 @@
+"""FastMCP server plumbing: worker-thread tool dispatch, and middleware that feeds tool
+calls into metrics, tracing, debug timing and the slow-call log."""
+
+import functools
+import inspect
+import json
+import time
+
+import anyio.to_thread
+from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools.tool import FunctionTool
+
+try:
+    from .src.functions import metrics, slow_calls, timing
+except ImportError:
+    # Direct script execution of stdio_server.py
+    from src.functions import metrics, slow_calls, timing
+
+
+def run_in_worker_thread(tool):
+    """Make a synchronous function tool run in anyio's worker thread pool.
+
+    FastMCP calls sync tool functions inline on the event loop, so a tool waiting on
+    the workbench API, a retry backoff or the rate limiter would stall every other
+    session. Context variables (debug timing, tracing) are copied into the thread.
+    """
+    if not isinstance(tool, FunctionTool) or inspect.iscoroutinefunction(tool.fn):
+        return tool
+    fn = tool.fn
+
+    @functools.wraps(fn)
+    async def threaded(*args, **kwargs):
+        return await anyio.to_thread.run_sync(functools.partial(fn, *args, **kwargs))
+
+    return tool.model_copy(update={"fn": threaded})
+
+
+class ThreadedFastMCP(FastMCP):
+    """FastMCP server whose synchronous tools run off the event loop (see run_in_worker_thread)."""
+
+    def add_tool(self, tool):
+        return super().add_tool(run_in_worker_thread(tool))
+
+
+def result_text(result) -> str:
+    """Text of the first content block of a ToolResult, which is where tools put their JSON."""
+    content = getattr(result, "content", None)
+    return getattr(content[0], "text", "") if content else ""
+
+
+def attach_timing(result, timer) -> None:
+    """Add a _timing block to a tool's JSON object response; other responses are left alone."""
+    if timer is None or not timing.enabled():
+        return
+    text = result_text(result)
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError):
+        return
+    if not isinstance(data, dict):
+        return
+    data["_timing"] = timer.as_dict()
+    result.content[0].text = json.dumps(data, indent=2)
+
+
+def finish_call(name: str, arguments, result, call, timer, started: float) -> None:
+    """Post-process one tool result: failure flag for metrics, _timing block, slow-call record."""
+    call.failed = metrics.tool_result_failed(result_text(result))
+    slow_calls.record_call(name, arguments, (time.perf_counter() - started) * 1000, call.failed, timer)
+    attach_timing(result, timer)
+
+
+class ToolMetricsMiddleware(Middleware):
+    """Record metrics (and a tracing span) for tool calls arriving over the native MCP transport."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        name = context.message.name
+        started = time.perf_counter()
+        with metrics.track_tool(name) as call, timing.collect(record=slow_calls.enabled()) as timer:
+            result = await call_next(context)
+            finish_call(name, context.message.arguments, result, call, timer, started)
+        return result
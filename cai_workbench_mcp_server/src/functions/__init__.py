@@ -106,6 +106,15 @@ from .get_default_quota import get_default_quota
 from .get_default_quotas import get_default_quotas
 from .list_all_resource_groups import list_all_resource_groups
 from .list_all_accelerator_node_labels import list_all_accelerator_node_labels
+from .batch_create_job_runs import batch_create_job_runs
+from .run_job_dag import run_job_dag
+from .list_across_projects import list_across_projects
+from .bulk_get_experiment_run_metrics import bulk_get_experiment_run_metrics
+from .experiment_leaderboard import experiment_leaderboard
+from .log_experiment_runs_buffered import ExperimentRunBatchLogger, log_experiment_runs_buffered
+from .walk_project_files import walk_project_files
+from .download_folder import download_folder
+from .delete_project_files import delete_project_files
 
 __all__ = [
     'upload_file',
@@ -214,4 +223,14 @@ __all__ = [
     "get_default_quotas",
     "list_all_resource_groups",
     "list_all_accelerator_node_labels",
+    "batch_create_job_runs",
+    "run_job_dag",
+    "list_across_projects",
+    "bulk_get_experiment_run_metrics",
+    "experiment_leaderboard",
+    "log_experiment_runs_buffered",
+    "ExperimentRunBatchLogger",
+    "walk_project_files",
+    "download_folder",
+    "delete_project_files",
 ] 
\ No newline at end of file
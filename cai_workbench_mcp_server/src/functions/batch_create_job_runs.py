@@ -0,0 +1,88 @@
+"""Start runs for many jobs concurrently in Cloudera AI."""
+
+from typing import Any, Dict, List
+
+try:
+    from cmlapi.rest import ApiException
+except ImportError:
+    class ApiException(Exception):
+        """Placeholder when cmlapi is not installed."""
+        status = None
+        body = None
+
+from .create_job_run import build_job_run_body
+from .http_helpers import collect_pages, setup_client, serialize_result
+from .parallel import error_message, load_json, map_bounded, split_ids
+
+
+def _resolve_job_ids(client, project_id: str, params: Dict[str, Any]) -> List[str]:
+    job_ids = split_ids(params.get("job_ids"))
+    if job_ids or not params.get("search_filter"):
+        return job_ids
+    jobs = collect_pages(
+        client.list_jobs, "jobs", project_id, search_filter=params["search_filter"], page_size=100
+    )
+    return [job["id"] for job in jobs if job.get("id")]
+
+
+def batch_create_job_runs(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Create runs for a list of jobs (or jobs matching search_filter) with bounded concurrency.
+
+    Args:
+        config: MCP configuration
+        params: Function parameters
+            - job_ids: List or comma-separated string of job IDs
+            - search_filter: list_jobs search filter, used when job_ids is empty
+            - environment_variables: Environment variables applied to every run
+            - job_overrides: Mapping of job_id to per-run parameters
+              (environment_variables, runtime_identifier, override_config)
+            - max_workers: Maximum concurrent create_job_run calls (default 8)
+
+    Returns:
+        Dict with started runs and per-job failures
+    """
+    params = params or {}
+    project_id = params.get("project_id") or config.get("project_id")
+    if not project_id:
+        return {"success": False, "message": "project_id is required"}
+    if not params.get("job_ids") and not params.get("search_filter"):
+        return {"success": False, "message": "job_ids or search_filter is required"}
+
+    try:
+        shared_env = load_json(params.get("environment_variables"), "environment_variables") or {}
+        overrides = load_json(params.get("job_overrides"), "job_overrides") or {}
+    except ValueError as e:
+        return {"success": False, "message": str(e)}
+
+    try:
+        client = setup_client(config["host"], config["api_key"])
+        job_ids = _resolve_job_ids(client, project_id, params)
+        if not job_ids:
+            return {"success": True, "message": "No jobs matched", "data": {"runs": [], "failed": []}}
+
+        def _start(job_id: str) -> Dict[str, Any]:
+            run_params = dict(overrides.get(job_id) or {})
+            env = dict(shared_env)
+            env.update(load_json(run_params.get("environment_variables"), "environment_variables") or {})
+            run_params["environment_variables"] = env
+            result = serialize_result(client.create_job_run(build_job_run_body(run_params), project_id, job_id))
+            return result or {}
+
+        results = map_bounded(_start, job_ids, params.get("max_workers"))
+        runs = []
+        failed = []
+        for job_id, (result, error) in zip(job_ids, results, strict=True):
+            if error is not None:
+                failed.append({"job_id": job_id, "error": error_message(error)})
+            else:
+                runs.append({"job_id": job_id, "run_id": result.get("id"), "status": result.get("status")})
+
+        return {
+            "success": True,
+            "message": f"Started {len(runs)} job runs, {len(failed)} failed",
+            "data": {"runs": runs, "failed": failed},
+        }
+    except ApiException as e:
+        return {"success": False, "message": f"API error: {e.status} - {e.body}"}
+    except Exception as e:
+        return {"success": False, "message": f"Error creating job runs: {str(e)}"}
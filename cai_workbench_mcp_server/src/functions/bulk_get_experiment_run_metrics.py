@@ -0,0 +1,108 @@
+"""Fetch many experiment run metrics concurrently in Cloudera AI."""
+
+from typing import Any, Dict, List, Optional
+
+try:
+    from cmlapi.rest import ApiException
+except ImportError:
+    class ApiException(Exception):
+        """Placeholder when cmlapi is not installed."""
+        status = None
+        body = None
+
+from .get_experiment_run_metrics import metric_points
+from .http_helpers import collect_pages, setup_client, serialize_result
+from .parallel import error_message, map_bounded, split_ids
+
+REDUCERS = ("last", "min", "max", "mean")
+
+
+def _reduce(points: List[Dict[str, Any]], reducer: str) -> Optional[float]:
+    if not points:
+        return None
+    values = [p["value"] for p in points]
+    if reducer == "min":
+        return min(values)
+    if reducer == "max":
+        return max(values)
+    if reducer == "mean":
+        return sum(values) / len(values)
+    return values[-1]
+
+
+def bulk_get_experiment_run_metrics(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Fetch metric_keys for many runs and return a dense run x metric matrix.
+
+    Args:
+        config: MCP configuration
+        params: Function parameters
+            - experiment_id: Experiment containing the runs
+            - metric_keys: List or comma-separated string of metric keys
+            - run_ids: List or comma-separated run IDs (default: every run in the experiment)
+            - reduce: How a metric history becomes one cell: last, min, max or mean (default last)
+            - max_workers: Maximum concurrent metric requests (default 8)
+
+    Returns:
+        Dict with run_ids, metric_keys, matrix rows aligned to run_ids, and failures
+    """
+    params = params or {}
+    project_id = params.get("project_id") or config.get("project_id")
+    experiment_id = params.get("experiment_id")
+    metric_keys = split_ids(params.get("metric_keys"))
+    reducer = params.get("reduce") or "last"
+
+    if not project_id:
+        return {"success": False, "message": "project_id is required"}
+    if not experiment_id:
+        return {"success": False, "message": "experiment_id is required"}
+    if not metric_keys:
+        return {"success": False, "message": "metric_keys is required"}
+    if reducer not in REDUCERS:
+        return {"success": False, "message": f"reduce must be one of: {', '.join(REDUCERS)}"}
+
+    try:
+        client = setup_client(config["host"], config["api_key"])
+        run_ids = split_ids(params.get("run_ids"))
+        run_names: Dict[str, Any] = {}
+        if not run_ids:
+            runs = collect_pages(
+                client.list_experiment_runs, "experiment_runs", project_id, experiment_id, page_size=100
+            )
+            run_ids = [r["id"] for r in runs if r.get("id")]
+            run_names = {r["id"]: r.get("name") for r in runs if r.get("id")}
+
+        cells = [(run_id, key) for run_id in run_ids for key in metric_keys]
+
+        def _fetch(cell):
+            run_id, key = cell
+            data = serialize_result(client.get_experiment_run_metrics(project_id, experiment_id, run_id, key))
+            return _reduce(metric_points(data), reducer)
+
+        results = map_bounded(_fetch, cells, params.get("max_workers"))
+
+        matrix = [[None] * len(metric_keys) for _ in run_ids]
+        failed = []
+        for index, ((run_id, key), (value, error)) in enumerate(zip(cells, results, strict=True)):
+            if error is not None:
+                failed.append({"run_id": run_id, "metric_key": key, "error": error_message(error)})
+                continue
+            matrix[index // len(metric_keys)][index % len(metric_keys)] = value
+
+        data = {
+            "run_ids": run_ids,
+            "metric_keys": metric_keys,
+            "reduce": reducer,
+            "matrix": matrix,
+            "failed": failed,
+        }
+        if run_names:
+            data["run_names"] = [run_names.get(run_id) for run_id in run_ids]
+        return {
+            "success": True,
+            "message": f"Fetched {len(cells) - len(failed)} of {len(cells)} run metrics",
+            "data": data,
+        }
+    except ApiException as e:
+        return {"success": False, "message": f"API error: {e.status} - {e.body}"}
+    except Exception as e:
+        return {"success": False, "message": f"Error getting metrics: {str(e)}"}
@@ -0,0 +1,174 @@
+"""Local content-hash index used to skip re-uploading identical files."""
+
+import hashlib
+import mmap
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .metrics import record_cache
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".cache", "cai_workbench_mcp", "content_index.sqlite3")
+HASH_CHUNK_SIZE = 1024 * 1024
+MMAP_THRESHOLD = 8 * 1024 * 1024
+COMMIT_EVERY = 200
+# Several upload_folder calls may share the index; wait for the other writer instead of failing
+BUSY_TIMEOUT = 30.0
+
+
+def default_index_path() -> str:
+    return os.environ.get("CAI_CONTENT_INDEX_PATH", DEFAULT_INDEX_PATH)
+
+
+def hash_file(path: str, size: Optional[int] = None) -> str:
+    """SHA-256 of a file using a reused read buffer, or mmap for large files."""
+    digest = hashlib.sha256()
+    size = os.path.getsize(path) if size is None else size
+    with open(path, "rb") as f:
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for offset in range(0, len(view), HASH_CHUNK_SIZE * 8):
+                        digest.update(view[offset:offset + HASH_CHUNK_SIZE * 8])
+                finally:
+                    view.release()
+        else:
+            buffer = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                digest.update(view[:read])
+    return digest.hexdigest()
+
+
+class ContentIndex:
+    """SQLite-backed map of local file hashes and of which hashes live at which remote paths.
+
+    files   caches sha256 per local path keyed on (size, mtime_ns) so unchanged files
+            are never re-read.
+    uploads records (host, project_id, remote_path) -> sha256 after each successful upload.
+
+    Hash inserts are batched; callers should commit() before slow work (an upload) so
+    the write lock is never held across network I/O. Upload records and forget()
+    commit immediately.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_index_path()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._db = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+        if self.path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                local_path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, sha256 TEXT
+            );
+            CREATE TABLE IF NOT EXISTS uploads (
+                host TEXT, project_id TEXT, remote_path TEXT, sha256 TEXT, size INTEGER,
+                uploaded_at REAL, PRIMARY KEY (host, project_id, remote_path)
+            );
+            CREATE INDEX IF NOT EXISTS uploads_by_hash ON uploads (sha256);
+            """
+        )
+        self._dirty = 0
+        self.stats = {"hashed": 0, "hash_cache_hits": 0, "bytes_hashed": 0}
+
+    def file_hash(self, local_path: str, stat: os.stat_result) -> str:
+        local_path = os.path.abspath(local_path)
+        row = self._db.execute(
+            "SELECT sha256 FROM files WHERE local_path = ? AND size = ? AND mtime_ns = ?",
+            (local_path, stat.st_size, stat.st_mtime_ns),
+        ).fetchone()
+        record_cache("content_hash", bool(row))
+        if row:
+            self.stats["hash_cache_hits"] += 1
+            return row[0]
+        sha256 = hash_file(local_path, stat.st_size)
+        self.stats["hashed"] += 1
+        self.stats["bytes_hashed"] += stat.st_size
+        self._db.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+            (local_path, stat.st_size, stat.st_mtime_ns, sha256),
+        )
+        self._touch()
+        return sha256
+
+    def is_uploaded(self, host: str, project_id: str, remote_path: str, sha256: str) -> bool:
+        row = self._db.execute(
+            "SELECT 1 FROM uploads WHERE host = ? AND project_id = ? AND remote_path = ? AND sha256 = ?",
+            (host, project_id, remote_path, sha256),
+        ).fetchone()
+        record_cache("upload_dedupe", row is not None)
+        return row is not None
+
+    def record_upload(self, host: str, project_id: str, remote_path: str, sha256: str, size: int) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO uploads VALUES (?, ?, ?, ?, ?, ?)",
+            (host, project_id, remote_path, sha256, size, time.time()),
+        )
+        self._dirty += 1
+        self.commit()
+
+    def forget(self, host: str, project_id: str, remote_path: Optional[str] = None) -> None:
+        """Drop upload records for a project, or for one path and everything below it."""
+        if remote_path is None:
+            self._db.execute("DELETE FROM uploads WHERE host = ? AND project_id = ?", (host, project_id))
+        else:
+            remote_path = remote_path.strip("/")
+            self._db.execute(
+                "DELETE FROM uploads WHERE host = ? AND project_id = ? "
+                "AND (remote_path = ? OR substr(remote_path, 1, ?) = ?)",
+                (host, project_id, remote_path, len(remote_path) + 1, remote_path + "/"),
+            )
+        self._dirty += 1
+        self.commit()
+
+    def locations(self, sha256: str) -> List[Dict[str, Any]]:
+        """Every (host, project, path) known to hold this content."""
+        rows = self._db.execute(
+            "SELECT host, project_id, remote_path, size, uploaded_at FROM uploads WHERE sha256 = ?",
+            (sha256,),
+        ).fetchall()
+        keys: Tuple[str, ...] = ("host", "project_id", "remote_path", "size", "uploaded_at")
+        return [dict(zip(keys, row, strict=True)) for row in rows]
+
+    def _touch(self) -> None:
+        self._dirty += 1
+        if self._dirty >= COMMIT_EVERY:
+            self.commit()
+
+    def commit(self) -> None:
+        if self._dirty:
+            self._db.commit()
+            self._dirty = 0
+
+    def close(self) -> None:
+        self.commit()
+        self._db.close()
+
+
+def forget_remote(host: str, project_id: str, remote_paths: Optional[List[str]] = None,
+                  index_path: Optional[str] = None) -> None:
+    """Invalidate upload records after remote deletes so dedupe cannot skip a missing file.
+
+    remote_paths=None forgets the whole project. Best effort: a missing or busy index
+    never fails the delete that triggered it.
+    """
+    path = index_path or default_index_path()
+    if not os.path.exists(path):
+        return
+    try:
+        index = ContentIndex(path)
+        try:
+            for remote_path in (remote_paths if remote_paths is not None else [None]):
+                index.forget(host, project_id, remote_path)
+        finally:
+            index.close()
+    except sqlite3.Error:
+        pass
@@ -14,6 +14,20 @@ except ImportError:
 from .http_helpers import setup_client, serialize_result
 
 
+def build_job_run_body(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the CreateJobRunRequest body from optional run parameters."""
+    body = {}
+    if params.get("runtime_identifier"):
+        body["runtime_identifier"] = params["runtime_identifier"]
+    if params.get("environment_variables"):
+        env = params["environment_variables"]
+        body["environment_variables"] = json.loads(env) if isinstance(env, str) else env
+    if params.get("override_config"):
+        oc = params["override_config"]
+        body["override_config"] = json.loads(oc) if isinstance(oc, str) else oc
+    return body
+
+
 def create_job_run(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """Create a run for an existing job."""
     params = params or {}
@@ -25,15 +39,7 @@ def create_job_run(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str,
     if not job_id:
         return {"success": False, "message": "job_id is required"}
 
-    body = {}
-    if params.get("runtime_identifier"):
-        body["runtime_identifier"] = params["runtime_identifier"]
-    if params.get("environment_variables"):
-        env = params["environment_variables"]
-        body["environment_variables"] = json.loads(env) if isinstance(env, str) else env
-    if params.get("override_config"):
-        oc = params["override_config"]
-        body["override_config"] = json.loads(oc) if isinstance(oc, str) else oc
+    body = build_job_run_body(params)
 
     try:
         client = setup_client(config["host"], config["api_key"])
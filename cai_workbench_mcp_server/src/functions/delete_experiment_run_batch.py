@@ -1,6 +1,7 @@
 """Delete experiment runs in batch in Cloudera AI."""
 
-from typing import Any, Dict
+import time
+from typing import Any, Dict, List, Optional
 
 try:
     from cmlapi.rest import ApiException
@@ -10,33 +11,152 @@ except ImportError:
         status = None
         body = None
 
-from .http_helpers import setup_client, serialize_result
+from .http_helpers import collect_pages, epoch_seconds, run_key_values, setup_client
+from .parallel import error_message, map_bounded, split_ids
+
+DEFAULT_CHUNK_SIZE = 100
+MAX_CHUNK_SIZE = 1000
+SELECTOR_KEYS = ("older_than_days", "metric_key", "metric_below", "metric_above", "status", "search_filter")
+
+
+def _optional_float(params: Dict[str, Any], key: str) -> Optional[float]:
+    value = params.get(key)
+    if value in (None, ""):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{key} must be a number") from None
+
+
+def select_runs(runs: List[Dict[str, Any]], params: Dict[str, Any], now: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Pick runs matching every given criterion: age, status and metric threshold.
+
+    Status matches exactly, ignoring case. Runs without a start time never match
+    an age filter, and runs missing the metric never match a metric threshold,
+    so incomplete data is never deleted.
+    """
+    now = time.time() if now is None else now
+    older_than_days = _optional_float(params, "older_than_days")
+    metric_below = _optional_float(params, "metric_below")
+    metric_above = _optional_float(params, "metric_above")
+    metric_key = params.get("metric_key")
+    statuses = [s.lower() for s in split_ids(params.get("status"))]
+    if metric_key and metric_below is None and metric_above is None:
+        raise ValueError("metric_key needs metric_below or metric_above")
+    if not metric_key and (metric_below is not None or metric_above is not None):
+        raise ValueError("metric_below and metric_above need metric_key")
+
+    selected = []
+    for run in runs:
+        if older_than_days is not None:
+            started = epoch_seconds(run.get("start_time"))
+            if started is None or now - started < older_than_days * 86400:
+                continue
+        if statuses and str(run.get("status") or "").lower() not in statuses:
+            continue
+        if metric_key:
+            try:
+                value = float(run_key_values(run, "metrics").get(metric_key))
+            except (TypeError, ValueError):
+                continue
+            if metric_below is not None and not value < metric_below:
+                continue
+            if metric_above is not None and not value > metric_above:
+                continue
+        selected.append(run)
+    return selected
 
 
 def delete_experiment_run_batch(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
-    """Delete multiple experiment runs in a single request."""
+    """Delete experiment runs in concurrent chunks, by explicit IDs or by selector.
+
+    Args:
+        config: MCP configuration
+        params: Function parameters
+            - experiment_id: Experiment containing the runs
+            - run_ids: List or comma-separated run IDs
+            - older_than_days / status / metric_key with metric_below or metric_above /
+              search_filter: Selector mode, used when run_ids is not given
+            - dry_run: Only report the runs that would be deleted
+            - chunk_size: Run IDs per delete request (default 100, max 1000)
+            - max_workers: Maximum concurrent delete requests (default 8)
+
+    Returns:
+        Dict with deleted/failed counts and per-chunk results
+    """
     params = params or {}
     project_id = params.get("project_id") or config.get("project_id")
     experiment_id = params.get("experiment_id")
-    run_ids = params.get("run_ids")
+    run_ids = split_ids(params.get("run_ids"))
+    selector_mode = not run_ids and any(params.get(k) not in (None, "") for k in SELECTOR_KEYS)
 
     if not project_id:
         return {"success": False, "message": "project_id is required"}
     if not experiment_id:
         return {"success": False, "message": "experiment_id is required"}
-    if not run_ids:
-        return {"success": False, "message": "run_ids is required"}
-
-    ids_list = run_ids.split(",") if isinstance(run_ids, str) else run_ids
-    body = {"run_ids": ids_list}
+    if not run_ids and not selector_mode:
+        return {"success": False, "message": "run_ids or a selector (older_than_days, status, metric_key, search_filter) is required"}
+    try:
+        chunk_size = int(params.get("chunk_size") or DEFAULT_CHUNK_SIZE)
+    except (TypeError, ValueError):
+        return {"success": False, "message": "chunk_size must be an integer"}
+    chunk_size = max(1, min(chunk_size, MAX_CHUNK_SIZE))
+    if selector_mode:
+        try:
+            select_runs([], params)
+        except ValueError as e:
+            return {"success": False, "message": str(e)}
 
     try:
         client = setup_client(config["host"], config["api_key"])
-        result = client.delete_experiment_run_batch(body, project_id, experiment_id)
+        selected = None
+        if selector_mode:
+            kwargs = {"page_size": 100}
+            if params.get("search_filter"):
+                kwargs["search_filter"] = params["search_filter"]
+            runs = collect_pages(client.list_experiment_runs, "experiment_runs", project_id, experiment_id, **kwargs)
+            selected = [
+                {"id": r.get("id"), "name": r.get("name"), "status": r.get("status"), "start_time": r.get("start_time")}
+                for r in select_runs(runs, params)
+            ]
+            run_ids = [r["id"] for r in selected if r["id"]]
+
+        if params.get("dry_run"):
+            return {
+                "success": True,
+                "message": f"Dry run: {len(run_ids)} experiment runs would be deleted",
+                "data": {"run_ids": run_ids, "selected": selected, "dry_run": True},
+            }
+
+        chunks = [run_ids[i:i + chunk_size] for i in range(0, len(run_ids), chunk_size)]
+        results = map_bounded(
+            lambda chunk: client.delete_experiment_run_batch({"run_ids": chunk}, project_id, experiment_id),
+            chunks,
+            params.get("max_workers"),
+        )
+
+        chunk_reports = []
+        deleted = 0
+        failed_run_ids: List[str] = []
+        for index, (chunk, (_, error)) in enumerate(zip(chunks, results, strict=True)):
+            report = {"chunk": index, "count": len(chunk), "success": error is None}
+            if error is None:
+                deleted += len(chunk)
+            else:
+                report["error"] = error_message(error)
+                report["run_ids"] = chunk
+                failed_run_ids.extend(chunk)
+            chunk_reports.append(report)
+
+        data = {"deleted": deleted, "failed": len(failed_run_ids), "failed_run_ids": failed_run_ids,
+                "chunks": chunk_reports}
+        if selected is not None:
+            data["selected"] = selected
         return {
-            "success": True,
-            "message": f"Successfully deleted {len(ids_list)} experiment runs",
-            "data": serialize_result(result),
+            "success": not failed_run_ids,
+            "message": f"Deleted {deleted} of {len(run_ids)} experiment runs in {len(chunks)} chunks",
+            "data": data,
         }
     except ApiException as e:
         return {"success": False, "message": f"API error: {e.status} - {e.body}"}
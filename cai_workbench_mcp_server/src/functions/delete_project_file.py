@@ -8,7 +8,8 @@ except ImportError:
         """Placeholder when cmlapi is not installed."""
         status = None
         body = None
-from .http_helpers import setup_client, serialize_result
+from .content_index import forget_remote
+from .http_helpers import normalize_host, setup_client, serialize_result
 
 def delete_project_file(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """Delete a file from a project."""
@@ -22,6 +23,7 @@ def delete_project_file(config: Dict[str, str], params: Dict[str, Any]) -> Dict[
     try:
         client = setup_client(config["host"], config["api_key"])
         result = client.delete_project_file(project_id, file_path)
+        forget_remote(normalize_host(config["host"]), project_id, [file_path])
         return {"success": True, "message": f"Successfully deleted file '{file_path}'", "data": serialize_result(result)}
     except ApiException as e:
         return {"success": False, "message": f"API error: {e.status} - {e.body}"}
@@ -0,0 +1,135 @@
+"""Delete many project files or directories in Cloudera AI."""
+
+from typing import Any, Dict, List, Tuple
+
+try:
+    from cmlapi.rest import ApiException
+except ImportError:
+    class ApiException(Exception):
+        """Placeholder when cmlapi is not installed."""
+        status = None
+        body = None
+
+from .content_index import forget_remote
+from .http_helpers import normalize_host, setup_client
+from .parallel import error_message, map_bounded, split_ids
+from .path_filter import PathFilter
+from .walk_project_files import walk_remote_tree
+
+GLOB_CHARS = set("*?[")
+
+
+def _is_glob(path: str) -> bool:
+    return any(c in GLOB_CHARS for c in path)
+
+
+def _static_prefix(pattern: str) -> str:
+    """Directory part of a glob before its first wildcard segment, e.g. "data/raw" for "data/raw/*.csv"."""
+    parts = pattern.split("/")
+    static = []
+    for part in parts[:-1]:
+        if _is_glob(part):
+            break
+        static.append(part)
+    return "/".join(static)
+
+
+def _collapse(paths: List[str]) -> List[str]:
+    """Drop paths that sit inside another path of the list; deleting the parent covers them."""
+    kept: List[str] = []
+    for path in sorted(set(paths)):
+        if not any(path.startswith(parent + "/") for parent in kept):
+            kept.append(path)
+    return kept
+
+
+def expand_paths(client: Any, project_id: str, specs: List[str], max_workers: Any = None) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Resolve literal paths and glob patterns into concrete project paths.
+
+    Globs use gitignore syntax (so "*.pyc" matches at any depth and "**/__pycache__"
+    includes the top level) and are matched against files and directories below
+    their static prefix; a matched directory is deleted as a whole.
+    """
+    paths: List[str] = []
+    failed: List[Dict[str, Any]] = []
+    for spec in specs:
+        spec = spec.strip("/")
+        if not _is_glob(spec):
+            paths.append(spec)
+            continue
+        pattern = PathFilter([spec])
+        tree = walk_remote_tree(client, project_id, root=_static_prefix(spec), max_workers=max_workers)
+        failed.extend(tree["failed"])
+        paths.extend(d for d in tree["directories"] if pattern.is_ignored(d, is_dir=True))
+        paths.extend(f["path"] for f in tree["files"] if pattern.is_ignored(f["path"]))
+    return _collapse(p for p in paths if p), failed
+
+
+def delete_project_files(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Delete a list of project paths and glob patterns concurrently.
+
+    Args:
+        config: MCP configuration
+        params: Function parameters
+            - paths: List or comma-separated project paths and globs
+              (e.g. "old/report.pdf,**/__pycache__,data/tmp/*.csv")
+            - dry_run: Only return the paths that would be deleted
+            - max_workers: Maximum concurrent delete requests (default 8)
+
+    Returns:
+        Dict with a per-path outcome: deleted, not_found or failed
+    """
+    params = params or {}
+    project_id = params.get("project_id") or config.get("project_id")
+    specs = split_ids(params.get("paths"))
+    if not project_id:
+        return {"success": False, "message": "project_id is required"}
+    if not specs:
+        return {"success": False, "message": "paths is required"}
+
+    try:
+        client = setup_client(config["host"], config["api_key"])
+        paths, listing_failures = expand_paths(client, project_id, specs, params.get("max_workers"))
+
+        if params.get("dry_run"):
+            return {
+                "success": True,
+                "message": f"Dry run: {len(paths)} paths would be deleted",
+                "data": {"paths": paths, "listing_failures": listing_failures, "dry_run": True},
+            }
+
+        results = map_bounded(
+            lambda path: client.delete_project_file(project_id, path),
+            paths,
+            params.get("max_workers"),
+        )
+
+        outcomes = []
+        counts = {"deleted": 0, "not_found": 0, "failed": 0}
+        for path, (_, error) in zip(paths, results, strict=True):
+            if error is None:
+                status = "deleted"
+            elif getattr(error, "status", None) == 404:
+                status = "not_found"
+            else:
+                status = "failed"
+            counts[status] += 1
+            outcome = {"path": path, "status": status}
+            if status == "failed":
+                outcome["error"] = error_message(error)
+            outcomes.append(outcome)
+
+        # Keep upload dedupe from skipping files that no longer exist remotely
+        forget_remote(normalize_host(config["host"]), project_id,
+                      [o["path"] for o in outcomes if o["status"] != "failed"])
+
+        return {
+            "success": counts["failed"] == 0 and not listing_failures,
+            "message": f"Deleted {counts['deleted']} paths, {counts['not_found']} not found, "
+                       f"{counts['failed']} failed",
+            "data": {**counts, "results": outcomes, "listing_failures": listing_failures},
+        }
+    except ApiException as e:
+        return {"success": False, "message": f"API error: {e.status} - {e.body}"}
+    except Exception as e:
+        return {"success": False, "message": f"Error: {str(e)}"}
@@ -0,0 +1,133 @@
+"""Download a project directory from Cloudera AI to a local folder."""
+
+import os
+import posixpath
+import time
+from typing import Any, Dict
+
+try:
+    from cmlapi.rest import ApiException
+except ImportError:
+    class ApiException(Exception):
+        """Placeholder when cmlapi is not installed."""
+        status = None
+        body = None
+
+from .download_project_file import DEFAULT_CHUNK_SIZE, stream_project_file
+from .http_helpers import epoch_seconds, setup_client
+from .parallel import error_message, map_bounded, split_ids
+from .walk_project_files import walk_remote_tree
+
+# Remote mtimes are second-resolution at best; allow for rounding when comparing.
+MTIME_TOLERANCE_SECONDS = 1.0
+
+
+def local_copy_matches(local_path: str, size: int, mtime: Any) -> bool:
+    """True when local_path exists with the remote size and (if known) the remote mtime."""
+    try:
+        stat = os.stat(local_path)
+    except OSError:
+        return False
+    if stat.st_size != size:
+        return False
+    remote_mtime = epoch_seconds(mtime)
+    return remote_mtime is None or abs(stat.st_mtime - remote_mtime) <= MTIME_TOLERANCE_SECONDS
+
+
+def download_folder(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Download a project directory tree with concurrent streaming downloads.
+
+    Args:
+        config: MCP configuration
+        params: Function parameters
+            - path: Project directory to download (default: project root)
+            - local_dir: Local directory to download into
+            - include / exclude: Glob patterns, as for walk_project_files
+            - max_depth: Levels of subdirectories to descend (default: unlimited)
+            - overwrite: Download even when the local size/mtime already match
+            - max_workers: Maximum concurrent downloads and listings (default 8)
+
+    Returns:
+        Dict with downloaded/skipped/failed counts, bytes and throughput
+    """
+    params = params or {}
+    project_id = params.get("project_id") or config.get("project_id")
+    local_dir = params.get("local_dir")
+    if not project_id:
+        return {"success": False, "message": "project_id is required"}
+    if not local_dir:
+        return {"success": False, "message": "local_dir is required"}
+    max_depth = params.get("max_depth")
+    try:
+        max_depth = int(max_depth) if max_depth not in (None, "") else None
+    except (TypeError, ValueError):
+        return {"success": False, "message": "max_depth must be an integer"}
+    root = (params.get("path") or "").strip("/")
+
+    try:
+        started = time.monotonic()
+        client = setup_client(config["host"], config["api_key"])
+        tree = walk_remote_tree(
+            client,
+            project_id,
+            root=root,
+            max_depth=max_depth,
+            include=split_ids(params.get("include")),
+            exclude=split_ids(params.get("exclude")),
+            max_workers=params.get("max_workers"),
+        )
+
+        base = os.path.abspath(local_dir)
+        pending = []
+        skipped = 0
+        failed = []
+        for entry in tree["files"]:
+            relative = posixpath.relpath(entry["path"], root) if root else entry["path"]
+            target = os.path.abspath(os.path.join(base, *relative.split("/")))
+            if not target.startswith(base + os.sep):
+                failed.append({"path": entry["path"], "error": "path escapes local_dir"})
+                continue
+            if not params.get("overwrite") and local_copy_matches(target, entry["size"], entry["mtime"]):
+                skipped += 1
+                continue
+            pending.append((entry, target))
+
+        def _download(item):
+            entry, target = item
+            meta = stream_project_file(client, project_id, entry["path"], target, DEFAULT_CHUNK_SIZE)
+            remote_mtime = epoch_seconds(entry["mtime"])
+            if remote_mtime is not None:
+                os.utime(target, (remote_mtime, remote_mtime))
+            return meta
+
+        results = map_bounded(_download, pending, params.get("max_workers"))
+        downloaded = []
+        total_bytes = 0
+        for (entry, _), (meta, error) in zip(pending, results, strict=True):
+            if error is not None:
+                failed.append({"path": entry["path"], "error": error_message(error)})
+                continue
+            downloaded.append(entry["path"])
+            total_bytes += meta["bytes"]
+
+        duration = time.monotonic() - started
+        return {
+            "success": not failed and not tree["failed"],
+            "message": f"Downloaded {len(downloaded)} files ({total_bytes} bytes), skipped {skipped}, "
+                       f"{len(failed)} failed",
+            "data": {
+                "local_dir": base,
+                "files_total": len(tree["files"]),
+                "downloaded": downloaded,
+                "skipped": skipped,
+                "failed": failed,
+                "listing_failures": tree["failed"],
+                "bytes_downloaded": total_bytes,
+                "duration_seconds": round(duration, 3),
+                "throughput_bytes_per_second": round(total_bytes / duration) if duration > 0 else None,
+            },
+        }
+    except ApiException as e:
+        return {"success": False, "message": f"API error: {e.status} - {e.body}"}
+    except Exception as e:
+        return {"success": False, "message": f"Error downloading folder: {str(e)}"}
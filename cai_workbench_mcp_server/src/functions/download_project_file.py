@@ -1,6 +1,9 @@
 """Download a project file in Cloudera AI."""
 
-from typing import Any, Dict
+import hashlib
+import os
+import time
+from typing import Any, Dict, Optional
 try:
     from cmlapi.rest import ApiException
 except ImportError:
@@ -10,17 +13,140 @@ except ImportError:
         body = None
 from .http_helpers import setup_client
 
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_PREVIEW_BYTES = 64 * 1024
+PREVIEW_MODES = ("head", "tail")
+
+
+def _chunks(response: Any, chunk_size: int):
+    """Yield raw body chunks from a non-preloaded (urllib3) response."""
+    while True:
+        chunk = response.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _content_length(response: Any) -> Optional[int]:
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return int(headers.get("Content-Length"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _release(response: Any) -> None:
+    release = getattr(response, "release_conn", None)
+    if callable(release):
+        release()
+
+
+def stream_project_file(client: Any, project_id: str, path: str, local_path: str,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """Stream a project file to local_path in fixed-size chunks without buffering it in memory.
+
+    The body is written to "<local_path>.part" and renamed into place only once the
+    byte count matches Content-Length (when the server sends one).
+    """
+    started = time.monotonic()
+    response = client.download_project_file(project_id, path, _preload_content=False)
+    expected = _content_length(response)
+    digest = hashlib.sha256()
+    written = 0
+    directory = os.path.dirname(os.path.abspath(local_path))
+    os.makedirs(directory, exist_ok=True)
+    partial = f"{local_path}.part"
+    try:
+        with open(partial, "wb") as out:
+            for chunk in _chunks(response, chunk_size):
+                out.write(chunk)
+                digest.update(chunk)
+                written += len(chunk)
+        if expected is not None and written != expected:
+            raise IOError(f"size mismatch for {path}: expected {expected} bytes, received {written}")
+        os.replace(partial, local_path)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    finally:
+        _release(response)
+    return {
+        "path": path,
+        "local_path": os.path.abspath(local_path),
+        "bytes": written,
+        "duration_seconds": round(time.monotonic() - started, 3),
+        "sha256": digest.hexdigest(),
+    }
+
+
+def preview_project_file(client: Any, project_id: str, path: str, max_bytes: int = DEFAULT_PREVIEW_BYTES,
+                         mode: str = "head", chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """Return the first or last max_bytes of a file as text.
+
+    head stops reading as soon as enough bytes arrived; tail streams the body and keeps
+    only a bounded trailing window.
+    """
+    response = client.download_project_file(project_id, path, _preload_content=False)
+    total = 0
+    window = bytearray()
+    truncated = False
+    try:
+        for chunk in _chunks(response, chunk_size):
+            total += len(chunk)
+            window.extend(chunk)
+            if len(window) > max_bytes:
+                truncated = True
+                if mode == "head":
+                    del window[max_bytes:]
+                    break
+                del window[:len(window) - max_bytes]
+    finally:
+        _release(response)
+    return {
+        "path": path,
+        "content": bytes(window).decode("utf-8", errors="replace"),
+        "mode": mode,
+        "bytes_returned": len(window),
+        "truncated": truncated,
+        "total_bytes": total if mode == "tail" or not truncated else _content_length(response),
+        "binary": b"\x00" in window,
+    }
+
+
 def download_project_file(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
-    """Download a file from a project."""
+    """Download a file from a project.
+
+    With local_path the file is streamed to disk and only metadata is returned;
+    with max_bytes or preview a bounded head/tail of the text is returned. Without
+    either, the full content is returned inline as before.
+    """
     params = params or {}
     project_id = params.get("project_id") or config.get("project_id")
     path = params.get("path")
+    local_path = params.get("local_path")
+    preview = params.get("preview")
+    max_bytes = params.get("max_bytes")
     if not project_id:
         return {"success": False, "message": "project_id is required"}
     if not path:
         return {"success": False, "message": "path is required"}
+    if preview and preview not in PREVIEW_MODES:
+        return {"success": False, "message": f"preview must be one of: {', '.join(PREVIEW_MODES)}"}
+    try:
+        chunk_size = int(params.get("chunk_size") or DEFAULT_CHUNK_SIZE)
+        max_bytes = int(max_bytes) if max_bytes not in (None, "") else None
+    except (TypeError, ValueError):
+        return {"success": False, "message": "chunk_size and max_bytes must be integers"}
     try:
         client = setup_client(config["host"], config["api_key"])
+        if local_path:
+            data = stream_project_file(client, project_id, path, local_path, max(1, chunk_size))
+            return {"success": True, "message": f"Downloaded '{path}' to {data['local_path']} ({data['bytes']} bytes)", "data": data}
+        if preview or max_bytes is not None:
+            limit = DEFAULT_PREVIEW_BYTES if max_bytes is None else max(0, max_bytes)
+            data = preview_project_file(client, project_id, path, limit, preview or "head", max(1, chunk_size))
+            return {"success": True, "message": f"Previewed {data['bytes_returned']} bytes of '{path}'", "data": data}
         result = client.download_project_file(project_id, path)
         content = result if isinstance(result, str) else str(result)
         return {"success": True, "message": f"Successfully downloaded '{path}'", "data": {"content": content, "path": path}}
@@ -0,0 +1,89 @@
+"""Shape-preserving downsampling and summary statistics for metric time series."""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+METHODS = ("lttb", "minmax")
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: pick max_points indices that keep the visual shape.
+
+    The first and last points are always kept. Each interior bucket contributes the point
+    forming the largest triangle with the previously chosen point and the mean of the next
+    bucket; the per-bucket area computation is vectorized.
+    """
+    n = len(y)
+    if max_points >= n:
+        return np.arange(n)
+    if max_points < 3:
+        return np.array([0, n - 1])
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    selected = np.empty(max_points, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for b in range(max_points - 2):
+        start, end = edges[b], max(edges[b + 1], edges[b] + 1)
+        if b + 2 < len(edges):
+            next_start, next_end = edges[b + 1], max(edges[b + 2], edges[b + 1] + 1)
+            avg_x, avg_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        bx, by = x[start:end], y[start:end]
+        areas = np.abs((x[previous] - avg_x) * (by - y[previous]) - (x[previous] - bx) * (avg_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        selected[b + 1] = previous
+    return selected
+
+
+def minmax_indices(y: np.ndarray, max_points: int) -> np.ndarray:
+    """Keep the endpoints plus the minimum and maximum of (max_points - 2) // 2 equal-width buckets.
+
+    At most max_points indices are returned.
+    """
+    n = len(y)
+    if max_points >= n:
+        return np.arange(n)
+    if max_points < 4:
+        return np.array([0, n - 1])[:max(1, max_points)]
+    buckets = (max_points - 2) // 2
+    bucket = np.arange(n) * buckets // n
+    order = np.lexsort((y, bucket))
+    bounds = np.searchsorted(bucket[order], np.arange(buckets))
+    lows = order[bounds]
+    highs = order[np.append(bounds[1:], n) - 1]
+    return np.unique(np.concatenate(([0, n - 1], lows, highs)))
+
+
+def series_summary(x: np.ndarray, y: np.ndarray) -> Dict[str, Any]:
+    """Count, min, max, last and least-squares slope (value change per step)."""
+    if len(y) == 0:
+        return {"count": 0}
+    slope: Optional[float] = None
+    if len(y) > 1 and np.ptp(x) > 0:
+        slope = round(float(np.polyfit(x, y, 1)[0]), 9)
+    return {
+        "count": int(len(y)),
+        "min": float(y.min()),
+        "max": float(y.max()),
+        "last": float(y[-1]),
+        "slope": slope,
+    }
+
+
+def downsample_points(points: List[Dict[str, Any]], max_points: int, method: str = "lttb"):
+    """Downsample ordered metric points; returns (kept_points, summary).
+
+    Points use their step as the x axis when every point has one, else their position.
+    """
+    y = np.fromiter((p["value"] for p in points), dtype=float, count=len(points))
+    if points and all(p["step"] is not None for p in points):
+        x = np.fromiter((p["step"] for p in points), dtype=float, count=len(points))
+    else:
+        x = np.arange(len(points), dtype=float)
+    if method == "minmax":
+        keep = minmax_indices(y, max_points)
+    else:
+        keep = lttb_indices(x, y, max_points)
+    return [points[i] for i in keep], series_summary(x, y)
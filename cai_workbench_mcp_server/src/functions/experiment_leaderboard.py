@@ -0,0 +1,181 @@
+"""Rank and compare experiment runs in Cloudera AI."""
+
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+try:
+    from cmlapi.rest import ApiException
+except ImportError:
+    class ApiException(Exception):
+        """Placeholder when cmlapi is not installed."""
+        status = None
+        body = None
+
+from .http_helpers import collect_pages, run_key_values, setup_client
+from .parallel import split_ids
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _columns(rows: List[Dict[str, Any]], keys: List[str]) -> np.ndarray:
+    """Stack per-run key/value dicts into an (n_runs, n_keys) float array with NaN gaps."""
+    return np.array([[_as_float(row.get(k)) for k in keys] for row in rows], dtype=float).reshape(len(rows), len(keys))
+
+
+def _json_number(value: Any) -> Optional[float]:
+    value = float(value)
+    return None if math.isnan(value) else round(value, 6)
+
+
+def _correlations(params: np.ndarray, metrics: np.ndarray, param_keys: List[str],
+                  metric_keys: List[str]) -> List[Dict[str, Any]]:
+    """Pearson correlation for every numeric (param, metric) pair over runs where both exist."""
+    out = []
+    for j, param in enumerate(param_keys):
+        x_all = params[:, j]
+        for k, metric in enumerate(metric_keys):
+            y_all = metrics[:, k]
+            mask = ~(np.isnan(x_all) | np.isnan(y_all))
+            if mask.sum() < 3:
+                continue
+            x = x_all[mask] - x_all[mask].mean()
+            y = y_all[mask] - y_all[mask].mean()
+            denom = math.sqrt(float(x @ x) * float(y @ y))
+            if denom == 0:
+                continue
+            out.append({"param": param, "metric": metric, "r": round(float(x @ y) / denom, 4),
+                        "n": int(mask.sum())})
+    out.sort(key=lambda c: -abs(c["r"]))
+    return out
+
+
+def build_leaderboard(runs: List[Dict[str, Any]], rank_by: Optional[str] = None,
+                      minimize: Optional[List[str]] = None, metric_keys: Optional[List[str]] = None,
+                      top_n: int = 20) -> Dict[str, Any]:
+    """Compute ranking, best-per-metric, summary stats and param/metric correlations.
+
+    rank_by is None in the result when the requested key is not among the metric
+    keys; the rows then keep the listing order.
+    """
+    minimize = set(minimize or [])
+    metric_rows = [run_key_values(r, "metrics") for r in runs]
+    param_rows = [run_key_values(r, "params") for r in runs]
+
+    if not metric_keys:
+        metric_keys = sorted({k for row in metric_rows for k in row})
+    metrics = _columns(metric_rows, metric_keys)
+    all_param_keys = sorted({k for row in param_rows for k in row})
+    params_all = _columns(param_rows, all_param_keys)
+    numeric = ~np.all(np.isnan(params_all), axis=0)
+    param_keys = [k for k, keep in zip(all_param_keys, numeric, strict=True) if keep]
+    params = params_all[:, numeric]
+
+    # Flip minimized metrics so "larger is better" holds for every column.
+    sign = np.array([-1.0 if k in minimize else 1.0 for k in metric_keys])
+    scored = metrics * sign
+    filled = np.where(np.isnan(scored), -np.inf, scored)
+
+    rank_by = rank_by or (metric_keys[0] if metric_keys else None)
+    if rank_by in metric_keys:
+        column = filled[:, metric_keys.index(rank_by)]
+        order = np.argsort(-column, kind="stable")
+    else:
+        rank_by = None
+        order = np.arange(len(runs))
+
+    best = {}
+    summary = {}
+    for k, key in enumerate(metric_keys):
+        values = metrics[:, k]
+        present = ~np.isnan(values)
+        if not present.any():
+            summary[key] = {"count": 0}
+            continue
+        idx = int(np.argmax(filled[:, k]))
+        best[key] = {"run_id": runs[idx].get("id"), "run_name": runs[idx].get("name"),
+                     "value": _json_number(values[idx]), "direction": "min" if key in minimize else "max"}
+        v = values[present]
+        summary[key] = {
+            "count": int(v.size),
+            "mean": _json_number(v.mean()),
+            "std": _json_number(v.std()),
+            "min": _json_number(v.min()),
+            "median": _json_number(np.median(v)),
+            "max": _json_number(v.max()),
+        }
+
+    rows = []
+    for position, idx in enumerate(order[: max(0, int(top_n))], start=1):
+        run = runs[idx]
+        rows.append([position, run.get("id"), run.get("name")] + [_json_number(v) for v in metrics[idx]])
+
+    return {
+        "run_count": len(runs),
+        "rank_by": rank_by,
+        "columns": ["rank", "run_id", "run_name"] + metric_keys,
+        "rows": rows,
+        "best": best,
+        "summary": summary,
+        "correlations": _correlations(params, metrics, param_keys, metric_keys),
+    }
+
+
+def experiment_leaderboard(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a compact leaderboard for the runs of an experiment.
+
+    Args:
+        config: MCP configuration
+        params: Function parameters
+            - experiment_id: Experiment to rank
+            - rank_by: Metric key used for ranking (default: first metric key)
+            - minimize: Comma-separated metric keys where lower is better (e.g. loss)
+            - metric_keys: Comma-separated metric keys to include (default: all)
+            - top_n: Number of ranked rows to return (default 20)
+            - search_filter: Optional list_experiment_runs search filter
+
+    Returns:
+        Dict with a ranked table, best run per metric, summary stats and correlations
+    """
+    params = params or {}
+    project_id = params.get("project_id") or config.get("project_id")
+    experiment_id = params.get("experiment_id")
+    if not project_id:
+        return {"success": False, "message": "project_id is required"}
+    if not experiment_id:
+        return {"success": False, "message": "experiment_id is required"}
+
+    kwargs = {"page_size": 100}
+    if params.get("search_filter"):
+        kwargs["search_filter"] = params["search_filter"]
+
+    try:
+        client = setup_client(config["host"], config["api_key"])
+        runs = collect_pages(client.list_experiment_runs, "experiment_runs", project_id, experiment_id, **kwargs)
+        board = build_leaderboard(
+            runs,
+            rank_by=params.get("rank_by"),
+            minimize=split_ids(params.get("minimize")),
+            metric_keys=split_ids(params.get("metric_keys")),
+            top_n=params.get("top_n") or 20,
+        )
+        if params.get("rank_by") and board["rank_by"] is None:
+            available = ", ".join(board["columns"][3:]) or "none"
+            return {"success": False,
+                    "message": f"rank_by metric '{params['rank_by']}' not found in {board['run_count']} runs "
+                               f"(available metrics: {available})"}
+        if board["rank_by"] is None:
+            message = f"Listed {board['run_count']} runs (no metrics to rank by)"
+        else:
+            message = f"Ranked {board['run_count']} runs by {board['rank_by']}"
+        return {"success": True, "message": message, "data": board}
+    except ApiException as e:
+        return {"success": False, "message": f"API error: {e.status} - {e.body}"}
+    except Exception as e:
+        return {"success": False, "message": f"Error building leaderboard: {str(e)}"}
@@ -1,6 +1,6 @@
 """Get experiment run metrics in Cloudera AI."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 try:
     from cmlapi.rest import ApiException
@@ -10,16 +10,40 @@ except ImportError:
         status = None
         body = None
 
+from .downsample import METHODS, downsample_points
 from .http_helpers import setup_client, serialize_result
 
 
+def metric_points(data: Any) -> List[Dict[str, Any]]:
+    """Return the numeric points of a metrics response ordered by step, then timestamp."""
+    points = []
+    for point in (data or {}).get("metrics") or []:
+        try:
+            value = float(point.get("value"))
+        except (TypeError, ValueError):
+            continue
+        try:
+            step = int(point.get("step"))
+        except (TypeError, ValueError):
+            step = None
+        points.append({"step": step, "timestamp": point.get("timestamp"), "value": value})
+    points.sort(key=lambda p: (p["step"] if p["step"] is not None else 0, str(p["timestamp"] or "")))
+    return points
+
+
 def get_experiment_run_metrics(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
-    """Get metrics for an experiment run."""
+    """Get metrics for an experiment run.
+
+    When max_points is set and the series is longer, the points are reduced server-side
+    (method "lttb" or "minmax") and a summary with min, max, last and slope is added.
+    """
     params = params or {}
     project_id = params.get("project_id") or config.get("project_id")
     experiment_id = params.get("experiment_id")
     run_id = params.get("run_id")
     metric_key = params.get("metric_key")
+    max_points = params.get("max_points")
+    method = params.get("downsample") or "lttb"
 
     if not project_id:
         return {"success": False, "message": "project_id is required"}
@@ -29,14 +53,33 @@ def get_experiment_run_metrics(config: Dict[str, str], params: Dict[str, Any]) -
         return {"success": False, "message": "run_id is required"}
     if not metric_key:
         return {"success": False, "message": "metric_key is required"}
+    if method not in METHODS:
+        return {"success": False, "message": f"downsample must be one of: {', '.join(METHODS)}"}
+    try:
+        max_points = int(max_points) if max_points not in (None, "") else None
+    except (TypeError, ValueError):
+        return {"success": False, "message": "max_points must be an integer"}
+    if max_points is not None and max_points < 2:
+        return {"success": False, "message": "max_points must be at least 2"}
 
     try:
         client = setup_client(config["host"], config["api_key"])
         result = client.get_experiment_run_metrics(project_id, experiment_id, run_id, metric_key)
+        data = serialize_result(result)
+        if max_points is not None and isinstance(data, dict):
+            points = metric_points(data)
+            kept, summary = downsample_points(points, max_points, method)
+            data["metrics"] = [{"key": metric_key, **point} for point in kept]
+            data["summary"] = summary
+            data["downsampling"] = {
+                "method": method,
+                "original_points": len(points),
+                "returned_points": len(kept),
+            }
         return {
             "success": True,
             "message": "Successfully retrieved experiment run metrics",
-            "data": serialize_result(result),
+            "data": data,
         }
     except ApiException as e:
         return {"success": False, "message": f"API error: {e.status} - {e.body}"}
@@ -9,7 +9,7 @@ except ImportError:
         """Placeholder when cmlapi is not installed."""
         status = None
         body = None
-from .http_helpers import setup_client, serialize_result
+from .http_helpers import collect_pages, setup_client
 
 def get_project_id(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """Get project ID from a project name."""
@@ -20,19 +20,7 @@ def get_project_id(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str,
 
     try:
         client = setup_client(config["host"], config["api_key"])
-        all_projects = []
-        page_token = None
-        while True:
-            kwargs = {"page_size": 100}
-            if page_token:
-                kwargs["page_token"] = page_token
-            result = client.list_projects(**kwargs)
-            data = result.to_dict() if hasattr(result, "to_dict") else result
-            projects = data.get("projects", [])
-            all_projects.extend(projects)
-            page_token = data.get("next_page_token")
-            if not page_token:
-                break
+        all_projects = collect_pages(client.list_projects, "projects", page_size=100)
 
         if project_name == "*":
             formatted = [{"name": p.get("name"), "id": p.get("id"), "owner": p.get("owner")} for p in all_projects]
@@ -5,10 +5,14 @@ from __future__ import annotations
 import json
 import os
 import ssl
-from typing import Any, Dict, Union
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import requests
 
+from . import ratelimit, retry, timing, tracing
+from .metrics import count_retry, instrument_client, observe_upstream
+
 _DEBIAN_CA_BUNDLE = "/etc/ssl/certs/ca-certificates.crt"
 
 
@@ -42,35 +46,106 @@ def requests_verify() -> Union[str, bool]:
     return system_ca_bundle() or True
 
 
-def setup_client(host: str, api_key: str):
+def put_project_file(url: str, headers: Dict[str, str], target_path: str, file_obj: Any, size: int,
+                     timeout: Optional[float] = None) -> requests.Response:
+    """PUT one file to a project's files endpoint, rate limited and retried per the upload policies.
+
+    The file object is rewound before each attempt. Returns the last response.
+    """
+    def attempt():
+        file_obj.seek(0)
+        with ratelimit.limited(url, "upload") as slot, observe_upstream("upload_project_files") as call:
+            response = requests.put(url, headers=headers, files={target_path: file_obj}, timeout=timeout,
+                                    verify=requests_verify())
+            call.status = slot.status = response.status_code
+            call.bytes = size
+            slot.retry_after = retry.error_status(response)[1]
+        return response
+
+    return retry.POLICIES["upload"].call(attempt, on_retry=count_retry("upload_project_files"))
+
+
+def setup_client(host: str, api_key: str, retries: bool = True):
     """Create a configured cmlapi client.
 
     Args:
         host: CAI Workbench host URL (raw — will be normalized).
         api_key: Bearer token for authentication.
+        retries: Apply the shared retry policy; pass False when the caller retries itself.
 
     Returns:
-        Ready-to-use CMLServiceApi instance.
+        Ready-to-use CMLServiceApi instance, wrapped so each call is timed in metrics,
+        rate limited per host (see ratelimit.py) and retried per the shared retry policy
+        (see retry.py).
     """
-    import cmlapi
+    with timing.phase("client_setup"):
+        import cmlapi
 
-    config = cmlapi.Configuration()
-    config.host = normalize_host(host)
-    ca_bundle = system_ca_bundle()
-    if ca_bundle:
-        config.ssl_ca_cert = ca_bundle
-    api_client = cmlapi.ApiClient(config)
-    api_client.set_default_header("authorization", f"Bearer {api_key}")
-    return cmlapi.CMLServiceApi(api_client)
+        config = cmlapi.Configuration()
+        config.host = normalize_host(host)
+        ca_bundle = system_ca_bundle()
+        if ca_bundle:
+            config.ssl_ca_cert = ca_bundle
+        api_client = cmlapi.ApiClient(config)
+        api_client.set_default_header("authorization", f"Bearer {api_key}")
+        return instrument_client(cmlapi.CMLServiceApi(api_client), retries=retries, host=config.host)
 
 
 def serialize_result(result) -> Any:
     """Convert a cmlapi response object to a JSON-safe dict."""
     if result is None:
         return None
-    raw = result.to_dict() if hasattr(result, "to_dict") else result
-    # Round-trip through JSON to handle datetime and other non-serializable types
-    return json.loads(json.dumps(raw, default=str))
+    with tracing.span("serialize_result") as span, timing.phase("serialization"):
+        raw = result.to_dict() if hasattr(result, "to_dict") else result
+        # Round-trip through JSON to handle datetime and other non-serializable types
+        text = json.dumps(raw, default=str)
+        tracing.set_attributes(span, **{"serialize.bytes": len(text)})
+        timing.note_payload(len(text))
+        return json.loads(text)
+
+
+def collect_pages(call: Callable[..., Any], items_key: str, *args, **kwargs) -> List[Dict[str, Any]]:
+    """Follow next_page_token across a cmlapi list call and merge the items_key lists."""
+    items: List[Dict[str, Any]] = []
+    page_token = None
+    page_number = 0
+    while True:
+        if page_token:
+            kwargs["page_token"] = page_token
+        page_number += 1
+        with tracing.page(page_number):
+            data = serialize_result(call(*args, **kwargs)) or {}
+        items.extend(data.get(items_key) or [])
+        page_token = data.get("next_page_token")
+        if not page_token:
+            break
+    return items
+
+
+def epoch_seconds(value: Any) -> Optional[float]:
+    """Parse an API timestamp given as epoch milliseconds/seconds or an ISO-8601 string."""
+    if value in (None, ""):
+        return None
+    if isinstance(value, (int, float)) or str(value).isdigit():
+        number = float(value)
+        return number / 1000 if number > 1e11 else number
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def run_key_values(run: Dict[str, Any], field: str) -> Dict[str, Any]:
+    """Return a run's metrics/params/tags as a {key: value} dict."""
+    entries = (run.get("data") or {}).get(field)
+    if entries is None:
+        entries = run.get(field)
+    if isinstance(entries, dict):
+        return entries
+    return {e.get("key"): e.get("value") for e in entries or [] if isinstance(e, dict) and e.get("key")}
 
 
 def auth_headers(api_key: str) -> Dict[str, str]:
@@ -0,0 +1,105 @@
+"""List jobs, applications or model deployments across all projects in Cloudera AI."""
+
+from typing import Any, Dict, List
+
+try:
+    from cmlapi.rest import ApiException
+except ImportError:
+    class ApiException(Exception):
+        """Placeholder when cmlapi is not installed."""
+        status = None
+        body = None
+
+from .http_helpers import collect_pages, setup_client
+from .parallel import error_message, map_bounded, split_ids
+
+RESOURCES = ("jobs", "applications", "model_deployments")
+
+
+def _list_project_resource(client, resource: str, project_id: str) -> List[Dict[str, Any]]:
+    if resource == "jobs":
+        return collect_pages(client.list_jobs, "jobs", project_id, page_size=100)
+    if resource == "applications":
+        return collect_pages(client.list_applications, "applications", project_id, page_size=100)
+    deployments = []
+    for model in collect_pages(client.list_models, "models", project_id, page_size=100):
+        for deployment in collect_pages(
+            client.list_model_deployments, "model_deployments", project_id, model["id"], page_size=100
+        ):
+            deployment.setdefault("model_name", model.get("name"))
+            deployments.append(deployment)
+    return deployments
+
+
+def _item_status(item: Dict[str, Any]) -> str:
+    status = item.get("status")
+    if not status and isinstance(item.get("latest"), dict):
+        status = item["latest"].get("status")
+    return str(status or "")
+
+
+def list_across_projects(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """List one resource type across every visible project with concurrent per-project calls.
+
+    Args:
+        config: MCP configuration
+        params: Function parameters
+            - resource: "jobs", "applications" or "model_deployments"
+            - status: Comma-separated status filters, matched case-insensitively as
+              substrings (e.g. "running" matches APPLICATION_RUNNING)
+            - project_name: Only scan projects whose name contains this text
+            - max_workers: Maximum concurrent per-project list calls (default 8)
+
+    Returns:
+        Dict with merged items (each tagged with project_id and project_name)
+    """
+    params = params or {}
+    resource = params.get("resource")
+    if resource not in RESOURCES:
+        return {"success": False, "message": f"resource must be one of: {', '.join(RESOURCES)}"}
+    statuses = [s.lower() for s in split_ids(params.get("status"))]
+    name_filter = (params.get("project_name") or "").lower()
+
+    try:
+        client = setup_client(config["host"], config["api_key"])
+        projects = collect_pages(client.list_projects, "projects", page_size=100)
+        if name_filter:
+            projects = [p for p in projects if name_filter in (p.get("name") or "").lower()]
+
+        results = map_bounded(
+            lambda project: _list_project_resource(client, resource, project["id"]),
+            projects,
+            params.get("max_workers"),
+        )
+
+        items = []
+        failed = []
+        for project, (project_items, error) in zip(projects, results, strict=True):
+            if error is not None:
+                failed.append({
+                    "project_id": project.get("id"),
+                    "project_name": project.get("name"),
+                    "error": error_message(error),
+                })
+                continue
+            for item in project_items:
+                if statuses and not any(s in _item_status(item).lower() for s in statuses):
+                    continue
+                item["project_id"] = project.get("id")
+                item["project_name"] = project.get("name")
+                items.append(item)
+
+        return {
+            "success": True,
+            "message": f"Found {len(items)} {resource} across {len(projects)} projects",
+            "data": {
+                resource: items,
+                "count": len(items),
+                "projects_scanned": len(projects),
+                "failed_projects": failed,
+            },
+        }
+    except ApiException as e:
+        return {"success": False, "message": f"API error: {e.status} - {e.body}"}
+    except Exception as e:
+        return {"success": False, "message": f"Error: {str(e)}"}
@@ -8,6 +8,7 @@ except ImportError:
         """Placeholder when cmlapi is not installed."""
         status = None
         body = None
+from . import tracing
 from .http_helpers import setup_client, serialize_result
 
 
@@ -34,13 +35,16 @@ def _collect_team_names(client, method_name: str, extract: Callable[[Dict[str, A
     call = getattr(client, method_name)
     names: List[str] = []
     page_token = None
+    page_number = 0
     while True:
         kwargs = {}
         for key in ("search_filter", "page_size", "page_token", "sort"):
             value = params.get(key) if key != "page_token" else page_token
             if value:
                 kwargs[key] = value
-        data = serialize_result(call(**kwargs))
+        page_number += 1
+        with tracing.page(page_number):
+            data = serialize_result(call(**kwargs))
         names.extend(extract(data))
         page_token = data.get("next_page_token") or ""
         if not page_token:
@@ -0,0 +1,267 @@
+"""Buffered, chunked experiment run logging for Cloudera AI."""
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from cmlapi.rest import ApiException
+except ImportError:
+    class ApiException(Exception):
+        """Placeholder when cmlapi is not installed."""
+        status = None
+        body = None
+
+from .http_helpers import setup_client
+from .parallel import error_message
+from .metrics import count_retry
+from .retry import RetryPolicy, policy_for
+
+# Per-request limits enforced by the experiment tracking backend (MLflow log-batch).
+MAX_METRICS_PER_REQUEST = 1000
+MAX_PARAMS_PER_REQUEST = 100
+MAX_TAGS_PER_REQUEST = 100
+MAX_ENTRIES_PER_REQUEST = 1000
+
+
+def _key_values(entries: Any) -> List[Dict[str, Any]]:
+    if isinstance(entries, dict):
+        return [{"key": str(k), "value": v} for k, v in entries.items()]
+    return [dict(e) for e in entries or []]
+
+
+class ExperimentRunBatchLogger:
+    """Accumulate metric/param/tag updates per run and send them in server-sized chunks.
+
+    Updates are flushed automatically once flush_entries entries are pending or
+    flush_interval seconds have passed since the last flush, and on close(). There is
+    no background timer: the interval is only checked on the next log call, so call
+    flush() yourself when updates may stop arriving. Each request stays within the
+    backend's per-request limits, and failed chunks are retried with exponential
+    backoff before being reported in stats["failed"].
+
+    Usage:
+        with ExperimentRunBatchLogger(client, project_id, experiment_id) as logger:
+            for step in range(epochs):
+                logger.log_metrics(run_id, {"loss": loss, "acc": acc}, step=step)
+    """
+
+    def __init__(self, client: Any, project_id: str, experiment_id: str,
+                 max_entries: int = MAX_ENTRIES_PER_REQUEST, flush_entries: int = MAX_ENTRIES_PER_REQUEST,
+                 flush_interval: Optional[float] = 10.0, max_retries: int = 3, backoff: float = 0.5,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.client = client
+        self.project_id = project_id
+        self.experiment_id = experiment_id
+        self.max_entries = max(1, min(int(max_entries), MAX_ENTRIES_PER_REQUEST))
+        self.flush_entries = max(1, int(flush_entries))
+        self.flush_interval = flush_interval
+        self.max_retries = max(0, int(max_retries))
+        self.backoff = backoff
+        self._clock = clock
+        self._sleep = sleep
+        # The only retry layer for these requests: pass a client built with retries=False
+        _, self._idempotent = policy_for("log_experiment_run_batch")
+        self._count_upstream_retry = count_retry("log_experiment_run_batch")
+        self._retry = RetryPolicy(max_attempts=self.max_retries + 1, base_delay=backoff, max_elapsed=None,
+                                  jitter=False, sleep=sleep, clock=clock)
+        self._lock = threading.Lock()
+        # Guards stats: flushes triggered from several threads may run concurrently
+        self._stats_lock = threading.Lock()
+        self._buffer: Dict[str, Dict[str, Any]] = {}
+        self._pending = 0
+        self._last_flush = clock()
+        self.stats: Dict[str, Any] = {"requests": 0, "entries_logged": 0, "retries": 0, "failed": []}
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _run(self, run_id: str) -> Dict[str, Any]:
+        return self._buffer.setdefault(run_id, {"metrics": [], "params": {}, "tags": {}})
+
+    def log_metric(self, run_id: str, key: str, value: float, step: Optional[int] = None,
+                   timestamp: Optional[int] = None) -> None:
+        self.log_metrics(run_id, {key: value}, step=step, timestamp=timestamp)
+
+    def log_metrics(self, run_id: str, metrics: Any, step: Optional[int] = None,
+                    timestamp: Optional[int] = None) -> None:
+        """Queue metrics given as {key: value} or a list of {key, value, step, timestamp}."""
+        now_ms = int(time.time() * 1000)
+        entries = []
+        for metric in _key_values(metrics):
+            entries.append({
+                "key": metric["key"],
+                "value": float(metric["value"]),
+                "step": int(metric.get("step", step) or 0),
+                "timestamp": int(metric.get("timestamp", timestamp) or now_ms),
+            })
+        with self._lock:
+            self._run(run_id)["metrics"].extend(entries)
+            self._pending += len(entries)
+        self._maybe_flush()
+
+    def log_params(self, run_id: str, params: Any) -> None:
+        self._set(run_id, "params", params)
+
+    def log_param(self, run_id: str, key: str, value: Any) -> None:
+        self._set(run_id, "params", {key: value})
+
+    def set_tags(self, run_id: str, tags: Any) -> None:
+        self._set(run_id, "tags", tags)
+
+    def set_tag(self, run_id: str, key: str, value: Any) -> None:
+        self._set(run_id, "tags", {key: value})
+
+    def _set(self, run_id: str, field: str, values: Any) -> None:
+        # Params and tags are keyed: a repeated key replaces the queued value.
+        with self._lock:
+            target = self._run(run_id)[field]
+            for entry in _key_values(values):
+                if entry["key"] not in target:
+                    self._pending += 1
+                target[entry["key"]] = str(entry["value"])
+        self._maybe_flush()
+
+    def add_update(self, update: Dict[str, Any]) -> None:
+        """Queue one {run_id|id, metrics, params|parameters, tags, step, timestamp} update."""
+        run_id = update.get("run_id") or update.get("id")
+        if not run_id:
+            raise ValueError("each update needs a run_id")
+        if update.get("metrics"):
+            self.log_metrics(run_id, update["metrics"], step=update.get("step"),
+                             timestamp=update.get("timestamp"))
+        if update.get("params") or update.get("parameters"):
+            self.log_params(run_id, update.get("params") or update.get("parameters"))
+        if update.get("tags"):
+            self.set_tags(run_id, update["tags"])
+
+    def _maybe_flush(self) -> None:
+        due = self.flush_interval is not None and self._clock() - self._last_flush >= self.flush_interval
+        if self._pending >= self.flush_entries or (due and self._pending):
+            self.flush()
+
+    def _chunks(self, run_id: str, run: Dict[str, Any]):
+        """Split one run's buffer into request bodies within the per-request limits."""
+        params = [{"key": k, "value": v} for k, v in run["params"].items()]
+        tags = [{"key": k, "value": v} for k, v in run["tags"].items()]
+        metrics = list(run["metrics"])
+        while params or tags or metrics:
+            room = self.max_entries
+            body = {"run_id": run_id}
+            for field, entries, limit in (("params", params, MAX_PARAMS_PER_REQUEST),
+                                          ("tags", tags, MAX_TAGS_PER_REQUEST),
+                                          ("metrics", metrics, MAX_METRICS_PER_REQUEST)):
+                take = min(room, limit)
+                body[field] = entries[:take]
+                del entries[:take]
+                room -= len(body[field])
+            yield body
+
+    def _count_retry(self, status: Optional[int]) -> None:
+        with self._stats_lock:
+            self.stats["retries"] += 1
+        self._count_upstream_retry(status)
+
+    def _send(self, body: Dict[str, Any]) -> Optional[BaseException]:
+        try:
+            self._retry.call(
+                lambda: self.client.log_experiment_run_batch(body, self.project_id, self.experiment_id),
+                idempotent=self._idempotent,
+                on_retry=self._count_retry,
+            )
+            return None
+        except Exception as e:
+            return e
+
+    def flush(self) -> Dict[str, Any]:
+        """Send everything buffered so far; returns the cumulative stats."""
+        with self._lock:
+            buffer, self._buffer = self._buffer, {}
+            self._pending = 0
+            self._last_flush = self._clock()
+        for run_id, run in buffer.items():
+            for body in self._chunks(run_id, run):
+                entries = len(body["metrics"]) + len(body["params"]) + len(body["tags"])
+                error = self._send(body)
+                with self._stats_lock:
+                    self.stats["requests"] += 1
+                    if error is None:
+                        self.stats["entries_logged"] += entries
+                    else:
+                        self.stats["failed"].append({"run_id": run_id, "entries": entries,
+                                                     "error": error_message(error)})
+        return self.stats
+
+    def close(self) -> Dict[str, Any]:
+        return self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def log_experiment_runs_buffered(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Log many (possibly per-step) run updates with merging, chunking and retries.
+
+    Args:
+        config: MCP configuration
+        params: Function parameters
+            - experiment_id: Experiment containing the runs
+            - updates: List (or JSON string) of {run_id, metrics, params, tags, step, timestamp}
+            - max_batch_entries: Maximum entries per request (default and cap 1000)
+            - max_retries: Retries per failed chunk (default 3)
+
+    Returns:
+        Dict with request/entry counts and any chunks that still failed after retries
+    """
+    params = params or {}
+    project_id = params.get("project_id") or config.get("project_id")
+    experiment_id = params.get("experiment_id")
+    updates = params.get("updates")
+
+    if not project_id:
+        return {"success": False, "message": "project_id is required"}
+    if not experiment_id:
+        return {"success": False, "message": "experiment_id is required"}
+    if not updates:
+        return {"success": False, "message": "updates is required"}
+
+    try:
+        updates = json.loads(updates) if isinstance(updates, str) else updates
+    except json.JSONDecodeError:
+        return {"success": False, "message": "updates must be valid JSON"}
+    if isinstance(updates, dict):
+        updates = [updates]
+    if not isinstance(updates, list) or any(not isinstance(u, dict) for u in updates):
+        return {"success": False, "message": "updates must be an object or a list of objects"}
+    if any(not (u.get("run_id") or u.get("id")) for u in updates):
+        return {"success": False, "message": "each update needs a run_id"}
+
+    try:
+        client = setup_client(config["host"], config["api_key"], retries=False)
+        logger = ExperimentRunBatchLogger(
+            client, project_id, experiment_id,
+            max_entries=params.get("max_batch_entries") or MAX_ENTRIES_PER_REQUEST,
+            flush_entries=MAX_ENTRIES_PER_REQUEST * 10,
+            flush_interval=None,
+            max_retries=params.get("max_retries") if params.get("max_retries") is not None else 3,
+        )
+        for update in updates:
+            logger.add_update(update)
+        stats = logger.close()
+        return {
+            "success": not stats["failed"],
+            "message": f"Logged {stats['entries_logged']} entries in {stats['requests']} requests, "
+                       f"{len(stats['failed'])} chunks failed",
+            "data": stats,
+        }
+    except ValueError as e:
+        return {"success": False, "message": str(e)}
+    except ApiException as e:
+        return {"success": False, "message": f"API error: {e.status} - {e.body}"}
+    except Exception as e:
+        return {"success": False, "message": f"Error logging batch: {str(e)}"}
@@ -0,0 +1,309 @@
+"""In-process Prometheus-style metrics for tool calls, upstream API requests and caches."""
+
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from . import ratelimit, retry, timing, tracing
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"] + self._samples()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, k)} {_number(v)}" for k, v in items]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels: str, value: float) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def count(self, *labels: str) -> int:
+        state = self._values.get(labels)
+        return sum(state[0]) if state else 0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, (list(v[0]), v[1])) for k, v in self._values.items())
+        lines = []
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts, strict=True):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                bucket_labels = _labels(self.labelnames, labels, 'le="' + le + '"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        _refresh_cache_ratios()
+        _refresh_rate_limits()
+        lines: List[str] = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        for metric in self.metrics:
+            metric.clear()
+
+
+REGISTRY = Registry()
+TOOL_CALLS = REGISTRY.register(Counter("cai_mcp_tool_calls_total", "Tool invocations.", ["tool"]))
+TOOL_ERRORS = REGISTRY.register(Counter(
+    "cai_mcp_tool_errors_total", "Tool invocations that raised or returned success=false.", ["tool"]))
+TOOL_LATENCY = REGISTRY.register(Histogram("cai_mcp_tool_duration_seconds", "Tool call latency.", ["tool"]))
+TOOLS_IN_FLIGHT = REGISTRY.register(Gauge("cai_mcp_tool_calls_in_flight", "Tool calls currently executing."))
+UPSTREAM_LATENCY = REGISTRY.register(Histogram(
+    "cai_mcp_upstream_request_duration_seconds", "Workbench API call latency by cmlapi method.", ["method"]))
+UPSTREAM_ERRORS = REGISTRY.register(Counter(
+    "cai_mcp_upstream_errors_total", "Failed workbench API calls by cmlapi method and HTTP status.",
+    ["method", "status"]))
+UPSTREAM_RETRIES = REGISTRY.register(Counter(
+    "cai_mcp_upstream_retries_total", "Workbench API calls retried, by method and the status that triggered it.",
+    ["method", "status"]))
+UPSTREAM_IN_FLIGHT = REGISTRY.register(Gauge(
+    "cai_mcp_upstream_requests_in_flight", "Workbench API calls currently outstanding."))
+RATE_LIMIT = REGISTRY.register(Gauge(
+    "cai_mcp_rate_limit_requests_per_second", "Current client-side request rate limit per host and bucket.",
+    ["host", "bucket"]))
+RATE_LIMIT_THROTTLES = REGISTRY.register(Gauge(
+    "cai_mcp_rate_limit_throttled_total", "429 responses fed back into each rate limit bucket.", ["host", "bucket"]))
+RATE_LIMIT_WAIT = REGISTRY.register(Gauge(
+    "cai_mcp_rate_limit_wait_seconds_total", "Time requests spent waiting for a rate limit token.",
+    ["host", "bucket"]))
+CACHE_LOOKUPS = REGISTRY.register(Counter(
+    "cai_mcp_cache_lookups_total", "Local cache lookups by cache and result (hit/miss).", ["cache", "result"]))
+CACHE_HIT_RATIO = REGISTRY.register(Gauge(
+    "cai_mcp_cache_hit_ratio", "Hits over lookups since start, per cache.", ["cache"]))
+
+
+def _refresh_cache_ratios() -> None:
+    caches = {cache for cache, _ in list(CACHE_LOOKUPS._values)}
+    for cache in caches:
+        hits, misses = CACHE_LOOKUPS.value(cache, "hit"), CACHE_LOOKUPS.value(cache, "miss")
+        CACHE_HIT_RATIO.set(cache, value=hits / (hits + misses) if hits + misses else 0.0)
+
+
+def _refresh_rate_limits() -> None:
+    for (host, bucket), state in ratelimit.snapshot().items():
+        RATE_LIMIT.set(host, bucket, value=state["rate"])
+        RATE_LIMIT_THROTTLES.set(host, bucket, value=state["throttles"])
+        RATE_LIMIT_WAIT.set(host, bucket, value=state["waited_seconds"])
+
+
+def total_tool_calls() -> float:
+    return sum(list(TOOL_CALLS._values.values()))
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_LOOKUPS.inc(cache, "hit" if hit else "miss")
+
+
+def tool_result_failed(text: Any) -> bool:
+    """Cheap check for the {"success": false, ...} shape the tools return as JSON text."""
+    return isinstance(text, str) and '"success": false' in text[:64]
+
+
+class _ToolCall:
+    __slots__ = ("failed",)
+
+    def __init__(self):
+        self.failed = False
+
+
+@contextmanager
+def track_tool(name: str) -> Iterator[_ToolCall]:
+    """Count, time and error-track one tool call; set call.failed for soft failures.
+
+    The call is also a tracing span when tracing is enabled.
+    """
+    call = _ToolCall()
+    TOOLS_IN_FLIGHT.inc()
+    start = time.perf_counter()
+    with tracing.span(f"tool {name}", **{"mcp.tool.name": name}) as span:
+        try:
+            yield call
+        except BaseException:
+            call.failed = True
+            raise
+        finally:
+            TOOLS_IN_FLIGHT.dec()
+            TOOL_LATENCY.observe(time.perf_counter() - start, name)
+            TOOL_CALLS.inc(name)
+            if call.failed:
+                TOOL_ERRORS.inc(name)
+            tracing.set_attributes(span, **{"mcp.tool.failed": call.failed})
+
+
+class _UpstreamCall:
+    __slots__ = ("status", "bytes")
+
+    def __init__(self):
+        self.status: Optional[int] = None
+        self.bytes: Optional[int] = None
+
+
+@contextmanager
+def observe_upstream(method: str) -> Iterator[_UpstreamCall]:
+    """Time one workbench API request, as a child span of the current tool when tracing.
+
+    Exceptions are counted by their HTTP status when known; for calls that do not
+    raise on errors (plain requests), set call.status to the response status and
+    call.bytes to the payload size.
+    """
+    call = _UpstreamCall()
+    UPSTREAM_IN_FLIGHT.inc()
+    start = time.perf_counter()
+    page = tracing.current_page()
+    with tracing.span(f"cmlapi {method}", **{"cmlapi.method": method, "cmlapi.page": page}) as span:
+        try:
+            yield call
+        except Exception as e:
+            call.status = getattr(e, "status", None)
+            UPSTREAM_ERRORS.inc(method, str(call.status or "error"))
+            raise
+        else:
+            if call.status is not None and call.status >= 400:
+                UPSTREAM_ERRORS.inc(method, str(call.status))
+        finally:
+            elapsed = time.perf_counter() - start
+            UPSTREAM_IN_FLIGHT.dec()
+            UPSTREAM_LATENCY.observe(elapsed, method)
+            timing.record_upstream(method, elapsed, call.status, call.bytes, page)
+            tracing.set_attributes(span, **{"http.status_code": call.status, "cmlapi.bytes": call.bytes})
+
+
+def count_retry(method: str) -> Any:
+    """on_retry callback for RetryPolicy.call that counts retries of one method."""
+    return lambda status: UPSTREAM_RETRIES.inc(method, str(status or "error"))
+
+
+class InstrumentedClient:
+    """Proxy around a cmlapi CMLServiceApi that times every public method call.
+
+    With retries=True each call also goes through the shared retry policy for its
+    method class; every attempt is timed separately. With host set, every attempt
+    first waits for that host's shared rate limiter.
+    """
+
+    def __init__(self, client: Any, retries: bool = False, host: Optional[str] = None):
+        self._client = client
+        self._retries = retries
+        self._host = host
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        kind = retry.call_class(name)
+
+        def attempt(*args, **kwargs):
+            with ratelimit.limited(self._host, kind), observe_upstream(name):
+                return attr(*args, **kwargs)
+
+        if self._retries:
+            @functools.wraps(attr)
+            def timed(*args, **kwargs):
+                policy, idempotent = retry.policy_for(name)
+                return policy.call(lambda: attempt(*args, **kwargs), idempotent=idempotent,
+                                   on_retry=count_retry(name))
+        else:
+            timed = functools.wraps(attr)(attempt)
+
+        # Cache the wrapper so later lookups skip __getattr__
+        self.__dict__[name] = timed
+        return timed
+
+
+def instrument_client(client: Any, retries: bool = False, host: Optional[str] = None) -> Any:
+    return InstrumentedClient(client, retries=retries, host=host)
+
+
+def render(registry: Optional[Registry] = None) -> str:
+    return (registry or REGISTRY).render()
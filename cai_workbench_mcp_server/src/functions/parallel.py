@@ -0,0 +1,81 @@
+"""Bounded thread-pool fan-out for independent Cloudera AI API calls."""
+
+from __future__ import annotations
+
+import contextvars
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+try:
+    from cmlapi.rest import ApiException
+except ImportError:
+    class ApiException(Exception):
+        """Placeholder when cmlapi is not installed."""
+        status = None
+        body = None
+
+DEFAULT_MAX_WORKERS = 8
+MAX_WORKERS_LIMIT = 32
+
+
+def clamp_workers(value: Any, default: int = DEFAULT_MAX_WORKERS) -> int:
+    """Coerce a user-supplied parallelism value into 1..MAX_WORKERS_LIMIT."""
+    try:
+        workers = int(value) if value not in (None, "") else default
+    except (TypeError, ValueError):
+        workers = default
+    return max(1, min(workers, MAX_WORKERS_LIMIT))
+
+
+def map_bounded(
+    func: Callable[[Any], Any], items: Sequence[Any], max_workers: Any = None
+) -> List[Tuple[Any, Optional[BaseException]]]:
+    """Apply func to every item with at most max_workers calls in flight.
+
+    Returns one (result, error) pair per item, in input order. Exceptions are
+    captured rather than raised so one failing call never aborts the batch.
+    Each call runs in a copy of the caller's context, so per-call tracing and
+    timing state follows it into the pool.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    def _call(item):
+        try:
+            return func(item), None
+        except Exception as e:
+            return None, e
+
+    workers = min(clamp_workers(max_workers), len(items))
+    if workers == 1:
+        return [_call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(contextvars.copy_context().run, _call, item) for item in items]
+        return [future.result() for future in futures]
+
+
+def error_message(exc: BaseException) -> str:
+    """Render an exception the same way single-call functions report it."""
+    if isinstance(exc, ApiException):
+        return f"API error: {exc.status} - {exc.body}"
+    return str(exc)
+
+
+def split_ids(value: Any) -> List[str]:
+    """Accept a list or comma-separated string of IDs and drop blanks."""
+    if not value:
+        return []
+    raw = value.split(",") if isinstance(value, str) else value
+    return [str(v).strip() for v in raw if str(v).strip()]
+
+
+def load_json(value: Any, name: str) -> Any:
+    """Decode a parameter given as a JSON string; other values pass through unchanged."""
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid JSON for {name}") from None
+    return value
@@ -0,0 +1,135 @@
+"""Low-overhead sampling profiler producing flamegraph-compatible collapsed stacks."""
+
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+DEFAULT_INTERVAL = 0.005
+# Leaf frames in these modules are threads parked waiting for work, not doing it.
+IDLE_MODULES = ("threading", "selectors", "queue", "concurrent.futures.thread", "socketserver")
+
+_active_lock = threading.Lock()
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__") or os.path.basename(code.co_filename)
+    return f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class SamplingProfiler:
+    """Samples every thread's Python stack from a background thread at a fixed interval.
+
+    Stacks are aggregated as "outer;...;inner count" lines (the collapsed format read
+    by flamegraph.pl, speedscope and inferno). Sampling only reads frame objects, so
+    the profiled code runs unmodified; cost scales with the interval, not call volume.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, include_idle: bool = False,
+                 until: Optional[Callable[[], bool]] = None, max_seconds: Optional[float] = None,
+                 on_finish: Optional[Callable[[str], None]] = None):
+        self.interval = max(0.001, float(interval))
+        self.include_idle = include_idle
+        self.until = until
+        self.max_seconds = max_seconds
+        self.on_finish = on_finish
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started_at: Optional[float] = None
+        self.elapsed = 0.0
+        self._stop = threading.Event()
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SamplingProfiler":
+        if not _active_lock.acquire(blocking=False):
+            raise RuntimeError("a profile is already running")
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="cai-mcp-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        try:
+            while not self._stop.is_set():
+                self._sample(own)
+                if self.until is not None and self.until():
+                    break
+                if self.max_seconds is not None and time.perf_counter() - self.started_at >= self.max_seconds:
+                    break
+                self._stop.wait(self.interval)
+        finally:
+            self.elapsed = time.perf_counter() - self.started_at
+            _active_lock.release()
+            try:
+                if self.on_finish is not None:
+                    self.on_finish(self.collapsed())
+            finally:
+                self._done.set()
+
+    def _sample(self, own_thread: int) -> None:
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread:
+                continue
+            if not self.include_idle and frame.f_globals.get("__name__") in IDLE_MODULES:
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.reverse()
+            self.stacks[";".join(labels)] += 1
+        self.samples += 1
+
+    def stop(self) -> str:
+        self._stop.set()
+        self.wait()
+        return self.collapsed()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and not self._done.is_set()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def summary(self) -> Dict[str, float]:
+        return {"samples": self.samples, "stacks": len(self.stacks), "seconds": round(self.elapsed, 3),
+                "interval_ms": self.interval * 1000}
+
+
+def start_from_env(count_calls: Callable[[], float]) -> Optional[SamplingProfiler]:
+    """Start profiling when CAI_MCP_PROFILE names an output file (stdio servers).
+
+    CAI_MCP_PROFILE_CALLS stops after that many tool calls, CAI_MCP_PROFILE_SECONDS
+    after a time window; otherwise the profile covers the whole run. The collapsed
+    stacks are written to the file when profiling stops or the process exits.
+    """
+    path = os.environ.get("CAI_MCP_PROFILE")
+    if not path:
+        return None
+    calls = int(os.environ.get("CAI_MCP_PROFILE_CALLS") or 0)
+    seconds = float(os.environ.get("CAI_MCP_PROFILE_SECONDS") or 0) or None
+    interval = float(os.environ.get("CAI_MCP_PROFILE_INTERVAL_MS") or DEFAULT_INTERVAL * 1000) / 1000
+    baseline = count_calls()
+
+    def _write(text: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    profiler = SamplingProfiler(
+        interval=interval,
+        until=(lambda: count_calls() - baseline >= calls) if calls else None,
+        max_seconds=seconds,
+        on_finish=_write,
+    )
+    atexit.register(lambda: profiler.stop() if profiler.running else None)
+    return profiler.start()
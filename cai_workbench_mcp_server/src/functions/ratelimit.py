@@ -0,0 +1,237 @@
+"""Process-wide client-side rate limiting of workbench API requests, adaptive to 429 responses.
+
+Every outbound request (cmlapi calls through setup_client's wrapper and file upload
+PUTs) takes a token from the bucket for its host before it is sent, so all tools and
+all concurrent MCP sessions in one server share the same budget. A 429 cuts that
+host's rate to half of what was actually sent over the last second, or to half the
+current rate when too little was sent to be a useful estimate (at most once per
+second, honouring Retry-After by pausing the bucket), never below MIN_RATE_FRACTION
+of the configured rate. The burst shrinks in proportion to the rate. After
+RECOVERY_DELAY seconds without throttling the rate grows by a tenth per second
+until it is back at the configured rate.
+
+Settings (read on first use; configure_rate_limit() overrides them):
+  CAI_MCP_RATE_LIMIT          requests/second per host (default 50; "off" disables)
+  CAI_MCP_RATE_BURST          bucket size (default: one second of requests)
+  CAI_MCP_RATE_LIMIT_<CLASS>  separate bucket for one endpoint class (READ, WRITE,
+                              CREATE, UPLOAD; see retry.call_class), e.g. UPLOAD=5
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+from . import timing
+from .retry import error_status
+
+DEFAULT_RATE = 50.0
+MIN_RATE = 0.5
+MIN_RATE_FRACTION = 0.05
+# Fewer requests than this in the send window say nothing about the server's limit
+MIN_SENT_SAMPLE = 5
+DECREASE_FACTOR = 0.5
+DECREASE_INTERVAL = 1.0
+SEND_WINDOW = 1.0
+RECOVERY_DELAY = 5.0
+RECOVERY_STEP = 0.1
+ENDPOINT_CLASSES = ("read", "write", "create", "upload")
+_DISABLED = ("0", "off", "false", "none")
+
+
+class AdaptiveTokenBucket:
+    """Token bucket whose rate backs off sharply on throttling and recovers gradually.
+
+    acquire() reserves a token and sleeps until it is due, so concurrent callers are
+    admitted in arrival order at the current rate.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, min_rate: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.max_rate = float(rate)
+        self.rate = self.max_rate
+        if min_rate is None:
+            min_rate = max(MIN_RATE, self.max_rate * MIN_RATE_FRACTION)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.tokens = self.burst
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._last_throttle: Optional[float] = None
+        self._last_change = self._updated
+        self._sent: deque = deque()
+        self.throttles = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> float:
+        """Bucket size at the current rate: the configured burst scaled down while throttled."""
+        return max(1.0, self.burst * self.rate / self.max_rate)
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token; returns how long the caller must wait before sending."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.tokens -= 1
+            wait = max(-self.tokens / self.rate if self.tokens < 0 else 0.0, self._blocked_until - now)
+            self.waited += wait
+            self._sent.append(now + wait)
+            while self._sent[0] < now - SEND_WINDOW:
+                self._sent.popleft()
+            return wait
+
+    def acquire(self) -> float:
+        wait = self.reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.throttles += 1
+            # In-flight requests sent at the old rate come back throttled together; count them once
+            if self._last_throttle is None or now - self._last_throttle >= DECREASE_INTERVAL:
+                # The configured rate can be far above the server's limit; what was sent is a tighter bound
+                sent = sum(1 for t in self._sent if now - SEND_WINDOW < t <= now)
+                estimate = sent / SEND_WINDOW if sent >= MIN_SENT_SAMPLE else self.rate
+                self.rate = max(self.min_rate, min(self.rate, estimate) * DECREASE_FACTOR)
+                self.tokens = min(self.tokens, 0.0)
+                self._last_change = now
+            self._last_throttle = now
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def on_success(self) -> None:
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            now = self._clock()
+            start = max(self._last_change, (self._last_throttle or 0.0) + RECOVERY_DELAY)
+            steps = int(now - start)
+            if steps < 1:
+                return
+            self._refill(now)
+            self.rate = min(self.max_rate, self.rate * (1 + RECOVERY_STEP) ** steps)
+            self._last_change = start + steps
+
+    def snapshot(self) -> Dict[str, float]:
+        return {"rate": self.rate, "max_rate": self.max_rate, "throttles": self.throttles,
+                "waited_seconds": round(self.waited, 6)}
+
+
+_settings: Optional[Dict[str, Any]] = None
+_buckets: Dict[Tuple[str, str], AdaptiveTokenBucket] = {}
+_registry_lock = threading.Lock()
+
+
+def _env_rate(name: str, default: Optional[float]) -> Optional[float]:
+    raw = os.environ.get(name, "").strip().lower()
+    if not raw:
+        return default
+    if raw in _DISABLED:
+        return None
+    return float(raw)
+
+
+def configure_rate_limit(rate: Optional[float] = DEFAULT_RATE, burst: Optional[float] = None,
+                         per_class: Optional[Dict[str, float]] = None) -> None:
+    """Set the per-host rate (None disables limiting) and optional per-class rates; resets all buckets."""
+    global _settings
+    with _registry_lock:
+        _settings = {"rate": rate, "burst": burst, "per_class": dict(per_class or {})}
+        _buckets.clear()
+
+
+def reset_rate_limit() -> None:
+    """Drop all buckets and any configure_rate_limit() override; settings are re-read from the environment."""
+    global _settings
+    with _registry_lock:
+        _settings = None
+        _buckets.clear()
+
+
+def _load_settings() -> Dict[str, Any]:
+    if _settings is None:
+        per_class = {}
+        for kind in ENDPOINT_CLASSES:
+            rate = _env_rate(f"CAI_MCP_RATE_LIMIT_{kind.upper()}", None)
+            if rate:
+                per_class[kind] = rate
+        configure_rate_limit(_env_rate("CAI_MCP_RATE_LIMIT", DEFAULT_RATE),
+                             _env_rate("CAI_MCP_RATE_BURST", None), per_class)
+    return _settings
+
+
+def _host_key(host: str) -> str:
+    parsed = urlparse(host if "://" in host else f"https://{host}")
+    return parsed.netloc.lower()
+
+
+def limiter_for(host: str, endpoint_class: str = "read") -> Optional[AdaptiveTokenBucket]:
+    """The shared bucket for a host (URL or netloc) and endpoint class; None when limiting is off."""
+    settings = _load_settings()
+    if not settings["rate"]:
+        return None
+    kind = endpoint_class if endpoint_class in settings["per_class"] else "*"
+    key = (_host_key(host), kind)
+    bucket = _buckets.get(key)
+    if bucket is None:
+        with _registry_lock:
+            bucket = _buckets.get(key)
+            if bucket is None:
+                rate = settings["per_class"].get(kind, settings["rate"])
+                burst = settings["burst"] if kind == "*" else None
+                bucket = _buckets[key] = AdaptiveTokenBucket(rate, burst)
+    return bucket
+
+
+def snapshot() -> Dict[Tuple[str, str], Dict[str, float]]:
+    return {key: bucket.snapshot() for key, bucket in list(_buckets.items())}
+
+
+class _Slot:
+    __slots__ = ("status", "retry_after")
+
+    def __init__(self):
+        self.status: Optional[int] = None
+        self.retry_after: Optional[float] = None
+
+
+@contextmanager
+def limited(host: Optional[str], endpoint_class: str = "read") -> Iterator[_Slot]:
+    """Wait for a token before one request and feed its outcome back into the bucket.
+
+    Errors are inspected for their HTTP status; for calls that return a response
+    instead of raising, set slot.status (and slot.retry_after) before leaving the block.
+    """
+    slot = _Slot()
+    bucket = limiter_for(host, endpoint_class) if host else None
+    if bucket is None:
+        yield slot
+        return
+    with timing.phase("rate_limit_wait"):
+        bucket.acquire()
+    try:
+        yield slot
+    except Exception as e:
+        status, retry_after = error_status(e)
+        if status == 429:
+            bucket.on_throttle(retry_after)
+        raise
+    if slot.status == 429:
+        bucket.on_throttle(slot.retry_after)
+    else:
+        bucket.on_success()
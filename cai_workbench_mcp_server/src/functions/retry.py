@@ -0,0 +1,189 @@
+"""Shared retry policy for workbench API calls: exponential backoff, jitter, Retry-After, time budget.
+
+Calls are grouped into classes by cmlapi method name, each with its own policy:
+
+  read    list_*, get_*, search_*, download_*   idempotent
+  write   update_*, delete_*,                   idempotent
+          log_experiment_run_batch
+  create  everything else (create_*, run_*...)  not idempotent: only 429 is retried,
+                                                since the server did not act on it
+  upload  project file PUTs                     idempotent
+
+Idempotent calls are retried on 429, 500, 502, 503, 504 and on connection errors;
+no other 4xx is ever retried. log_experiment_run_batch counts as a write: params
+and tags are set by key and the backend drops metric entries identical in key,
+value, step and timestamp, so a resent batch does not duplicate history. A policy can be overridden per class with
+CAI_MCP_RETRY_<CLASS>="max_attempts=5,base_delay=0.5,max_delay=10,max_elapsed=60",
+and CAI_MCP_RETRY=off disables retries entirely.
+"""
+
+import email.utils
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import urllib3
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Errors raised before any HTTP status was received
+TRANSIENT_ERRORS = (OSError, urllib3.exceptions.HTTPError)
+
+READ_PREFIXES = ("list_", "get_", "search_", "download_")
+WRITE_PREFIXES = ("update_", "delete_")
+IDEMPOTENT_METHODS = frozenset({"log_experiment_run_batch"})
+
+
+def _parse_retry_after(value: Any) -> Optional[float]:
+    """Seconds to wait from a Retry-After header given as seconds or an HTTP date."""
+    if value in (None, ""):
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _header(headers: Any, name: str) -> Any:
+    if not headers:
+        return None
+    try:
+        return headers.get(name) or headers.get(name.lower())
+    except AttributeError:
+        return None
+
+
+def error_status(exc: Any) -> Tuple[Optional[int], Optional[float]]:
+    """HTTP status and Retry-After seconds of a cmlapi/requests exception or a requests response."""
+    response = getattr(exc, "response", None)
+    status = getattr(exc, "status_code", None) or getattr(exc, "status", None) or getattr(response, "status_code", None)
+    headers = getattr(exc, "headers", None) or getattr(response, "headers", None)
+    return status, _parse_retry_after(_header(headers, "Retry-After"))
+
+
+class RetryPolicy:
+    """Retry a call with capped exponential backoff and full jitter within a time budget.
+
+    The wait before retry n (0-based) is uniform in [0, min(max_delay, base_delay * 2**n)],
+    or exactly that bound with jitter=False; a longer Retry-After from the server wins.
+    A retry whose wait would end past max_elapsed seconds from the first attempt is not made.
+    """
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 0.25, max_delay: float = 10.0,
+                 max_elapsed: Optional[float] = 30.0, jitter: bool = True,
+                 sleep: Callable[[float], None] = time.sleep, clock: Callable[[], float] = time.monotonic,
+                 rng: Callable[[], float] = random.random):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = max(0.0, float(base_delay))
+        self.max_delay = max(0.0, float(max_delay))
+        self.max_elapsed = max_elapsed
+        self.jitter = jitter
+        self._sleep = sleep
+        self._clock = clock
+        self._rng = rng
+
+    def backoff(self, attempt: int) -> float:
+        bound = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return bound * self._rng() if self.jitter else bound
+
+    @staticmethod
+    def retryable(status: Optional[int], idempotent: bool) -> bool:
+        if status == 429:
+            return True
+        return idempotent and status in RETRYABLE_STATUSES
+
+    def _wait(self, attempt: int, started: float, retry_after: Optional[float]) -> bool:
+        """Sleep before the next attempt; False when attempts or the time budget are used up."""
+        if attempt + 1 >= self.max_attempts:
+            return False
+        delay = max(self.backoff(attempt), retry_after or 0.0)
+        if self.max_elapsed is not None and self._clock() - started + delay > self.max_elapsed:
+            return False
+        self._sleep(delay)
+        return True
+
+    def call(self, fn: Callable[[], Any], idempotent: bool = True,
+             on_retry: Optional[Callable[[Optional[int]], None]] = None) -> Any:
+        """Run fn until it succeeds or retrying stops; returns its result or raises its last error.
+
+        fn may raise (cmlapi) or return a response with status_code (requests); a
+        retryable response is retried like an error and returned as-is when retries end.
+        """
+        started = self._clock()
+        attempt = 0
+        while True:
+            try:
+                result = fn()
+            except Exception as e:
+                status, retry_after = error_status(e)
+                if status is None:
+                    again = idempotent and isinstance(e, TRANSIENT_ERRORS)
+                else:
+                    again = self.retryable(status, idempotent)
+                if not again or not self._wait(attempt, started, retry_after):
+                    raise
+            else:
+                status, retry_after = error_status(result)
+                if not self.retryable(status, idempotent):
+                    return result
+                if not self._wait(attempt, started, retry_after):
+                    return result
+            if on_retry is not None:
+                on_retry(status)
+            attempt += 1
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+POLICIES: Dict[str, RetryPolicy] = {
+    "read": RetryPolicy(max_attempts=4, base_delay=0.25, max_delay=8.0, max_elapsed=30.0),
+    "write": RetryPolicy(max_attempts=3, base_delay=0.5, max_delay=8.0, max_elapsed=30.0),
+    "create": RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=10.0, max_elapsed=30.0),
+    "upload": RetryPolicy(max_attempts=4, base_delay=0.5, max_delay=10.0, max_elapsed=120.0),
+}
+
+
+def call_class(method: str) -> str:
+    if method.startswith(READ_PREFIXES):
+        return "read"
+    if method.startswith(WRITE_PREFIXES) or method in IDEMPOTENT_METHODS:
+        return "write"
+    return "create"
+
+
+def policy_for(method: str) -> Tuple[RetryPolicy, bool]:
+    """The retry policy for a cmlapi method and whether the call is idempotent."""
+    kind = call_class(method)
+    return POLICIES.get(kind, NO_RETRY), kind != "create"
+
+
+def _load_env() -> None:
+    if os.environ.get("CAI_MCP_RETRY", "").strip().lower() in ("0", "off", "false", "none"):
+        for kind in POLICIES:
+            POLICIES[kind] = NO_RETRY
+        return
+    for kind, policy in list(POLICIES.items()):
+        spec = os.environ.get(f"CAI_MCP_RETRY_{kind.upper()}")
+        if not spec:
+            continue
+        settings = {"max_attempts": policy.max_attempts, "base_delay": policy.base_delay,
+                    "max_delay": policy.max_delay, "max_elapsed": policy.max_elapsed}
+        try:
+            for item in spec.split(","):
+                key, _, value = item.strip().partition("=")
+                if key not in settings:
+                    raise ValueError(f"unknown setting {key!r}")
+                settings[key] = None if key == "max_elapsed" and value.lower() == "none" else float(value)
+        except ValueError as e:
+            print(f"Ignoring CAI_MCP_RETRY_{kind.upper()}: {e}", file=sys.stderr)
+            continue
+        POLICIES[kind] = RetryPolicy(**settings)
+
+
+_load_env()
@@ -0,0 +1,323 @@
+"""Run a dependency graph of Cloudera AI jobs with local scheduling."""
+
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from cmlapi.rest import ApiException
+except ImportError:
+    class ApiException(Exception):
+        """Placeholder when cmlapi is not installed."""
+        status = None
+        body = None
+
+from .create_job_run import build_job_run_body
+from .http_helpers import setup_client, serialize_result
+from .parallel import error_message, load_json, map_bounded
+
+SUCCEEDED_STATUSES = {"ENGINE_SUCCEEDED", "SUCCEEDED"}
+FAILED_STATUSES = {"ENGINE_FAILED", "ENGINE_TIMEDOUT", "ENGINE_STOPPED", "FAILED", "TIMEDOUT", "STOPPED"}
+FAILURE_POLICIES = ("fail_fast", "continue")
+
+
+class CmlJobRunApi:
+    """Adapter exposing the two job-run calls the scheduler needs over cmlapi."""
+
+    def __init__(self, client, project_id: str, run_params: Optional[Callable[[str], Dict[str, Any]]] = None):
+        self.client = client
+        self.project_id = project_id
+        self.run_params = run_params or (lambda job_id: {})
+
+    def create_job_run(self, job_id: str) -> str:
+        body = build_job_run_body(self.run_params(job_id))
+        result = serialize_result(self.client.create_job_run(body, self.project_id, job_id)) or {}
+        return result.get("id")
+
+    def get_job_run(self, job_id: str, run_id: str) -> str:
+        result = serialize_result(self.client.get_job_run(self.project_id, job_id, run_id)) or {}
+        return result.get("status") or ""
+
+
+def parse_dag(dag: Any) -> Dict[str, List[str]]:
+    """Normalize {job_id: [dependency job_ids]} and reject cycles.
+
+    Dependencies that are not keys of the graph are added as root jobs.
+    """
+    if isinstance(dag, str):
+        dag = json.loads(dag)
+    if not isinstance(dag, dict) or not dag:
+        raise ValueError("dag must be a non-empty object mapping job_id to a list of dependencies")
+
+    graph: Dict[str, List[str]] = {}
+    for job_id, deps in dag.items():
+        if isinstance(deps, str):
+            deps = [d.strip() for d in deps.split(",") if d.strip()]
+        graph[str(job_id)] = [str(d) for d in (deps or [])]
+    for deps in list(graph.values()):
+        for dep in deps:
+            graph.setdefault(dep, [])
+
+    order = topological_order(graph)
+    if len(order) != len(graph):
+        cyclic = sorted(set(graph) - set(order))
+        raise ValueError(f"dag contains a cycle involving: {', '.join(cyclic)}")
+    return graph
+
+
+def topological_order(graph: Dict[str, List[str]]) -> List[str]:
+    remaining = {job: len(deps) for job, deps in graph.items()}
+    dependents: Dict[str, List[str]] = {job: [] for job in graph}
+    for job, deps in graph.items():
+        for dep in deps:
+            dependents[dep].append(job)
+    queue = [job for job, count in remaining.items() if count == 0]
+    order = []
+    while queue:
+        job = queue.pop(0)
+        order.append(job)
+        for child in dependents[job]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                queue.append(child)
+    return order
+
+
+class JobDagScheduler:
+    """Launch ready jobs in parallel and poll in-flight runs in batches.
+
+    api must provide create_job_run(job_id) -> run_id and
+    get_job_run(job_id, run_id) -> status, so the scheduler can be driven by
+    a local stub as easily as by CmlJobRunApi.
+    """
+
+    def __init__(self, api, graph: Dict[str, List[str]], on_failure: str = "fail_fast",
+                 max_parallel: int = 4, poll_interval: float = 10.0, timeout: float = 3600.0,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        if on_failure not in FAILURE_POLICIES:
+            raise ValueError(f"on_failure must be one of: {', '.join(FAILURE_POLICIES)}")
+        self.api = api
+        self.graph = graph
+        self.on_failure = on_failure
+        self.max_parallel = max(1, int(max_parallel))
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.clock = clock
+        self.sleep = sleep
+        self.jobs: Dict[str, Dict[str, Any]] = {
+            job: {"status": "pending", "run_id": None, "ready_at": None, "started_at": None,
+                  "finished_at": None, "error": None}
+            for job in graph
+        }
+
+    def _finish(self, job: str, status: str, now: float, error: Optional[str] = None) -> None:
+        record = self.jobs[job]
+        record["status"] = status
+        record["finished_at"] = now
+        if error:
+            record["error"] = error
+
+    def _skip_blocked(self, now: float) -> None:
+        changed = True
+        while changed:
+            changed = False
+            for job, deps in self.graph.items():
+                if self.jobs[job]["status"] != "pending":
+                    continue
+                if any(self.jobs[d]["status"] in ("failed", "skipped") for d in deps):
+                    self._finish(job, "skipped", now, "upstream dependency did not succeed")
+                    changed = True
+
+    def _ready(self, now: float) -> List[str]:
+        ready = []
+        for job, deps in self.graph.items():
+            record = self.jobs[job]
+            if record["status"] == "pending" and all(self.jobs[d]["status"] == "succeeded" for d in deps):
+                if record["ready_at"] is None:
+                    record["ready_at"] = now
+                ready.append(job)
+        return ready
+
+    def _running(self) -> List[str]:
+        return [job for job, record in self.jobs.items() if record["status"] == "running"]
+
+    def _launch(self, jobs: List[str]) -> None:
+        results = map_bounded(self.api.create_job_run, jobs, self.max_parallel)
+        now = self.clock()
+        for job, (run_id, error) in zip(jobs, results, strict=True):
+            record = self.jobs[job]
+            if error is not None or not run_id:
+                record["started_at"] = now
+                self._finish(job, "failed", now, error_message(error) if error else "no run id returned")
+            else:
+                record.update(status="running", run_id=run_id, started_at=now)
+
+    def _poll(self, jobs: List[str]) -> None:
+        items = [(job, self.jobs[job]["run_id"]) for job in jobs]
+        results = map_bounded(lambda item: self.api.get_job_run(*item), items, self.max_parallel)
+        now = self.clock()
+        for job, (status, error) in zip(jobs, results, strict=True):
+            if error is not None:
+                # Transient poll errors leave the run in flight; the timeout bounds retries.
+                self.jobs[job]["error"] = error_message(error)
+                continue
+            status = (status or "").upper()
+            self.jobs[job]["last_status"] = status
+            if status in SUCCEEDED_STATUSES:
+                self._finish(job, "succeeded", now)
+            elif status in FAILED_STATUSES:
+                self._finish(job, "failed", now, status)
+
+    def run(self) -> Dict[str, Any]:
+        start = self.clock()
+        aborted = False
+        timed_out = False
+        while True:
+            now = self.clock()
+            self._skip_blocked(now)
+            if any(r["status"] == "failed" for r in self.jobs.values()) and self.on_failure == "fail_fast":
+                aborted = True
+            running = self._running()
+            if not aborted:
+                ready = self._ready(now)[: self.max_parallel - len(running)]
+                if ready:
+                    self._launch(ready)
+                    continue
+            if not running:
+                break
+            if now - start >= self.timeout:
+                timed_out = True
+                for job in running:
+                    self._finish(job, "timed_out", now, "dag timeout reached while run was in flight")
+                break
+            self.sleep(self.poll_interval)
+            self._poll(running)
+
+        end = self.clock()
+        for job, record in self.jobs.items():
+            if record["status"] == "pending":
+                self._finish(job, "skipped", end, "not started: dag aborted" if aborted or timed_out else None)
+        return self._report(start, end, aborted, timed_out)
+
+    def _report(self, start: float, end: float, aborted: bool, timed_out: bool) -> Dict[str, Any]:
+        def rel(value):
+            return None if value is None else round(value - start, 3)
+
+        durations = {}
+        jobs = {}
+        for job, record in self.jobs.items():
+            started, finished = record["started_at"], record["finished_at"]
+            duration = finished - started if started is not None and finished is not None else 0.0
+            durations[job] = duration
+            jobs[job] = {
+                "status": record["status"],
+                "run_id": record["run_id"],
+                "depends_on": self.graph[job],
+                "started_at": rel(started),
+                "finished_at": rel(finished),
+                "duration_seconds": round(duration, 3),
+                "queued_seconds": round(started - record["ready_at"], 3)
+                if started is not None and record["ready_at"] is not None else None,
+                "error": record["error"],
+            }
+
+        # Longest chain of actual run durations through the dependency graph.
+        path_cost: Dict[str, float] = {}
+        best_parent: Dict[str, Optional[str]] = {}
+        for job in topological_order(self.graph):
+            deps = self.graph[job]
+            parent = max(deps, key=lambda d: path_cost[d]) if deps else None
+            best_parent[job] = parent
+            path_cost[job] = durations[job] + (path_cost[parent] if parent else 0.0)
+        tail = max(path_cost, key=path_cost.get)
+        critical_path = []
+        while tail:
+            critical_path.append(tail)
+            tail = best_parent[tail]
+        critical_path.reverse()
+
+        counts: Dict[str, int] = {}
+        for record in jobs.values():
+            counts[record["status"]] = counts.get(record["status"], 0) + 1
+        return {
+            "succeeded": counts.get("succeeded", 0) == len(jobs),
+            "aborted": aborted,
+            "timed_out": timed_out,
+            "counts": counts,
+            "wall_clock_seconds": round(end - start, 3),
+            "critical_path": critical_path,
+            "critical_path_seconds": round(path_cost[critical_path[-1]], 3),
+            "jobs": jobs,
+        }
+
+
+def run_job_dag(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run jobs in dependency order, launching independent jobs in parallel.
+
+    Args:
+        config: MCP configuration
+        params: Function parameters
+            - dag: Mapping (or JSON string) of job_id to a list of job_ids it depends on
+            - on_failure: "fail_fast" (stop launching after a failure) or "continue"
+              (keep running branches that do not depend on the failed job)
+            - max_parallel: Maximum runs in flight at once (default 4)
+            - poll_interval: Seconds between batched get_job_run polls (default 10)
+            - timeout: Overall budget in seconds (default 3600)
+            - environment_variables: Environment variables applied to every run
+            - job_overrides: Mapping of job_id to per-run parameters; their
+              environment_variables may also be JSON strings
+
+    Returns:
+        Dict with per-job outcomes and a critical-path timing report
+    """
+    params = params or {}
+    project_id = params.get("project_id") or config.get("project_id")
+    if not project_id:
+        return {"success": False, "message": "project_id is required"}
+    if not params.get("dag"):
+        return {"success": False, "message": "dag is required"}
+
+    try:
+        graph = parse_dag(params["dag"])
+        shared_env = load_json(params.get("environment_variables"), "environment_variables") or {}
+        overrides = {
+            job_id: {**job_params, "environment_variables": load_json(
+                job_params.get("environment_variables"), f"environment_variables of {job_id}") or {}}
+            for job_id, job_params in (load_json(params.get("job_overrides"), "job_overrides") or {}).items()
+        }
+        poll_interval = float(params["poll_interval"]) if params.get("poll_interval") is not None else 10.0
+        timeout = float(params["timeout"]) if params.get("timeout") is not None else 3600.0
+        if poll_interval < 0 or timeout < 0:
+            raise ValueError("poll_interval and timeout must not be negative")
+    except (ValueError, TypeError, AttributeError) as e:
+        return {"success": False, "message": f"Invalid dag parameters: {str(e)}"}
+
+    def run_params(job_id: str) -> Dict[str, Any]:
+        job_params = dict(overrides.get(job_id) or {})
+        env = dict(shared_env)
+        env.update(job_params.pop("environment_variables", None) or {})
+        if env:
+            job_params["environment_variables"] = env
+        return job_params
+
+    try:
+        client = setup_client(config["host"], config["api_key"])
+        scheduler = JobDagScheduler(
+            CmlJobRunApi(client, project_id, run_params),
+            graph,
+            on_failure=params.get("on_failure") or "fail_fast",
+            max_parallel=params.get("max_parallel") or 4,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        )
+        report = scheduler.run()
+        counts = ", ".join(f"{n} {status}" for status, n in sorted(report["counts"].items()))
+        return {
+            "success": report["succeeded"],
+            "message": f"DAG finished: {counts}",
+            "data": report,
+        }
+    except ApiException as e:
+        return {"success": False, "message": f"API error: {e.status} - {e.body}"}
+    except Exception as e:
+        return {"success": False, "message": f"Error running job DAG: {str(e)}"}
@@ -0,0 +1,134 @@
+"""Structured log of tool calls slower than a threshold, written off the request path.
+
+Enabled by configure_slow_call_log(), either explicitly or from CAI_MCP_SLOW_CALL_MS
+(threshold in milliseconds; 0 logs every call). Records are JSON lines appended to
+CAI_MCP_SLOW_CALL_LOG (default cai-mcp-slow-calls.jsonl), rotated at
+CAI_MCP_SLOW_CALL_LOG_MAX_BYTES with CAI_MCP_SLOW_CALL_LOG_BACKUPS old files kept.
+The request path only enqueues the record; a listener thread does the file I/O.
+
+Argument values are never logged. Each call carries a fingerprint (hash of the
+full arguments, so identical calls group together) and a shape that keeps numbers
+and booleans such as page_size but reduces strings and collections to their length.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_LOG_FILE = "cai-mcp-slow-calls.jsonl"
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUPS = 5
+
+_logger = logging.getLogger("cai_workbench_mcp_server.slow_calls")
+_logger.propagate = False
+_threshold_ms: Optional[float] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def enabled() -> bool:
+    return _threshold_ms is not None
+
+
+def threshold_ms() -> Optional[float]:
+    return _threshold_ms
+
+
+def configure_slow_call_log(threshold: Optional[float] = None, path: Optional[str] = None,
+                            max_bytes: Optional[int] = None, backups: Optional[int] = None) -> bool:
+    """Start logging calls slower than threshold milliseconds; returns True when enabled."""
+    global _threshold_ms, _listener
+    if threshold is None:
+        raw = os.environ.get("CAI_MCP_SLOW_CALL_MS", "").strip()
+        if not raw:
+            return False
+        threshold = float(raw)
+    shutdown()
+    handler = logging.handlers.RotatingFileHandler(
+        path or os.environ.get("CAI_MCP_SLOW_CALL_LOG") or DEFAULT_LOG_FILE,
+        maxBytes=max_bytes if max_bytes is not None else int(
+            os.environ.get("CAI_MCP_SLOW_CALL_LOG_MAX_BYTES") or DEFAULT_MAX_BYTES),
+        backupCount=backups if backups is not None else int(
+            os.environ.get("CAI_MCP_SLOW_CALL_LOG_BACKUPS") or DEFAULT_BACKUPS),
+        encoding="utf-8",
+    )
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(records, handler)
+    _listener.start()
+    _logger.handlers = [logging.handlers.QueueHandler(records)]
+    _logger.setLevel(logging.INFO)
+    _threshold_ms = max(0.0, float(threshold))
+    return True
+
+
+def shutdown() -> None:
+    """Stop logging and flush queued records to disk."""
+    global _threshold_ms, _listener
+    _threshold_ms = None
+    _logger.handlers = []
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown)
+
+
+def _shape(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return f"str[{len(value)}]"
+    if isinstance(value, (list, tuple)):
+        return f"list[{len(value)}]"
+    if isinstance(value, dict):
+        return f"dict[{len(value)}]"
+    return type(value).__name__
+
+
+def fingerprint(arguments: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Redacted view of tool arguments: a stable hash plus the shape of each value."""
+    arguments = arguments or {}
+    digest = hashlib.sha256(json.dumps(arguments, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return {"hash": digest[:16], "shape": {key: _shape(arguments[key]) for key in sorted(arguments)}}
+
+
+def record_call(tool: str, arguments: Optional[Dict[str, Any]], duration_ms: float, failed: bool,
+                timer: Any = None) -> bool:
+    """Log the call if it exceeded the threshold; timer is the call's timing.CallTiming, if any."""
+    if _threshold_ms is None or duration_ms < _threshold_ms:
+        return False
+    entry: Dict[str, Any] = {
+        "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()),
+        "tool": tool,
+        "duration_ms": round(duration_ms, 3),
+        "threshold_ms": _threshold_ms,
+        "failed": failed,
+        "arguments": fingerprint(arguments),
+    }
+    if timer is not None:
+        calls = timer.as_dict()["upstream_calls"]
+        by_method: Dict[str, Dict[str, Any]] = {}
+        for call in calls:
+            stats = by_method.setdefault(call["method"], {"calls": 0, "ms": 0.0, "bytes": 0, "pages": 0})
+            stats["calls"] += 1
+            stats["ms"] = round(stats["ms"] + call["ms"], 3)
+            stats["bytes"] += call["bytes"] or 0
+            # Count page-tagged calls: several loops may page through the same method
+            stats["pages"] += 1 if call.get("page") else 0
+        entry.update({
+            "upstream_calls": len(calls),
+            "upstream_ms": round(sum(c["ms"] for c in calls), 3),
+            "pages": sum(stats["pages"] for stats in by_method.values()),
+            "bytes": sum(stats["bytes"] for stats in by_method.values()),
+            "by_method": by_method,
+        })
+    _logger.info(json.dumps(entry))
+    return True
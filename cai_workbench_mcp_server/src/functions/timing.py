@@ -0,0 +1,112 @@
+"""Opt-in per-call timing breakdown returned as a _timing block in tool responses.
+
+Enabled with CAI_MCP_DEBUG_TIMING=1. When disabled, every hook is a single
+context-variable lookup that finds nothing.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+_enabled = os.environ.get("CAI_MCP_DEBUG_TIMING", "").strip().lower() in ("1", "true", "yes", "on")
+_current: ContextVar = ContextVar("cai_mcp_call_timing", default=None)
+# The most recent upstream entry in this context, so serialize_result can attach its payload size
+_last_upstream: ContextVar = ContextVar("cai_mcp_last_upstream", default=None)
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(value: bool) -> None:
+    global _enabled
+    _enabled = bool(value)
+
+
+class CallTiming:
+    """Phase durations and upstream calls recorded during one tool call (thread-safe)."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.upstream: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def add_upstream(self, method: str, seconds: float, status: Optional[int], size: Optional[int],
+                     page: Optional[int] = None) -> Dict[str, Any]:
+        entry = {"method": method, "ms": round(seconds * 1000, 3), "status": status, "bytes": size}
+        if page is not None:
+            entry["page"] = page
+        with self._lock:
+            self.upstream.append(entry)
+        return entry
+
+    def as_dict(self) -> Dict[str, Any]:
+        total = time.perf_counter() - self.started
+        with self._lock:
+            phases = dict(self.phases)
+            upstream = list(self.upstream)
+        upstream_ms = sum(e["ms"] for e in upstream)
+        block = {f"{name}_ms": round(seconds * 1000, 3) for name, seconds in phases.items()}
+        block.update({
+            "upstream_ms": round(upstream_ms, 3),
+            "upstream_calls": upstream,
+            "total_ms": round(total * 1000, 3),
+        })
+        # Upstream calls may overlap when fanned out, so "other" can go negative
+        block["other_ms"] = round(block["total_ms"] - upstream_ms - sum(phases.values()) * 1000, 3)
+        return block
+
+
+@contextmanager
+def collect(record: bool = False) -> Iterator[Optional[CallTiming]]:
+    """Collect timings for the enclosed tool call.
+
+    Yields None unless debug timing is enabled or record asks for the breakdown anyway
+    (the slow-call log uses it without adding _timing to responses).
+    """
+    if not (_enabled or record):
+        yield None
+        return
+    timer = CallTiming()
+    token = _current.set(timer)
+    try:
+        yield timer
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    timer = _current.get()
+    if timer is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add_phase(name, time.perf_counter() - start)
+
+
+def record_upstream(method: str, seconds: float, status: Optional[int], size: Optional[int],
+                    page: Optional[int] = None) -> None:
+    timer = _current.get()
+    if timer is not None:
+        _last_upstream.set(timer.add_upstream(method, seconds, status, size, page))
+
+
+def note_payload(size: int) -> None:
+    """Attach a serialized response size to the upstream call that produced it."""
+    if _current.get() is None:
+        return
+    entry = _last_upstream.get()
+    if entry is not None and entry["bytes"] is None:
+        entry["bytes"] = size
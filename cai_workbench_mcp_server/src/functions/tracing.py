@@ -0,0 +1,102 @@
+"""Optional OpenTelemetry tracing for tool calls, workbench API requests and serialization.
+
+Tracing is off unless configure_tracing() enables it, either explicitly or from
+CAI_MCP_TRACING=console|file (file path from CAI_MCP_TRACE_FILE). Exporting needs
+the opentelemetry-sdk package; without it tracing stays off and span() is a no-op.
+Console output goes to stderr because stdout carries the stdio MCP protocol.
+"""
+
+import atexit
+import contextvars
+import os
+import sys
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+DEFAULT_TRACE_FILE = "cai-mcp-traces.jsonl"
+_DISABLED = ("", "0", "off", "false", "none")
+
+_tracer = None
+_page_number: contextvars.ContextVar = contextvars.ContextVar("cai_mcp_page_number", default=None)
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def configure_tracing(mode: Optional[str] = None, path: Optional[str] = None, span_exporter: Any = None,
+                      service_name: str = "cai-workbench-mcp") -> bool:
+    """Install a tracer exporting to the console, a JSON-lines file or a given SpanExporter.
+
+    Returns True when tracing was enabled.
+    """
+    global _tracer
+    mode = (mode if mode is not None else os.environ.get("CAI_MCP_TRACING", "")).strip().lower()
+    if span_exporter is None and mode in _DISABLED:
+        return False
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            BatchSpanProcessor,
+            ConsoleSpanExporter,
+            SimpleSpanProcessor,
+        )
+    except ImportError:
+        print("Tracing requested but opentelemetry-sdk is not installed; tracing disabled", file=sys.stderr)
+        return False
+
+    provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+    if span_exporter is not None:
+        provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    else:
+        if mode == "file":
+            out = open(path or os.environ.get("CAI_MCP_TRACE_FILE") or DEFAULT_TRACE_FILE, "a", encoding="utf-8")
+        elif mode == "console":
+            out = sys.stderr
+        else:
+            print(f"Unknown CAI_MCP_TRACING mode {mode!r}; use console or file", file=sys.stderr)
+            return False
+        exporter = ConsoleSpanExporter(out=out, formatter=lambda s: s.to_json(indent=None) + "\n")
+        provider.add_span_processor(BatchSpanProcessor(exporter))
+        atexit.register(provider.shutdown)
+    _tracer = provider.get_tracer("cai_workbench_mcp_server")
+    return True
+
+
+def disable_tracing() -> None:
+    global _tracer
+    _tracer = None
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """Start a span as a child of the current one; yields None when tracing is off."""
+    if _tracer is None:
+        yield None
+        return
+    with _tracer.start_as_current_span(
+        name, attributes={k: v for k, v in attributes.items() if v is not None}
+    ) as current:
+        yield current
+
+
+def set_attributes(current: Any, **attributes: Any) -> None:
+    if current is not None:
+        for key, value in attributes.items():
+            if value is not None:
+                current.set_attribute(key, value)
+
+
+@contextmanager
+def page(number: int) -> Iterator[None]:
+    """Tag upstream requests made inside the block with a 1-based page number."""
+    token = _page_number.set(number)
+    try:
+        yield
+    finally:
+        _page_number.reset(token)
+
+
+def current_page() -> Optional[int]:
+    return _page_number.get()
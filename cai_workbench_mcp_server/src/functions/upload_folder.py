@@ -2,13 +2,15 @@
 
 import os
 import json
-import time
 import datetime
 from pathlib import Path
-import requests
 from typing import Dict, Any, List, Optional
 
-from .http_helpers import setup_client, normalize_host, requests_verify
+from .http_helpers import setup_client, normalize_host, put_project_file
+from .content_index import ContentIndex
+from .parallel import split_ids
+from .path_filter import DEFAULT_IGNORE_PATTERNS, PathFilter, walk_filtered
+from .upload_journal import default_journal_path, open_journal
 
 
 def delete_file_if_exists(client, project_id, file_path):
@@ -23,8 +25,6 @@ def delete_file_if_exists(client, project_id, file_path):
     try:
         client.delete_project_file(project_id=project_id, path=file_path)
         print(f"Deleted existing file: {file_path}")
-        # Add a small delay to ensure the deletion is processed
-        time.sleep(0.5)
     except Exception:
         # File might not exist, which is fine
         pass
@@ -56,20 +56,9 @@ def upload_file_to_project(host, api_key, project_id, file_path, relative_path):
             "Authorization": f"Bearer {api_key}"
         }
         
-        # Open the file to upload
+        # Open the file to upload; the PUT is retried on throttling and transient errors
         with open(file_path, 'rb') as file_data:
-            # Create the form data with the target path as the field name
-            files = {
-                target_path: file_data
-            }
-            
-            # Make the PUT request
-            response = requests.put(
-                upload_url,
-                headers=headers,
-                files=files,
-                verify=requests_verify(),
-            )
+            response = put_project_file(upload_url, headers, target_path, file_data, os.path.getsize(file_path))
         
         # Check the response
         if response.status_code in (200, 201, 202, 204):
@@ -92,11 +81,24 @@ def upload_folder(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, A
         config: MCP configuration
         params: Function parameters
             - folder_path: Local path to the folder to upload
-            - ignore_folders: Optional list of folders to ignore
+            - ignore_folders: Optional list of folder names to ignore at any depth
+            - ignore_patterns: Optional gitignore-style patterns (e.g. "*.parquet", "/build/")
+            - use_ignore_files: Also apply .gitignore/.caiignore from folder_path (default True)
+            - max_file_size: Skip files larger than this many bytes
+            - include_extensions / exclude_extensions: Optional extension filters (e.g. "py,ipynb")
+            - resume: Skip files recorded as uploaded by an interrupted earlier run (default True)
+            - journal_path: Upload journal location (default: per host/project/folder under ~/.cache)
+            - reset_journal: Discard any existing journal and upload everything
+            - dedupe: Skip files whose content hash was already uploaded to the same
+              project path, per the local content index (default False). The index only
+              knows about deletes made through this server's delete tools.
+            - index_path: Content index location (default: ~/.cache/cai_workbench_mcp)
             
     Returns:
         Upload results
     """
+    journal = None
+    index = None
     try:
         # Validate parameters
         folder_path = params.get("folder_path")
@@ -110,8 +112,12 @@ def upload_folder(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, A
                 "message": "Missing project_id in configuration"
             }
         
-        # Default ignored folders if not specified
-        ignore_folders = params.get("ignore_folders") or ["node_modules", ".git", ".vscode", "dist", "out"]
+        # Ignored folder names become directory-only patterns; defaults apply when none are given
+        ignore_folders = split_ids(params.get("ignore_folders"))
+        patterns = [f"{name.strip('/')}/" for name in ignore_folders] or list(DEFAULT_IGNORE_PATTERNS)
+        patterns.extend(split_ids(params.get("ignore_patterns")))
+        max_file_size = params.get("max_file_size")
+        max_file_size = int(max_file_size) if max_file_size not in (None, "") else None
         
         # Check if folder exists
         folder_path_obj = Path(folder_path)
@@ -119,49 +125,92 @@ def upload_folder(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, A
             raise ValueError(f"{folder_path} is not a valid directory")
         
         host = normalize_host(config['host'])
+        if params.get("use_ignore_files", True):
+            path_filter = PathFilter.from_directory(folder_path, patterns)
+        else:
+            path_filter = PathFilter(patterns)
+        filter_stats = {}
         
         successful_uploads = []
         failed_uploads = []
-        
-        # Walk through the directory structure and upload files
-        for root, dirs, files in os.walk(folder_path):
-            # Skip ignored folders - this modifies dirs in place to avoid walking into them
-            dirs[:] = [d for d in dirs if d not in ignore_folders]
+        skipped_uploads = []
+        deduplicated_uploads = []
+
+        # Completed files are journaled so an interrupted upload can resume
+        resume = params.get("resume", True)
+        journal_path = params.get("journal_path") or default_journal_path(host, project_id, folder_path)
+        journal = open_journal(journal_path, reset=bool(params.get("reset_journal")) or not resume)
+        if params.get("dedupe"):
+            index = ContentIndex(params.get("index_path"))
+
+        # Walk the tree once, pruning ignored directories before descending into them
+        for full_path, relative_posix, stat in walk_filtered(
+            folder_path,
+            path_filter,
+            max_file_size=max_file_size,
+            include_extensions=split_ids(params.get("include_extensions")),
+            exclude_extensions=split_ids(params.get("exclude_extensions")),
+            stats=filter_stats,
+        ):
+            relative_path = Path(relative_posix)
+            if journal.is_done(relative_posix, stat.st_size, stat.st_mtime):
+                skipped_uploads.append(str(relative_path))
+                continue
+            try:
+                sha256 = index.file_hash(full_path, stat) if index else None
+            except OSError as e:
+                failed_uploads.append({"file": str(relative_path), "error": str(e)})
+                continue
+            if sha256 and index.is_uploaded(host, project_id, relative_posix, sha256):
+                deduplicated_uploads.append(str(relative_path))
+                continue
+            
+            # Upload the file using direct PUT; release the index write lock first
+            if index:
+                index.commit()
+            print(f"Processing file: {relative_path}")
+            success = upload_file_to_project(
+                host=host,
+                api_key=config['api_key'],
+                project_id=project_id,
+                file_path=full_path,
+                relative_path=relative_path
+            )
             
-            for file in files:
-                # Get the full path and relative path
-                full_path = os.path.join(root, file)
-                relative_path = Path(full_path).relative_to(folder_path_obj)
-                
-                # Upload the file using direct PUT
-                print(f"Processing file: {relative_path}")
-                success = upload_file_to_project(
-                    host=host,
-                    api_key=config['api_key'],
-                    project_id=project_id,
-                    file_path=full_path,
-                    relative_path=relative_path
-                )
-                
-                if success:
-                    successful_uploads.append(str(relative_path))
-                else:
-                    failed_uploads.append({
-                        "file": str(relative_path),
-                        "error": "Failed to upload file"
-                    })
-                
-                # Add a small delay between uploads to prevent rate limiting
-                time.sleep(0.5)
+            if success:
+                successful_uploads.append(str(relative_path))
+                journal.record(relative_posix, stat.st_size, stat.st_mtime)
+                if index:
+                    index.record_upload(host, project_id, relative_posix, sha256, stat.st_size)
+            else:
+                failed_uploads.append({
+                    "file": str(relative_path),
+                    "error": "Failed to upload file"
+                })
+
+        # Keep the journal only while there is something left to resume
+        if failed_uploads:
+            journal.close()
+        else:
+            journal.discard()
         
         return {
             "success": True,
-            "message": f"Upload completed. Successfully uploaded {len(successful_uploads)} files.",
+            "message": f"Upload completed. Successfully uploaded {len(successful_uploads)} files"
+                       f" ({len(skipped_uploads)} already uploaded by a previous run,"
+                       f" {len(deduplicated_uploads)} unchanged since their last upload).",
             "failed_count": len(failed_uploads),
             "successful_count": len(successful_uploads),
+            "skipped_count": len(skipped_uploads),
+            "deduplicated_count": len(deduplicated_uploads),
+            "journal_path": journal_path if failed_uploads else None,
+            "filtered": filter_stats,
+            "dedupe": index.stats if index else None,
             "results": {
                 "success": successful_uploads,
-                "failed": failed_uploads
+                "failed": failed_uploads,
+                "skipped": skipped_uploads,
+                "deduplicated": deduplicated_uploads
             }
         }
         
@@ -169,4 +218,10 @@ def upload_folder(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, A
         return {
             "success": False,
             "message": f"Error uploading folder: {str(e)}"
-        } 
\ No newline at end of file
+        }
+    finally:
+        # Persist progress even when the walk is interrupted part-way
+        if journal is not None:
+            journal.close()
+        if index is not None:
+            index.close() 
\ No newline at end of file
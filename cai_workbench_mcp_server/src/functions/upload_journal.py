@@ -0,0 +1,99 @@
+"""Append-only on-disk journal that lets interrupted folder uploads resume."""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict
+
+from .metrics import record_cache
+
+DEFAULT_JOURNAL_DIR = os.path.join(os.path.expanduser("~"), ".cache", "cai_workbench_mcp", "upload_journals")
+DEFAULT_FSYNC_EVERY = 50
+
+
+def default_journal_path(host: str, project_id: str, folder_path: str) -> str:
+    """One journal per (host, project, source folder), kept outside the source tree."""
+    key = "\n".join([host or "", project_id or "", os.path.abspath(folder_path)])
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+    return os.path.join(os.environ.get("CAI_UPLOAD_JOURNAL_DIR", DEFAULT_JOURNAL_DIR), f"{digest}.jsonl")
+
+
+class UploadJournal:
+    """Records completed uploads as JSON lines: {"path", "size", "mtime"}.
+
+    Entries are appended as files complete; the file is flushed and fsynced every
+    fsync_every entries (and on close) so a crash loses at most one batch of
+    progress, which is simply uploaded again. A torn final line is cut off on load, so
+    the next entry starts on a line of its own.
+    """
+
+    def __init__(self, path: str, fsync_every: int = DEFAULT_FSYNC_EVERY):
+        self.path = path
+        self.fsync_every = max(1, int(fsync_every))
+        self.completed: Dict[str, Dict[str, Any]] = {}
+        self._handle = None
+        self._unsynced = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            complete = 0
+            with open(self.path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    complete += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(entry, dict) and entry.get("path"):
+                        self.completed[entry["path"]] = entry
+            if complete < os.path.getsize(self.path):
+                os.truncate(self.path, complete)
+        except FileNotFoundError:
+            pass
+
+    def is_done(self, relative_path: str, size: int, mtime: float) -> bool:
+        entry = self.completed.get(relative_path)
+        done = bool(entry) and entry.get("size") == size and entry.get("mtime") == mtime
+        record_cache("upload_journal", done)
+        return done
+
+    def record(self, relative_path: str, size: int, mtime: float) -> None:
+        if self._handle is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._handle = open(self.path, "a", encoding="utf-8")
+        entry = {"path": relative_path, "size": size, "mtime": mtime}
+        self._handle.write(json.dumps(entry) + "\n")
+        self.completed[relative_path] = entry
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        if self._handle is not None and self._unsynced:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+            self._unsynced = 0
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self.sync()
+            self._handle.close()
+            self._handle = None
+
+    def discard(self) -> None:
+        """Remove the journal once an upload finished with nothing left to resume."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        self.completed = {}
+
+
+def open_journal(path: str, reset: bool = False) -> UploadJournal:
+    if reset and path and os.path.exists(path):
+        os.remove(path)
+    return UploadJournal(path)
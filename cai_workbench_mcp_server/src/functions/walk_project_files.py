@@ -0,0 +1,144 @@
+"""Recursively list project files in Cloudera AI."""
+
+import fnmatch
+import posixpath
+from typing import Any, Dict, List, Optional
+
+try:
+    from cmlapi.rest import ApiException
+except ImportError:
+    class ApiException(Exception):
+        """Placeholder when cmlapi is not installed."""
+        status = None
+        body = None
+
+from .http_helpers import serialize_result, setup_client
+from .parallel import error_message, map_bounded, split_ids
+
+
+def _size(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def matches(path: str, patterns: List[str]) -> bool:
+    """Glob match against the full relative path, or the basename for slash-free patterns."""
+    name = posixpath.basename(path)
+    for pattern in patterns:
+        target = path if "/" in pattern else name
+        if fnmatch.fnmatchcase(target, pattern.strip("/")):
+            return True
+    return False
+
+
+def _entry_path(directory: str, raw_path: str) -> str:
+    # Listings may return names relative to the directory or full project paths.
+    raw_path = (raw_path or "").strip("/")
+    if not directory or raw_path == directory or raw_path.startswith(directory + "/"):
+        return raw_path
+    return posixpath.join(directory, posixpath.basename(raw_path))
+
+
+def walk_remote_tree(client: Any, project_id: str, root: str = "", max_depth: Optional[int] = None,
+                     include: Optional[List[str]] = None, exclude: Optional[List[str]] = None,
+                     max_workers: Any = None) -> Dict[str, Any]:
+    """Breadth-first walk of a project tree, listing each level's directories concurrently.
+
+    Excluded directories are pruned and never listed. Returns {"files", "directories",
+    "failed"}; file paths are relative to the project root.
+    """
+    include = include or []
+    exclude = exclude or []
+    files: List[Dict[str, Any]] = []
+    directories: List[str] = []
+    failed: List[Dict[str, Any]] = []
+    level = [root.strip("/")]
+    depth = 0
+
+    while level:
+        listings = map_bounded(
+            lambda directory: serialize_result(client.list_project_files(project_id, directory)) or {},
+            level,
+            max_workers,
+        )
+        next_level = []
+        for directory, (listing, error) in zip(level, listings, strict=True):
+            if error is not None:
+                failed.append({"path": directory, "error": error_message(error)})
+                continue
+            for item in listing.get("files") or []:
+                path = _entry_path(directory, item.get("path"))
+                if not path or matches(path, exclude):
+                    continue
+                if item.get("is_dir"):
+                    directories.append(path)
+                    if max_depth is None or depth < max_depth:
+                        next_level.append(path)
+                elif not include or matches(path, include):
+                    files.append({
+                        "path": path,
+                        "size": _size(item.get("file_size")),
+                        "mtime": item.get("last_modified"),
+                        "depth": depth,
+                    })
+        level = next_level
+        depth += 1
+
+    files.sort(key=lambda f: f["path"])
+    directories.sort()
+    return {"files": files, "directories": directories, "failed": failed}
+
+
+def walk_project_files(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively list a project directory into a flat manifest.
+
+    Args:
+        config: MCP configuration
+        params: Function parameters
+            - path: Directory to start from (default: project root)
+            - include: Glob patterns a file must match (list or comma-separated)
+            - exclude: Glob patterns for files and directories to skip
+            - max_depth: Levels of subdirectories to descend (default: unlimited)
+            - max_workers: Maximum concurrent directory listings (default 8)
+
+    Returns:
+        Dict with files (path, size, mtime, depth), directories and totals
+    """
+    params = params or {}
+    project_id = params.get("project_id") or config.get("project_id")
+    if not project_id:
+        return {"success": False, "message": "project_id is required"}
+    max_depth = params.get("max_depth")
+    try:
+        max_depth = int(max_depth) if max_depth not in (None, "") else None
+    except (TypeError, ValueError):
+        return {"success": False, "message": "max_depth must be an integer"}
+
+    try:
+        client = setup_client(config["host"], config["api_key"])
+        tree = walk_remote_tree(
+            client,
+            project_id,
+            root=params.get("path") or "",
+            max_depth=max_depth,
+            include=split_ids(params.get("include")),
+            exclude=split_ids(params.get("exclude")),
+            max_workers=params.get("max_workers"),
+        )
+        total_bytes = sum(f["size"] for f in tree["files"])
+        return {
+            "success": True,
+            "message": f"Found {len(tree['files'])} files in {len(tree['directories'])} directories",
+            "data": {
+                **tree,
+                "file_count": len(tree["files"]),
+                "directory_count": len(tree["directories"]),
+                "total_bytes": total_bytes,
+            },
+        }
+    except ApiException as e:
+        return {"success": False, "message": f"API error: {e.status} - {e.body}"}
+    except Exception as e:
+        return {"success": False, "message": f"Error: {str(e)}"}
@@ -10,7 +10,6 @@ import os
 import json
 import sys
 from typing import Dict, Any
-from fastmcp import FastMCP
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -19,6 +18,8 @@ load_dotenv()
 # Import all tool implementations
 try:
     # Package execution (uvx, -m module)
+    from .instrumentation import ThreadedFastMCP, ToolMetricsMiddleware
+    from .src.functions import metrics, profiler, slow_calls, timing, tracing
     from .src.functions.upload_folder import upload_folder
     from .src.functions.upload_file import upload_file
     from .src.functions.create_job import create_job
@@ -124,8 +125,19 @@ try:
     from .src.functions.update_job import update_job
     from .src.functions.update_project import update_project
     from .src.functions.update_project_file_metadata import update_project_file_metadata
+    from .src.functions.batch_create_job_runs import batch_create_job_runs
+    from .src.functions.run_job_dag import run_job_dag
+    from .src.functions.list_across_projects import list_across_projects
+    from .src.functions.bulk_get_experiment_run_metrics import bulk_get_experiment_run_metrics
+    from .src.functions.experiment_leaderboard import experiment_leaderboard
+    from .src.functions.log_experiment_runs_buffered import log_experiment_runs_buffered
+    from .src.functions.walk_project_files import walk_project_files
+    from .src.functions.download_folder import download_folder
+    from .src.functions.delete_project_files import delete_project_files
 except ImportError:
     # Direct execution (python cai_workbench_mcp_server/stdio_server.py)
+    from instrumentation import ThreadedFastMCP, ToolMetricsMiddleware
+    from src.functions import metrics, profiler, slow_calls, timing, tracing
     from src.functions.upload_folder import upload_folder
     from src.functions.upload_file import upload_file
     from src.functions.create_job import create_job
@@ -231,6 +243,15 @@ except ImportError:
     from src.functions.update_job import update_job
     from src.functions.update_project import update_project
     from src.functions.update_project_file_metadata import update_project_file_metadata
+    from src.functions.batch_create_job_runs import batch_create_job_runs
+    from src.functions.run_job_dag import run_job_dag
+    from src.functions.list_across_projects import list_across_projects
+    from src.functions.bulk_get_experiment_run_metrics import bulk_get_experiment_run_metrics
+    from src.functions.experiment_leaderboard import experiment_leaderboard
+    from src.functions.log_experiment_runs_buffered import log_experiment_runs_buffered
+    from src.functions.walk_project_files import walk_project_files
+    from src.functions.download_folder import download_folder
+    from src.functions.delete_project_files import delete_project_files
 
 
 def get_config() -> Dict[str, str]:
@@ -243,16 +264,18 @@ def get_config() -> Dict[str, str]:
                 return f.read().strip()
         return os.environ.get(env_var, "")
     
-    return {
-        "host": read_secret_or_env("cai_workbench_host", "CAI_WORKBENCH_HOST"),
-        "api_key": read_secret_or_env("cai_workbench_api_key", "CAI_WORKBENCH_API_KEY"),
-        "project_id": read_secret_or_env("cai_workbench_project_id", "CAI_WORKBENCH_PROJECT_ID"),
-        "team": read_secret_or_env("cai_workbench_team", "CAI_WORKBENCH_TEAM"),
-    }
+    with timing.phase("config_load"):
+        return {
+            "host": read_secret_or_env("cai_workbench_host", "CAI_WORKBENCH_HOST"),
+            "api_key": read_secret_or_env("cai_workbench_api_key", "CAI_WORKBENCH_API_KEY"),
+            "project_id": read_secret_or_env("cai_workbench_project_id", "CAI_WORKBENCH_PROJECT_ID"),
+            "team": read_secret_or_env("cai_workbench_team", "CAI_WORKBENCH_TEAM"),
+        }
 
 
 # Initialize FastMCP server
-mcp = FastMCP("cloudera-ml")
+mcp = ThreadedFastMCP("cloudera-ml")
+mcp.add_middleware(ToolMetricsMiddleware())
 
 # ==============================================================================
 # MCP TOOL DEFINITIONS - All 48 tools
@@ -260,14 +283,32 @@ mcp = FastMCP("cloudera-ml")
 
 # File Operations
 @mcp.tool()
-def upload_folder_tool(folder_path: str, ignore_folders: str = None, project_id: str = None) -> str:
+def upload_folder_tool(folder_path: str, ignore_folders: str = None, project_id: str = None,
+                       resume: bool = True, reset_journal: bool = False, ignore_patterns: str = None,
+                       max_file_size: int = None, include_extensions: str = None,
+                       exclude_extensions: str = None, dedupe: bool = False) -> str:
     """
     Upload a folder to Cloudera AI.
+
+    Completed files are recorded in a local journal, so re-running an interrupted
+    upload with the same folder and project skips files that were already sent.
+    .gitignore and .caiignore files in the folder are honoured, and ignored
+    directories (e.g. .venv, __pycache__) are skipped without being scanned.
     
     Args:
         folder_path: Local path to the folder to upload
-        ignore_folders: Comma-separated list of folders to ignore (optional)
+        ignore_folders: Comma-separated list of folder names to ignore (optional - defaults to
+            .git, node_modules, .vscode, dist, out, __pycache__, .venv, .ipynb_checkpoints and *.pyc)
+        ignore_patterns: Comma-separated gitignore-style patterns to skip, e.g. "*.parquet,/data/raw/"
+        max_file_size: Skip files larger than this many bytes (optional)
+        include_extensions: Only upload these extensions, e.g. "py,ipynb" (optional)
+        exclude_extensions: Never upload these extensions, e.g. "ckpt,pt" (optional)
+        dedupe: Skip files whose content hash matches what was last uploaded to the same
+            project path, using a local content index (default: False). Only deletes made
+            through this server's delete tools are known to the index.
         project_id: Project ID (optional - if not provided, uses default from configuration)
+        resume: Skip files already uploaded by an interrupted earlier run (default: True)
+        reset_journal: Discard the upload journal and upload every file again (default: False)
     
     Returns:
         JSON string with upload results
@@ -281,7 +322,14 @@ def upload_folder_tool(folder_path: str, ignore_folders: str = None, project_id:
     
     result = upload_folder(config, {
         "folder_path": folder_path,
-        "ignore_folders": ignore_list
+        "ignore_folders": ignore_list,
+        "resume": resume,
+        "reset_journal": reset_journal,
+        "ignore_patterns": ignore_patterns,
+        "max_file_size": max_file_size,
+        "include_extensions": include_extensions,
+        "exclude_extensions": exclude_extensions,
+        "dedupe": dedupe
     })
     return json.dumps(result, indent=2)
 
@@ -332,6 +380,37 @@ def list_project_files_tool(project_id: str, path: str = "") -> str:
     result = list_project_files(config, params)
     return json.dumps(result, indent=2)
 
+@mcp.tool()
+def walk_project_files_tool(project_id: str, path: str = "", include: str = None, exclude: str = None,
+                            max_depth: int = None, max_workers: int = 8) -> str:
+    """
+    Recursively list a Cloudera AI project directory as a flat manifest.
+
+    Subdirectories of each level are listed concurrently. Excluded directories
+    are pruned without being listed.
+
+    Args:
+        project_id: ID of the project
+        path: Directory to start from (default: project root)
+        include: Comma-separated glob patterns files must match (e.g. "*.py,notebooks/*.ipynb")
+        exclude: Comma-separated glob patterns for files or directories to skip (e.g. ".git,*.pyc")
+        max_depth: Levels of subdirectories to descend; 0 lists only path (default: unlimited)
+        max_workers: Maximum concurrent directory listings (default: 8)
+
+    Returns:
+        JSON string with files (path, size, mtime, depth), directories and total counts/bytes
+    """
+    config = get_config()
+    result = walk_project_files(config, {
+        "project_id": project_id,
+        "path": path,
+        "include": include,
+        "exclude": exclude,
+        "max_depth": max_depth,
+        "max_workers": max_workers,
+    })
+    return json.dumps(result, indent=2)
+
 @mcp.tool()
 def delete_project_file_tool(file_path: str, project_id: str = None) -> str:
     """
@@ -356,6 +435,35 @@ def delete_project_file_tool(file_path: str, project_id: str = None) -> str:
     
     return json.dumps(result, indent=2)
 
+@mcp.tool()
+def delete_project_files_tool(paths: str, project_id: str = None, dry_run: bool = False,
+                              max_workers: int = 8) -> str:
+    """
+    Delete many files or directories from a Cloudera AI project in one call.
+
+    Glob patterns are expanded by listing the project recursively and use
+    gitignore syntax: "*.pyc" matches at any depth, "**/__pycache__" matches
+    directories anywhere, "data/tmp/*.csv" is anchored to the project root.
+    Deletes run concurrently.
+
+    Args:
+        paths: Comma-separated project paths and/or glob patterns
+        project_id: ID of the project (optional if not provided, uses default from configuration)
+        dry_run: Only list the paths that would be deleted (default: False)
+        max_workers: Maximum concurrent delete requests (default: 8)
+
+    Returns:
+        JSON string with a per-path outcome (deleted, not_found or failed)
+    """
+    config = get_config()
+    result = delete_project_files(config, {
+        "project_id": project_id,
+        "paths": paths,
+        "dry_run": dry_run,
+        "max_workers": max_workers,
+    })
+    return json.dumps(result, indent=2)
+
 @mcp.tool()
 def update_project_file_metadata_tool(file_path: str, description: str = None,
                                      hidden: bool = None, project_id: str = None) -> str:
@@ -616,6 +724,76 @@ def create_job_run_tool(project_id: str, job_id: str,
     result = create_job_run(config, params)
     return json.dumps(result, indent=2)
 
+@mcp.tool()
+def batch_create_job_runs_tool(job_ids: str = None, search_filter: str = None,
+                               environment_variables: str = None, job_overrides: str = None,
+                               max_workers: int = 8, project_id: str = None) -> str:
+    """
+    Start runs for many jobs at once with bounded concurrency.
+
+    Args:
+        job_ids: Comma-separated list of job IDs to run (optional if search_filter is given)
+        search_filter: list_jobs search filter JSON used to select jobs when job_ids is empty
+        environment_variables: JSON string with environment variables applied to every run (optional)
+        job_overrides: JSON object mapping job_id to per-run overrides
+            (environment_variables, runtime_identifier, override_config) (optional)
+        max_workers: Maximum number of runs started concurrently (default: 8)
+        project_id: Project ID (optional - if not provided, uses default from configuration)
+
+    Returns:
+        JSON string with started run IDs and per-job failures
+    """
+    config = get_config()
+    if project_id:
+        config["project_id"] = project_id
+
+    result = batch_create_job_runs(config, {
+        "job_ids": job_ids,
+        "search_filter": search_filter,
+        "environment_variables": environment_variables,
+        "job_overrides": job_overrides,
+        "max_workers": max_workers,
+    })
+    return json.dumps(result, indent=2)
+
+@mcp.tool()
+def run_job_dag_tool(dag: str, on_failure: str = "fail_fast", max_parallel: int = 4,
+                     poll_interval: int = 10, timeout: int = 3600,
+                     environment_variables: str = None, job_overrides: str = None,
+                     project_id: str = None) -> str:
+    """
+    Run a dependency graph of jobs, launching every job whose dependencies have succeeded.
+
+    Args:
+        dag: JSON object mapping job_id to a list of job IDs it depends on,
+            e.g. {"train": ["extract"], "report": ["train"]}
+        on_failure: "fail_fast" to stop launching after the first failure, or "continue"
+            to keep running branches that do not depend on the failed job (default: fail_fast)
+        max_parallel: Maximum number of job runs in flight at once (default: 4)
+        poll_interval: Seconds between batched run status polls (default: 10)
+        timeout: Overall time budget in seconds (default: 3600)
+        environment_variables: JSON string with environment variables applied to every run (optional)
+        job_overrides: JSON object mapping job_id to per-run overrides (optional)
+        project_id: Project ID (optional - if not provided, uses default from configuration)
+
+    Returns:
+        JSON string with per-job outcomes and a critical-path timing report
+    """
+    config = get_config()
+    if project_id:
+        config["project_id"] = project_id
+
+    result = run_job_dag(config, {
+        "dag": dag,
+        "on_failure": on_failure,
+        "max_parallel": max_parallel,
+        "poll_interval": poll_interval,
+        "timeout": timeout,
+        "environment_variables": environment_variables,
+        "job_overrides": job_overrides,
+    })
+    return json.dumps(result, indent=2)
+
 @mcp.tool()
 def list_job_runs_tool(job_id: str = None, project_id: str = None) -> str:
     """
@@ -719,6 +897,75 @@ def list_projects_tool() -> str:
     result = get_project_id(config, {"project_name": "*"})
     return json.dumps(result, indent=2)
 
+@mcp.tool()
+def list_jobs_across_projects_tool(status: str = None, project_name: str = None,
+                                   max_workers: int = 8) -> str:
+    """
+    List jobs in every accessible project, fetching projects concurrently.
+
+    Args:
+        status: Comma-separated status filters matched case-insensitively (e.g. "running,scheduling") (optional)
+        project_name: Only include projects whose name contains this text (optional)
+        max_workers: Maximum number of projects queried concurrently (default: 8)
+
+    Returns:
+        JSON string with jobs tagged with project_id and project_name
+    """
+    config = get_config()
+    result = list_across_projects(config, {
+        "resource": "jobs",
+        "status": status,
+        "project_name": project_name,
+        "max_workers": max_workers,
+    })
+    return json.dumps(result, indent=2)
+
+@mcp.tool()
+def list_applications_across_projects_tool(status: str = None, project_name: str = None,
+                                           max_workers: int = 8) -> str:
+    """
+    List applications in every accessible project, fetching projects concurrently.
+
+    Args:
+        status: Comma-separated status filters matched case-insensitively (e.g. "running") (optional)
+        project_name: Only include projects whose name contains this text (optional)
+        max_workers: Maximum number of projects queried concurrently (default: 8)
+
+    Returns:
+        JSON string with applications tagged with project_id and project_name
+    """
+    config = get_config()
+    result = list_across_projects(config, {
+        "resource": "applications",
+        "status": status,
+        "project_name": project_name,
+        "max_workers": max_workers,
+    })
+    return json.dumps(result, indent=2)
+
+@mcp.tool()
+def list_model_deployments_across_projects_tool(status: str = None, project_name: str = None,
+                                                max_workers: int = 8) -> str:
+    """
+    List model deployments in every accessible project, fetching projects concurrently.
+
+    Args:
+        status: Comma-separated status filters matched case-insensitively (e.g. "deployed") (optional)
+        project_name: Only include projects whose name contains this text (optional)
+        max_workers: Maximum number of projects queried concurrently (default: 8)
+
+    Returns:
+        JSON string with model deployments tagged with project_id and project_name
+    """
+    config = get_config()
+    result = list_across_projects(config, {
+        "resource": "model_deployments",
+        "status": status,
+        "project_name": project_name,
+        "max_workers": max_workers,
+    })
+    return json.dumps(result, indent=2)
+
 @mcp.tool()
 def update_project_tool(name: str = None, summary: str = None, template: str = None,
                        public: bool = None, disable_git_repo: bool = None, 
@@ -1066,32 +1313,56 @@ def delete_experiment_run_tool(experiment_id: str, run_id: str, project_id: str
     return json.dumps(result, indent=2)
 
 @mcp.tool()
-def delete_experiment_run_batch_tool(experiment_id: str, run_ids: str, project_id: str = None) -> str:
+def delete_experiment_run_batch_tool(experiment_id: str, run_ids: str = None, project_id: str = None,
+                                     older_than_days: float = None, status: str = None,
+                                     metric_key: str = None, metric_below: float = None,
+                                     metric_above: float = None, search_filter: str = None,
+                                     dry_run: bool = False, chunk_size: int = 100,
+                                     max_workers: int = 8) -> str:
     """
-    Delete multiple experiment runs in a single request.
-    
+    Delete experiment runs, by ID or by selector, in concurrent chunks.
+
+    Either pass run_ids, or leave it empty and select runs with any combination of
+    older_than_days, status, metric_key + metric_below/metric_above and search_filter
+    (a run must match every given criterion). Use dry_run to preview the selection.
+
     Args:
         experiment_id: ID of the experiment containing the runs
-        run_ids: Comma-separated list of run IDs to delete
+        run_ids: Comma-separated list of run IDs to delete (optional in selector mode)
         project_id: ID of the project (optional if not provided, uses default from configuration)
-    
+        older_than_days: Select runs started more than this many days ago
+        status: Comma-separated run statuses to select (exact, case-insensitive, e.g. "FAILED,KILLED")
+        metric_key: Metric used with metric_below / metric_above
+        metric_below: Select runs whose metric_key value is below this threshold
+        metric_above: Select runs whose metric_key value is above this threshold
+        search_filter: list_experiment_runs search filter applied before selection
+        dry_run: Only report the runs that would be deleted (default: False)
+        chunk_size: Run IDs per delete request (default: 100, max: 1000)
+        max_workers: Maximum concurrent delete requests (default: 8)
+
     Returns:
-        JSON string with operation result
+        JSON string with deleted/failed counts and per-chunk results
     """
     config = get_config()
-    
+
     if project_id:
         config["project_id"] = project_id
-        
-    # Convert comma-separated string to list
-    run_ids_list = [run_id.strip() for run_id in run_ids.split(",")]
-    
+
     result = delete_experiment_run_batch(config, {
         "experiment_id": experiment_id,
-        "run_ids": run_ids_list,
-        "project_id": project_id or config.get("project_id", "")
+        "run_ids": run_ids,
+        "project_id": project_id or config.get("project_id", ""),
+        "older_than_days": older_than_days,
+        "status": status,
+        "metric_key": metric_key,
+        "metric_below": metric_below,
+        "metric_above": metric_above,
+        "search_filter": search_filter,
+        "dry_run": dry_run,
+        "chunk_size": chunk_size,
+        "max_workers": max_workers,
     })
-    
+
     return json.dumps(result, indent=2)
 
 @mcp.tool()
@@ -1133,6 +1404,41 @@ def log_experiment_run_batch_tool(experiment_id: str, run_updates: str, project_
     result = log_experiment_run_batch(config, params)
     return json.dumps(result, indent=2)
 
+@mcp.tool()
+def log_experiment_runs_buffered_tool(experiment_id: str, updates: str, project_id: str = None,
+                                      max_batch_entries: int = 1000, max_retries: int = 3) -> str:
+    """
+    Log many metric/param/tag updates for experiment runs with automatic batching.
+
+    Updates for the same run are merged, then sent in chunks that respect the
+    per-request limits (1000 metrics, 100 params, 100 tags, 1000 entries total).
+    Chunks that fail with 429, 5xx or a connection error are retried with backoff.
+
+    Args:
+        experiment_id: ID of the experiment containing the runs
+        updates: JSON array of update objects, each with:
+            - run_id: ID of the run to update
+            - metrics (optional): {"key": value} dict or list of {key, value, step, timestamp}
+            - params (optional): {"key": value} dict of parameters
+            - tags (optional): {"key": value} dict of tags
+            - step / timestamp (optional): Defaults applied to dict-form metrics
+        project_id: ID of the project (optional - uses default from configuration)
+        max_batch_entries: Maximum entries per request (default and maximum: 1000)
+        max_retries: Retries per failed chunk (default: 3)
+
+    Returns:
+        JSON string with request and entry counts and any chunks that still failed
+    """
+    config = get_config()
+    result = log_experiment_runs_buffered(config, {
+        "project_id": project_id,
+        "experiment_id": experiment_id,
+        "updates": updates,
+        "max_batch_entries": max_batch_entries,
+        "max_retries": max_retries,
+    })
+    return json.dumps(result, indent=2)
+
 # Model Management
 @mcp.tool()
 def list_models_tool(project_id: str = None) -> str:
@@ -1878,9 +2184,54 @@ def list_experiment_runs_tool(project_id: str, experiment_id: str, search_filter
     return json.dumps(result, indent=2)
 
 @mcp.tool()
-def get_experiment_run_metrics_tool(project_id: str, experiment_id: str, run_id: str, metric_key: str) -> str:
+def experiment_leaderboard_tool(project_id: str, experiment_id: str, rank_by: str = None,
+                                minimize: str = None, metric_keys: str = None, top_n: int = 20,
+                                search_filter: str = None) -> str:
     """
-    get_experiment_run_metrics tool.
+    Rank the runs of an experiment and summarize their metrics.
+
+    Args:
+        project_id: ID of the project
+        experiment_id: ID of the experiment
+        rank_by: Metric key to rank by (optional - defaults to the first metric key)
+        minimize: Comma-separated metric keys where lower is better, e.g. "loss,rmse" (optional)
+        metric_keys: Comma-separated metric keys to include (optional - defaults to all)
+        top_n: Number of ranked rows to return (default: 20)
+        search_filter: list_experiment_runs search filter (optional)
+
+    Returns:
+        JSON string with a ranked table, best run per metric, summary statistics
+        and parameter/metric correlations
+    """
+    config = get_config()
+    result = experiment_leaderboard(config, {
+        "project_id": project_id,
+        "experiment_id": experiment_id,
+        "rank_by": rank_by,
+        "minimize": minimize,
+        "metric_keys": metric_keys,
+        "top_n": top_n,
+        "search_filter": search_filter,
+    })
+    return json.dumps(result, indent=2)
+
+@mcp.tool()
+def get_experiment_run_metrics_tool(project_id: str, experiment_id: str, run_id: str, metric_key: str,
+                                    max_points: int = None, downsample: str = "lttb") -> str:
+    """
+    Get the recorded values of one metric for an experiment run.
+
+    Args:
+        project_id: ID of the project
+        experiment_id: ID of the experiment
+        run_id: ID of the run
+        metric_key: Metric key to fetch
+        max_points: Downsample long series to at most this many points (optional)
+        downsample: Downsampling method, "lttb" (shape-preserving) or "minmax" (default: lttb)
+
+    Returns:
+        JSON string with the metric points; when max_points is set, also a summary
+        (count, min, max, last, slope) computed over the full series
     """
     config = get_config()
     
@@ -1893,11 +2244,43 @@ def get_experiment_run_metrics_tool(project_id: str, experiment_id: str, run_id:
         params_dict['run_id'] = run_id
     if metric_key is not None:
         params_dict['metric_key'] = metric_key
+    if max_points is not None:
+        params_dict['max_points'] = max_points
+    if downsample is not None:
+        params_dict['downsample'] = downsample
 
-        
     result = get_experiment_run_metrics(config, params_dict)
     return json.dumps(result, indent=2)
 
+@mcp.tool()
+def bulk_get_experiment_run_metrics_tool(project_id: str, experiment_id: str, metric_keys: str,
+                                         run_ids: str = None, reduce: str = "last",
+                                         max_workers: int = 8) -> str:
+    """
+    Fetch several metrics for many experiment runs in one call.
+
+    Args:
+        project_id: ID of the project
+        experiment_id: ID of the experiment containing the runs
+        metric_keys: Comma-separated metric keys (e.g. "loss,accuracy")
+        run_ids: Comma-separated run IDs (optional - defaults to every run in the experiment)
+        reduce: How each metric history becomes one value: last, min, max or mean (default: last)
+        max_workers: Maximum number of concurrent metric requests (default: 8)
+
+    Returns:
+        JSON string with a run x metric matrix aligned to run_ids and metric_keys
+    """
+    config = get_config()
+    result = bulk_get_experiment_run_metrics(config, {
+        "project_id": project_id,
+        "experiment_id": experiment_id,
+        "metric_keys": metric_keys,
+        "run_ids": run_ids,
+        "reduce": reduce,
+        "max_workers": max_workers,
+    })
+    return json.dumps(result, indent=2)
+
 @mcp.tool()
 def list_all_jobs_tool(search_filter: str = None, page_size: int = None, page_token: str = None) -> str:
     """
@@ -2021,9 +2404,25 @@ def restart_model_deployment_tool(project_id: str, model_id: str, build_id: str,
     return json.dumps(result, indent=2)
 
 @mcp.tool()
-def download_project_file_tool(project_id: str, path: str) -> str:
+def download_project_file_tool(project_id: str, path: str, local_path: str = None,
+                               max_bytes: int = None, preview: str = None) -> str:
     """
-    download_project_file tool.
+    Download a file from a Cloudera AI project.
+
+    By default the full content is returned inline. For large or binary files pass
+    local_path to stream the file to disk (only metadata is returned), or use
+    max_bytes / preview to return just the head or tail of a text file.
+
+    Args:
+        project_id: ID of the project
+        path: Path of the file within the project
+        local_path: Local file to stream the download to (optional)
+        max_bytes: Maximum bytes of content to return in preview mode (default: 65536)
+        preview: "head" or "tail" (optional - defaults to head when max_bytes is set)
+
+    Returns:
+        JSON string with the content, a preview, or download metadata
+        (local_path, bytes, duration_seconds, sha256)
     """
     config = get_config()
     
@@ -2032,11 +2431,53 @@ def download_project_file_tool(project_id: str, path: str) -> str:
         params_dict['project_id'] = project_id
     if path is not None:
         params_dict['path'] = path
+    if local_path is not None:
+        params_dict['local_path'] = local_path
+    if max_bytes is not None:
+        params_dict['max_bytes'] = max_bytes
+    if preview is not None:
+        params_dict['preview'] = preview
 
-        
     result = download_project_file(config, params_dict)
     return json.dumps(result, indent=2)
 
+@mcp.tool()
+def download_folder_tool(local_dir: str, project_id: str = None, path: str = "", include: str = None,
+                         exclude: str = None, max_depth: int = None, overwrite: bool = False,
+                         max_workers: int = 8) -> str:
+    """
+    Download a Cloudera AI project directory to a local folder.
+
+    The remote tree is listed recursively and files are streamed to disk
+    concurrently. Files whose local size and mtime already match are skipped,
+    so re-running the tool only fetches what changed.
+
+    Args:
+        local_dir: Local directory to download into (created if missing)
+        project_id: ID of the project (optional - uses default from configuration)
+        path: Project directory to download (default: project root)
+        include: Comma-separated glob patterns files must match (optional)
+        exclude: Comma-separated glob patterns for files or directories to skip (optional)
+        max_depth: Levels of subdirectories to descend (default: unlimited)
+        overwrite: Download even when the local copy already matches (default: False)
+        max_workers: Maximum concurrent downloads (default: 8)
+
+    Returns:
+        JSON string with downloaded/skipped/failed files, bytes and throughput
+    """
+    config = get_config()
+    result = download_folder(config, {
+        "project_id": project_id,
+        "local_dir": local_dir,
+        "path": path,
+        "include": include,
+        "exclude": exclude,
+        "max_depth": max_depth,
+        "overwrite": overwrite,
+        "max_workers": max_workers,
+    })
+    return json.dumps(result, indent=2)
+
 
 @mcp.tool()
 def list_registered_models_tool(search_filter: str = None, sort: str = None, page_size: int = None, page_token: str = None) -> str:
@@ -2548,9 +2989,18 @@ def main():
     # For STDIO, only log to stderr
     print(f"Starting Cloudera AI Workbench MCP Server (STDIO mode)...", file=sys.stderr)
     print(f"Connected to: {config['host']}", file=sys.stderr)
-    print("105 tools available", file=sys.stderr)
+    print("116 tools available", file=sys.stderr)
     print("🔒 Secure Transport: Using environment variables for authentication", file=sys.stderr)
     
+    if tracing.configure_tracing(service_name="cai-workbench-mcp-stdio"):
+        print(f"Tracing enabled ({os.getenv('CAI_MCP_TRACING')})", file=sys.stderr)
+
+    if slow_calls.configure_slow_call_log():
+        print(f"Logging tool calls slower than {slow_calls.threshold_ms():g} ms", file=sys.stderr)
+
+    if profiler.start_from_env(metrics.total_tool_calls):
+        print(f"Profiling to {os.getenv('CAI_MCP_PROFILE')}", file=sys.stderr)
+
     # Run STDIO server (default transport)
     mcp.run()
 
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""Per-tool latency benchmark across transports, against the local mock CML API.
+
+Starts scripts/mock_cml_api.py in-process, points the servers at it
+and calls a representative set of tools through each transport:
+
+  direct     the implementation function plus json.dumps (no MCP at all)
+  inprocess  FastMCP Client on the stdio server object (as tests/test_cai_mcp_client.py)
+  stdio      FastMCP Client over a real stdio subprocess (python -m ...stdio_server)
+  http       JSON-RPC tools/call POSTs to /mcp-api on an http_server subprocess
+
+For each (transport, tool) it reports p50/p95/p99/mean latency and throughput, and
+the transport overhead as the p50 difference against "direct". Results are written
+as JSON so runs from different commits can be compared with --compare.
+
+Usage:
+  .venv/bin/python scripts/bench_tools.py [--iterations 50] [--latency-ms 20] \
+      [--transports direct,inprocess,stdio,http] [--output bench-tools.json] \
+      [--compare previous.json --fail-on-regression 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+from cai_workbench_mcp_server.src.functions import (  # noqa: E402
+    get_project_id,
+    list_all_experiments,
+    list_jobs,
+    list_project_files,
+    upload_folder,
+)
+from mock_cml_api import MockCMLServer  # noqa: E402
+
+TRANSPORTS = ("direct", "inprocess", "stdio", "http")
+PROJECT_ID = "proj-00000"
+
+
+def tool_cases(upload_dir: str) -> List[Dict[str, Any]]:
+    """Tools to benchmark: MCP name, MCP arguments and the equivalent direct call."""
+    upload = {"folder_path": upload_dir, "project_id": PROJECT_ID, "resume": False, "dedupe": False}
+    return [
+        {"tool": "get_project_id_tool", "arguments": {"project_name": "project-7"},
+         "direct": (get_project_id, {"project_name": "project-7"})},
+        {"tool": "list_jobs_tool", "arguments": {"project_id": PROJECT_ID},
+         "direct": (list_jobs, {"project_id": PROJECT_ID})},
+        {"tool": "list_all_experiments_tool", "arguments": {"page_size": 100},
+         "direct": (list_all_experiments, {"page_size": 100})},
+        {"tool": "list_project_files_tool", "arguments": {"project_id": PROJECT_ID, "path": "data/part-0"},
+         "direct": (list_project_files, {"project_id": PROJECT_ID, "path": "data/part-0"})},
+        {"tool": "upload_folder_tool", "arguments": upload, "direct": (upload_folder, upload), "iterations": 5},
+    ]
+
+
+def summarize(samples: List[float], wall_seconds: float, errors: int, tool_errors: int) -> Dict[str, Any]:
+    """Latency percentiles in milliseconds plus calls/second over the measured wall time."""
+    if not samples:
+        return {"calls": 0, "errors": errors, "tool_errors": tool_errors}
+    ms = np.asarray(samples) * 1000.0
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {
+        "calls": len(samples),
+        "errors": errors,
+        "tool_errors": tool_errors,
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "mean_ms": round(float(ms.mean()), 3),
+        "min_ms": round(float(ms.min()), 3),
+        "max_ms": round(float(ms.max()), 3),
+        "throughput_per_s": round(len(samples) / wall_seconds, 2) if wall_seconds else None,
+    }
+
+
+def tool_failed(text: str) -> bool:
+    """True when the tool answered with {"success": false} or a plain error string."""
+    try:
+        payload = json.loads(text)
+    except (TypeError, ValueError):
+        return str(text).startswith("Error")
+    return isinstance(payload, dict) and payload.get("success") is False
+
+
+async def _measure(call: Callable[[], Any], iterations: int, warmup: int) -> Dict[str, Any]:
+    """Run call() warmup + iterations times sequentially; call returns the tool's text result."""
+    samples: List[float] = []
+    errors = tool_errors = 0
+    for _ in range(warmup):
+        try:
+            await call()
+        except Exception:
+            pass
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        try:
+            text = await call()
+        except Exception:
+            errors += 1
+            continue
+        samples.append(time.perf_counter() - t0)
+        tool_errors += tool_failed(text)
+    return summarize(samples, time.perf_counter() - started, errors, tool_errors)
+
+
+def _config(env: Dict[str, str]) -> Dict[str, str]:
+    return {"host": env["CAI_WORKBENCH_HOST"], "api_key": env["CAI_WORKBENCH_API_KEY"],
+            "project_id": env["CAI_WORKBENCH_PROJECT_ID"], "team": ""}
+
+
+async def bench_direct(cases, env, iterations, warmup):
+    config = _config(env)
+    results = {}
+    for case in cases:
+        func, params = case["direct"]
+
+        async def call(func=func, params=params):
+            return json.dumps(func(dict(config), dict(params)), indent=2)
+
+        results[case["tool"]] = await _measure(call, case.get("iterations", iterations), warmup)
+    return results
+
+
+async def _bench_fastmcp_client(client, cases, iterations, warmup):
+    results = {}
+    async with client:
+        for case in cases:
+            async def call(case=case):
+                result = await client.call_tool(case["tool"], case["arguments"])
+                return result.content[0].text if result.content else ""
+
+            results[case["tool"]] = await _measure(call, case.get("iterations", iterations), warmup)
+    return results
+
+
+async def bench_inprocess(cases, env, iterations, warmup):
+    from fastmcp import Client
+
+    from cai_workbench_mcp_server.stdio_server import mcp
+
+    return await _bench_fastmcp_client(Client(mcp), cases, iterations, warmup)
+
+
+async def bench_stdio(cases, env, iterations, warmup):
+    from fastmcp import Client
+    from fastmcp.client.transports import StdioTransport
+
+    transport = StdioTransport(sys.executable, ["-m", "cai_workbench_mcp_server.stdio_server"],
+                               env=env, cwd=str(_REPO_ROOT))
+    return await _bench_fastmcp_client(Client(transport), cases, iterations, warmup)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_http_server(env: Dict[str, str], timeout: float = 60.0):
+    """Launch http_server on a free local port and wait until /test answers."""
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "cai_workbench_mcp_server.http_server"],
+        env={**env, "CAI_MCP_HOST": "127.0.0.1", "CAI_MCP_PORT": str(port)},
+        cwd=str(_REPO_ROOT), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"http_server exited with code {proc.returncode}")
+        try:
+            if httpx.get(f"{base}/test", timeout=1.0).status_code == 200:
+                return proc, base
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("http_server did not become ready")
+
+
+def stop_process(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+async def bench_http(cases, env, iterations, warmup, base_url: Optional[str] = None):
+    proc = None
+    if base_url is None:
+        proc, base_url = start_http_server(env)
+    results = {}
+    try:
+        async with httpx.AsyncClient(base_url=base_url, timeout=120.0) as client:
+            for case in cases:
+                async def call(case=case):
+                    response = await client.post("/mcp-api", json={
+                        "jsonrpc": "2.0", "id": 1, "method": "tools/call",
+                        "params": {"name": case["tool"], "arguments": case["arguments"]},
+                    })
+                    response.raise_for_status()
+                    result = response.json()["result"]
+                    if result.get("isError"):
+                        raise RuntimeError(result["content"][0]["text"])
+                    return result["content"][0]["text"]
+
+                results[case["tool"]] = await _measure(call, case.get("iterations", iterations), warmup)
+    finally:
+        if proc is not None:
+            stop_process(proc)
+    return results
+
+
+RUNNERS = {"direct": bench_direct, "inprocess": bench_inprocess, "stdio": bench_stdio, "http": bench_http}
+
+
+def transport_overhead(results: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    baseline = results.get("direct") or {}
+    overhead: Dict[str, Dict[str, float]] = {}
+    for transport, tools in results.items():
+        if transport == "direct":
+            continue
+        for tool, stats in tools.items():
+            base = baseline.get(tool, {})
+            if "p50_ms" in stats and "p50_ms" in base:
+                overhead.setdefault(transport, {})[tool] = round(stats["p50_ms"] - base["p50_ms"], 3)
+    return overhead
+
+
+def compare(current: Dict[str, Any], previous: Dict[str, Any], threshold_pct: Optional[float]) -> int:
+    """Print p50/p95 changes against a previous results file; 1 if any exceed threshold_pct."""
+    regressions = 0
+    print(f"{'transport':<10} {'tool':<28} {'p50 ms':>18} {'p95 ms':>18}")
+    for transport, tools in current["results"].items():
+        for tool, stats in tools.items():
+            old = previous.get("results", {}).get(transport, {}).get(tool)
+            if not old or "p50_ms" not in old or "p50_ms" not in stats:
+                continue
+            cells = []
+            for key in ("p50_ms", "p95_ms"):
+                change = (stats[key] - old[key]) / old[key] * 100 if old[key] else 0.0
+                cells.append(f"{old[key]:.2f}->{stats[key]:.2f} ({change:+.0f}%)")
+                if key == "p50_ms" and threshold_pct is not None and change > threshold_pct:
+                    regressions += 1
+            print(f"{transport:<10} {tool:<28} {cells[0]:>18} {cells[1]:>18}")
+    return 1 if regressions else 0
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=_REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--transports", default=",".join(TRANSPORTS))
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="mock API latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=2.0)
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--output", default="bench-tools.json")
+    parser.add_argument("--compare", help="previous results file to diff against")
+    parser.add_argument("--fail-on-regression", type=float, default=None, metavar="PCT",
+                        help="exit 1 when a p50 grows by more than PCT percent vs --compare")
+    args = parser.parse_args()
+
+    transports = [t.strip() for t in args.transports.split(",") if t.strip()]
+    unknown = set(transports) - set(RUNNERS)
+    if unknown:
+        parser.error(f"unknown transports: {', '.join(sorted(unknown))}")
+
+    upload_dir = tempfile.mkdtemp(prefix="cai-bench-upload-")
+    for i in range(3):
+        Path(upload_dir, f"file_{i}.py").write_text("print('bench')\n" * 50, encoding="utf-8")
+
+    mock = MockCMLServer(projects=args.projects, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms).start()
+    # The client-side rate limiter would cap calls/second rather than measure them
+    env = {**os.environ, "CAI_WORKBENCH_HOST": mock.url, "CAI_WORKBENCH_API_KEY": "bench",
+           "CAI_WORKBENCH_PROJECT_ID": PROJECT_ID, "CAI_UPLOAD_JOURNAL_DIR": upload_dir + "-journal",
+           "CAI_MCP_RATE_LIMIT": os.environ.get("CAI_MCP_RATE_LIMIT", "off")}
+    os.environ.update({k: env[k] for k in ("CAI_WORKBENCH_HOST", "CAI_WORKBENCH_API_KEY",
+                                           "CAI_WORKBENCH_PROJECT_ID", "CAI_UPLOAD_JOURNAL_DIR",
+                                           "CAI_MCP_RATE_LIMIT")})
+    cases = tool_cases(upload_dir)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        for transport in transports:
+            print(f"benchmarking {transport} ...", file=sys.stderr)
+            results[transport] = asyncio.run(RUNNERS[transport](cases, env, args.iterations, args.warmup))
+    finally:
+        mock.stop()
+        shutil.rmtree(upload_dir, ignore_errors=True)
+        shutil.rmtree(upload_dir + "-journal", ignore_errors=True)
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cmlapi_available": importlib.util.find_spec("cmlapi") is not None,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "mock": {"latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "projects": args.projects},
+        },
+        "results": results,
+        "transport_overhead_p50_ms": transport_overhead(results),
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    for transport, tools in results.items():
+        for tool, stats in tools.items():
+            print(f"{transport:<10} {tool:<28} p50={stats.get('p50_ms')}ms p95={stats.get('p95_ms')}ms "
+                  f"p99={stats.get('p99_ms')}ms errors={stats['errors']} tool_errors={stats['tool_errors']}")
+    print(f"results written to {args.output}")
+    if not report["meta"]["cmlapi_available"]:
+        print("note: cmlapi is not installed, so cmlapi-backed tools only measure their error path",
+              file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            return compare(report, json.load(f), args.fail_on_regression)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
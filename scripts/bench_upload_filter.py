@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Benchmark upload path filtering on a synthetic project with a large virtualenv.
+
+Builds a throwaway tree (a few hundred source files next to a .venv with
+--venv-files files and some __pycache__ output), then times:
+
+  naive   os.walk over everything, fnmatch per file against the ignore patterns
+  pruned  walk_filtered with the compiled PathFilter, which never enters .venv
+
+Usage:
+  .venv/bin/python scripts/bench_upload_filter.py [--venv-files 100000] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+from cai_workbench_mcp_server.src.functions.path_filter import (  # noqa: E402
+    DEFAULT_IGNORE_PATTERNS,
+    PathFilter,
+    walk_filtered,
+)
+
+
+def build_tree(root: Path, venv_files: int, source_files: int = 300) -> None:
+    per_dir = 200
+    for i in range(venv_files):
+        package = root / ".venv" / "lib" / "site-packages" / f"pkg{i // per_dir}"
+        if i % per_dir == 0:
+            package.mkdir(parents=True, exist_ok=True)
+        (package / f"mod{i % per_dir}.py").write_bytes(b"x = 1\n")
+    for i in range(source_files):
+        module = root / "src" / f"area{i // 30}"
+        module.mkdir(parents=True, exist_ok=True)
+        (module / f"file{i}.py").write_bytes(b"print('hi')\n")
+        cache = module / "__pycache__"
+        cache.mkdir(exist_ok=True)
+        (cache / f"file{i}.cpython-311.pyc").write_bytes(b"\0" * 64)
+    (root / ".gitignore").write_text("*.log\n/build/\n", encoding="utf-8")
+
+
+def naive(root: Path) -> int:
+    patterns = [p.rstrip("/") for p in DEFAULT_IGNORE_PATTERNS] + ["*.log", "build"]
+    kept = 0
+    for current, _dirs, files in os.walk(root):
+        for name in files:
+            full = os.path.join(current, name)
+            relative = os.path.relpath(full, root)
+            os.stat(full)
+            if any(fnmatch.fnmatch(part, p) for part in Path(relative).parts for p in patterns):
+                continue
+            kept += 1
+    return kept
+
+
+def pruned(root: Path) -> int:
+    path_filter = PathFilter.from_directory(str(root), DEFAULT_IGNORE_PATTERNS)
+    return sum(1 for _ in walk_filtered(str(root), path_filter))
+
+
+def timed(func, root: Path, repeat: int):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(root)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--venv-files", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="cai-upload-bench-"))
+    try:
+        build_tree(root, args.venv_files)
+        naive_kept, naive_seconds = timed(naive, root, args.repeat)
+        pruned_kept, pruned_seconds = timed(pruned, root, args.repeat)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    results = {
+        "venv_files": args.venv_files,
+        "naive": {"files_kept": naive_kept, "seconds": round(naive_seconds, 4)},
+        "pruned": {"files_kept": pruned_kept, "seconds": round(pruned_seconds, 4)},
+        "speedup": round(naive_seconds / pruned_seconds, 1) if pruned_seconds else None,
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"venv files: {args.venv_files}")
+        print(f"naive : {naive_kept} files kept in {naive_seconds:.3f}s")
+        print(f"pruned: {pruned_kept} files kept in {pruned_seconds:.3f}s ({results['speedup']}x)")
+    return 0 if naive_kept == pruned_kept else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""Concurrent load generator for http_server's /mcp-api endpoint.
+
+Replays a weighted mix of tools/call requests and records latency histograms,
+error rates and achieved throughput. Two load models:
+
+  closed  --concurrency N workers each send the next request as soon as the
+          previous one returns (finds maximum throughput)
+  open    --rate R requests/second on a fixed schedule regardless of response
+          time; latency is measured from the scheduled send time, so queueing
+          inside the server is not hidden (no coordinated omission)
+
+--sweep runs one step per concurrency level (or per rate in open mode) and
+reports the saturation curve: throughput and p50/p95/p99 per step, plus the
+first step where extra load no longer buys throughput.
+
+Without --url it starts the mock CML API and an http_server subprocess itself,
+so it runs offline.
+
+Usage:
+  .venv/bin/python scripts/load_http.py --sweep 1,2,4,8,16,32 --duration 10
+  .venv/bin/python scripts/load_http.py --mode open --sweep 20,50,100,200 --duration 10
+  .venv/bin/python scripts/load_http.py --mock-rate-limit 100 --client-rate-limit 200 --sweep 8,32
+  .venv/bin/python scripts/load_http.py --url http://127.0.0.1:8000 --concurrency 16 \
+      --mix list_jobs_tool=5,get_project_id_tool=1 --output load.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import json
+import os
+import random
+import sys
+import time
+from itertools import pairwise
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+_SCRIPTS = Path(__file__).resolve().parent
+sys.path.insert(0, str(_SCRIPTS.parent))
+sys.path.insert(0, str(_SCRIPTS))
+
+from bench_tools import PROJECT_ID, start_http_server, stop_process, tool_failed  # noqa: E402
+from mock_cml_api import MockCMLServer  # noqa: E402
+
+# Upper bounds in milliseconds; the last bucket is open-ended.
+HISTOGRAM_BOUNDS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+
+DEFAULT_ARGUMENTS: Dict[str, Dict[str, Any]] = {
+    "list_jobs_tool": {"project_id": PROJECT_ID},
+    "get_project_id_tool": {"project_name": "project-7"},
+    "list_all_experiments_tool": {"page_size": 100},
+    "list_project_files_tool": {"project_id": PROJECT_ID, "path": "data/part-0"},
+    "list_projects_tool": {},
+    "list_models_tool": {"project_id": PROJECT_ID},
+}
+DEFAULT_MIX = "list_jobs_tool=4,get_project_id_tool=2,list_all_experiments_tool=2,list_project_files_tool=2"
+
+
+def parse_mix(spec: str, mix_file: Optional[str]) -> List[Dict[str, Any]]:
+    """Weighted request templates from "tool=weight,..." or a JSON list of {tool, arguments, weight}."""
+    if mix_file:
+        with open(mix_file, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        return [{"tool": e["tool"], "arguments": e.get("arguments", {}), "weight": float(e.get("weight", 1))}
+                for e in entries]
+    mix = []
+    for item in spec.split(","):
+        name, _, weight = item.strip().partition("=")
+        if not name:
+            continue
+        if name not in DEFAULT_ARGUMENTS:
+            raise SystemExit(f"no default arguments for {name}; use --mix-file to supply them")
+        mix.append({"tool": name, "arguments": DEFAULT_ARGUMENTS[name], "weight": float(weight or 1)})
+    return mix
+
+
+class Recorder:
+    """Latency samples, a fixed-bucket histogram and error counts for one load step."""
+
+    def __init__(self):
+        self.samples: List[float] = []
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.errors: Dict[str, int] = {}
+        self.per_tool: Dict[str, List[float]] = {}
+
+    def ok(self, tool: str, seconds: float) -> None:
+        self.samples.append(seconds)
+        self.per_tool.setdefault(tool, []).append(seconds)
+        self.histogram[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, seconds * 1000.0)] += 1
+
+    def error(self, kind: str) -> None:
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def summary(self, wall_seconds: float) -> Dict[str, Any]:
+        total = len(self.samples) + sum(self.errors.values())
+        result: Dict[str, Any] = {
+            "requests": total,
+            "ok": len(self.samples),
+            "errors": self.errors,
+            "error_rate": round(sum(self.errors.values()) / total, 4) if total else 0.0,
+            "throughput_per_s": round(len(self.samples) / wall_seconds, 2) if wall_seconds else 0.0,
+            "histogram_ms": {
+                **{f"le_{bound}": count for bound, count in zip(HISTOGRAM_BOUNDS_MS, self.histogram[:-1], strict=True)},
+                "gt_max": self.histogram[-1],
+            },
+        }
+        result.update(_percentiles(self.samples))
+        result["per_tool"] = {tool: {"ok": len(s), **_percentiles(s)} for tool, s in self.per_tool.items()}
+        return result
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {}
+    p50, p95, p99 = np.percentile(np.asarray(samples) * 1000.0, [50, 95, 99])
+    return {"p50_ms": round(float(p50), 3), "p95_ms": round(float(p95), 3), "p99_ms": round(float(p99), 3)}
+
+
+async def _call(client: httpx.AsyncClient, template: Dict[str, Any], recorder: Recorder,
+                scheduled: Optional[float] = None) -> None:
+    start = scheduled if scheduled is not None else time.perf_counter()
+    try:
+        response = await client.post("/mcp-api", json={
+            "jsonrpc": "2.0", "id": 1, "method": "tools/call",
+            "params": {"name": template["tool"], "arguments": template["arguments"]},
+        })
+    except httpx.TimeoutException:
+        recorder.error("timeout")
+        return
+    except httpx.HTTPError as e:
+        recorder.error(type(e).__name__)
+        return
+    if response.status_code != 200:
+        recorder.error(f"http_{response.status_code}")
+        return
+    result = response.json().get("result") or {}
+    if result.get("isError"):
+        recorder.error("tool_exception")
+        return
+    content = result.get("content") or [{}]
+    if tool_failed(content[0].get("text", "")):
+        recorder.error("tool_failed")
+        return
+    recorder.ok(template["tool"], time.perf_counter() - start)
+
+
+def _picker(mix: List[Dict[str, Any]], seed: int):
+    rng = random.Random(seed)
+    weights = [m["weight"] for m in mix]
+    return lambda: rng.choices(mix, weights)[0]
+
+
+async def run_closed(base_url: str, mix, concurrency: int, duration: float, timeout: float, seed: int):
+    recorder = Recorder()
+    pick = _picker(mix, seed)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        deadline = time.perf_counter() + duration
+
+        async def worker():
+            while time.perf_counter() < deadline:
+                await _call(client, pick(), recorder)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return recorder.summary(time.perf_counter() - started)
+
+
+async def run_open(base_url: str, mix, rate: float, duration: float, timeout: float, seed: int,
+                   max_in_flight: int):
+    recorder = Recorder()
+    pick = _picker(mix, seed)
+    limits = httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        interval = 1.0 / rate
+        started = time.perf_counter()
+        tasks = []
+        for i in range(int(rate * duration)):
+            scheduled = started + i * interval
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(_call(client, pick(), recorder, scheduled)))
+        await asyncio.gather(*tasks)
+        return recorder.summary(time.perf_counter() - started)
+
+
+def find_knee(steps: List[Dict[str, Any]], min_gain: float = 0.1) -> Optional[Any]:
+    """First load level whose throughput gain over the previous step is below min_gain."""
+    for previous, current in pairwise(steps):
+        before, after = previous["throughput_per_s"], current["throughput_per_s"]
+        if before and (after - before) / before < min_gain:
+            return current["load"]
+    return None
+
+
+def _print_step(step: Dict[str, Any], mode: str) -> None:
+    label = "concurrency" if mode == "closed" else "rate"
+    print(f"{label}={step['load']:<6} rps={step['throughput_per_s']:<8} p50={step.get('p50_ms')}ms "
+          f"p95={step.get('p95_ms')}ms p99={step.get('p99_ms')}ms error_rate={step['error_rate']}",
+          flush=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="existing http_server base URL (default: start mock + server)")
+    parser.add_argument("--mode", choices=("closed", "open"), default="closed")
+    parser.add_argument("--concurrency", type=int, default=8, help="closed-loop workers")
+    parser.add_argument("--rate", type=float, default=50.0, help="open-loop requests per second")
+    parser.add_argument("--sweep", help="comma-separated concurrency levels (closed) or rates (open)")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per step")
+    parser.add_argument("--max-in-flight", type=int, default=256, help="open-loop connection cap")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--mix-file", help="JSON list of {tool, arguments, weight}")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="mock API latency (self-hosted only)")
+    parser.add_argument("--mock-rate-limit", type=float, default=None, help="mock API 429 limit in rps")
+    parser.add_argument("--client-rate-limit", default="off",
+                        help="server's CAI_MCP_RATE_LIMIT in rps, or off (self-hosted only)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="load-http.json")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix, args.mix_file)
+    default_load = args.concurrency if args.mode == "closed" else args.rate
+    levels = [float(x) for x in args.sweep.split(",")] if args.sweep else [default_load]
+
+    mock = proc = None
+    base_url = args.url
+    if not base_url:
+        mock = MockCMLServer(projects=200, latency_ms=args.latency_ms, jitter_ms=args.latency_ms / 10,
+                             rate_limit=args.mock_rate_limit).start()
+        env = {**os.environ, "CAI_WORKBENCH_HOST": mock.url, "CAI_WORKBENCH_API_KEY": "load",
+               "CAI_WORKBENCH_PROJECT_ID": PROJECT_ID, "CAI_MCP_RATE_LIMIT": args.client_rate_limit}
+        proc, base_url = start_http_server(env)
+
+    steps = []
+    try:
+        for level in levels:
+            if args.mode == "closed":
+                summary = asyncio.run(run_closed(base_url, mix, int(level), args.duration, args.timeout, args.seed))
+            else:
+                summary = asyncio.run(run_open(base_url, mix, level, args.duration, args.timeout, args.seed,
+                                               args.max_in_flight))
+            step = {"load": int(level) if args.mode == "closed" else level, **summary}
+            steps.append(step)
+            _print_step(step, args.mode)
+    finally:
+        if proc is not None:
+            stop_process(proc)
+        if mock is not None:
+            mock.stop()
+
+    report = {
+        "mode": args.mode,
+        "duration_per_step_s": args.duration,
+        "mix": mix,
+        "target": args.url or "self-hosted mock",
+        "steps": steps,
+        "saturation_at": find_knee(steps),
+        "peak_throughput_per_s": max((s["throughput_per_s"] for s in steps), default=0.0),
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"peak {report['peak_throughput_per_s']} rps; saturation at {report['saturation_at']}; "
+          f"results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
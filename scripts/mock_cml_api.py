@@ -0,0 +1,816 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Cloudera AI Workbench REST v2 API, for offline benchmarks and tests.
+
+Implements the subset of /api/v2 that the tool functions call through cmlapi and
+requests: projects, jobs and job runs, project files (list, PUT upload, download,
+delete), experiments with runs and metrics, models with builds and deployments, and
+applications.
+List endpoints honour page_size, page_token and a simple JSON search_filter.
+
+Behaviour knobs, all optional:
+  latency_ms / jitter_ms   delay added to every request
+  error_rate / error_status  random injected failures (e.g. 0.05 and 503)
+  rate_limit / burst       token bucket; over-limit requests get 429 with Retry-After
+  projects, jobs_per_project, ...  size of the synthetic dataset
+
+Admin endpoints (not part of the real API):
+  GET  /_mock/stats    request, error and throttle counters per route
+  POST /_mock/faults   queue scripted failures: {"status": 502, "count": 2, "path": "regex",
+                       "method": "GET", "retry_after": 1}
+  POST /_mock/reset    clear counters and queued faults
+
+Usage:
+  python scripts/mock_cml_api.py --port 8090 --projects 500 --latency-ms 40
+  CAI_WORKBENCH_HOST=http://127.0.0.1:8090 CAI_WORKBENCH_API_KEY=mock ...
+
+In tests, MockCMLServer(...) starts on a free port in a background thread and
+exposes .url; use it as a context manager (pytest puts scripts/ on sys.path).
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 1000
+DOWNLOAD_CHUNK = 64 * 1024
+_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _timestamp(offset_seconds: float) -> str:
+    return (_EPOCH + timedelta(seconds=offset_seconds)).isoformat().replace("+00:00", "Z")
+
+
+def _encode_token(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"offset:{offset}".encode()).decode()
+
+
+def _decode_token(token: str) -> int:
+    try:
+        return int(base64.urlsafe_b64decode(token.encode()).decode().split(":", 1)[1])
+    except (ValueError, IndexError):
+        raise MockError(400, f"invalid page_token {token!r}") from None
+
+
+class MockError(Exception):
+    def __init__(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+
+class TokenBucket:
+    """Thread-safe token bucket; take() returns 0 when admitted, else seconds until a token frees up."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+
+class MockState:
+    """Synthetic workbench data plus the behaviour settings shared by all request threads."""
+
+    def __init__(self, projects: int = 20, jobs_per_project: int = 5, runs_per_job: int = 3,
+                 experiments_per_project: int = 3, runs_per_experiment: int = 10,
+                 metric_points: int = 100, files_per_project: int = 20, file_size: int = 1024,
+                 models_per_project: int = 2, applications_per_project: int = 2, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503, rate_limit: Optional[float] = None,
+                 burst: Optional[float] = None, api_key: Optional[str] = None, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.limiter = TokenBucket(rate_limit, burst) if rate_limit else None
+        self.api_key = api_key
+        self.metric_points = metric_points
+        self.random = random.Random(seed)
+        self.lock = threading.RLock()
+        self.faults: List[Dict[str, Any]] = []
+        self.reset_stats()
+
+        self.projects: Dict[str, Dict[str, Any]] = {}
+        self.jobs: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.job_runs: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.experiments: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.experiment_runs: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.models: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.builds: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.deployments: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.applications: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Per project: path -> {"size", "mtime", "content" (bytes or None for synthetic)}
+        self.files: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._generate(projects, jobs_per_project, runs_per_job, experiments_per_project,
+                       runs_per_experiment, files_per_project, file_size, models_per_project,
+                       applications_per_project)
+
+    # -- synthetic data --------------------------------------------------------
+
+    def _generate(self, projects, jobs_per_project, runs_per_job, experiments_per_project,
+                  runs_per_experiment, files_per_project, file_size, models_per_project,
+                  applications_per_project) -> None:
+        statuses = ["ENGINE_SUCCEEDED", "ENGINE_FAILED", "ENGINE_RUNNING"]
+        for p in range(projects):
+            pid = f"proj-{p:05d}"
+            self.projects[pid] = {
+                "id": pid, "name": f"project-{p}", "description": f"Synthetic project {p}",
+                "owner": {"username": f"user{p % 10}", "name": f"User {p % 10}"},
+                "creator": {"username": f"user{p % 10}"}, "visibility": "private",
+                "created_at": _timestamp(p * 60), "updated_at": _timestamp(p * 60 + 30),
+                "default_engine_type": "ml_runtime",
+            }
+            self.jobs[pid], self.experiments[pid], self.models[pid], self.applications[pid] = {}, {}, {}, {}
+            for j in range(jobs_per_project):
+                jid = f"{pid}-job-{j}"
+                self.jobs[pid][jid] = {
+                    "id": jid, "project_id": pid, "name": f"job-{j}", "script": f"jobs/job_{j}.py",
+                    "kernel": "python3", "cpu": 1, "memory": 2,
+                    "runtime_identifier": "docker.repository.cloudera.com/cloudera/cdsw/ml-runtime-workbench-python3.10-standard:2024.02.1-b4",
+                    "created_at": _timestamp(p * 60 + j), "updated_at": _timestamp(p * 60 + j),
+                }
+                self.job_runs[jid] = {}
+                for r in range(runs_per_job):
+                    rid = f"{jid}-run-{r}"
+                    self.job_runs[jid][rid] = {
+                        "id": rid, "job_id": jid, "project_id": pid, "status": statuses[r % len(statuses)],
+                        "created_at": _timestamp(p * 60 + j * 10 + r), "scheduling_at": _timestamp(p * 60 + j * 10 + r),
+                        "starting_at": _timestamp(p * 60 + j * 10 + r + 1), "running_at": _timestamp(p * 60 + j * 10 + r + 2),
+                        "finished_at": _timestamp(p * 60 + j * 10 + r + 60),
+                    }
+            for e in range(experiments_per_project):
+                eid = f"{pid}-exp-{e}"
+                self.experiments[pid][eid] = {
+                    "id": eid, "project_id": pid, "name": f"experiment-{e}",
+                    "artifact_location": f"/home/cdsw/.experiments/{eid}", "lifecycle_stage": "active",
+                    "created_at": _timestamp(p * 60 + e), "updated_at": _timestamp(p * 60 + e),
+                }
+                self.experiment_runs[eid] = {}
+                for r in range(runs_per_experiment):
+                    rid = f"{eid}-run-{r}"
+                    self.experiment_runs[eid][rid] = {
+                        "id": rid, "experiment_id": eid, "project_id": pid, "name": f"run-{r}",
+                        "status": "FINISHED", "lifecycle_stage": "active",
+                        "start_time": _timestamp(p * 60 + r), "end_time": _timestamp(p * 60 + r + 120),
+                        "data": {
+                            "metrics": [
+                                {"key": "accuracy", "value": round(0.5 + self.random.random() / 2, 4), "step": 0},
+                                {"key": "loss", "value": round(self.random.random(), 4), "step": 0},
+                            ],
+                            "params": [{"key": "lr", "value": str(10 ** -(1 + r % 4))}],
+                            "tags": [{"key": "team", "value": f"team{r % 3}"}],
+                        },
+                    }
+            for m in range(models_per_project):
+                mid = f"{pid}-model-{m}"
+                self.models[pid][mid] = {
+                    "id": mid, "project_id": pid, "name": f"model-{m}", "description": "Synthetic model",
+                    "created_at": _timestamp(p * 60 + m), "updated_at": _timestamp(p * 60 + m),
+                }
+                bid = f"{mid}-build-0"
+                self.builds[mid] = {bid: {
+                    "id": bid, "model_id": mid, "project_id": pid, "status": "built",
+                    "file_path": "predict.py", "function_name": "predict", "created_at": _timestamp(p * 60 + m),
+                }}
+                did = f"{bid}-deployment-0"
+                self.deployments[bid] = {did: {
+                    "id": did, "build_id": bid, "model_id": mid, "project_id": pid, "status": "deployed",
+                    "cpu": 1, "memory": 2, "replicas": 1, "created_at": _timestamp(p * 60 + m),
+                }}
+            for a in range(applications_per_project):
+                aid = f"{pid}-app-{a}"
+                self.applications[pid][aid] = {
+                    "id": aid, "project_id": pid, "name": f"app-{a}", "subdomain": f"app-{p}-{a}",
+                    "script": f"apps/app_{a}.py", "status": "APPLICATION_RUNNING", "cpu": 1, "memory": 2,
+                    "created_at": _timestamp(p * 60 + a), "updated_at": _timestamp(p * 60 + a),
+                }
+            self.files[pid] = {}
+            for f in range(files_per_project):
+                path = f"data/part-{f // 50}/file-{f}.bin" if f % 4 else f"src/module_{f}.py"
+                self.files[pid][path] = {"size": file_size, "mtime": _timestamp(p * 60 + f), "content": None}
+
+    # -- bookkeeping -----------------------------------------------------------
+
+    def reset_stats(self) -> None:
+        with self.lock:
+            self.stats: Dict[str, Any] = {"requests": 0, "throttled": 0, "injected_errors": 0, "routes": {}}
+
+    def record(self, route: str, status: int) -> None:
+        with self.lock:
+            self.stats["requests"] += 1
+            entry = self.stats["routes"].setdefault(route, {"count": 0, "statuses": {}})
+            entry["count"] += 1
+            entry["statuses"][str(status)] = entry["statuses"].get(str(status), 0) + 1
+
+    def add_fault(self, status: int = 503, count: int = 1, path: str = "", method: str = "",
+                  retry_after: Optional[float] = None, body: str = "injected failure") -> None:
+        with self.lock:
+            self.faults.append({"status": int(status), "count": int(count), "path": re.compile(path or ""),
+                                "method": (method or "").upper(), "retry_after": retry_after, "body": body})
+
+    def take_fault(self, method: str, path: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            for fault in self.faults:
+                if fault["method"] and fault["method"] != method:
+                    continue
+                if not fault["path"].search(path):
+                    continue
+                fault["count"] -= 1
+                if fault["count"] <= 0:
+                    self.faults.remove(fault)
+                return fault
+        return None
+
+    def delay(self) -> None:
+        if self.latency_ms or self.jitter_ms:
+            with self.lock:
+                jitter = self.random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+            time.sleep(max(0.0, self.latency_ms + jitter) / 1000.0)
+
+    def random_error(self) -> bool:
+        if not self.error_rate:
+            return False
+        with self.lock:
+            return self.random.random() < self.error_rate
+
+
+def _lookup(table: Dict[str, Dict[str, Any]], key: str, kind: str) -> Dict[str, Any]:
+    if key not in table:
+        raise MockError(404, f"{kind} {key} not found")
+    return table[key]
+
+
+def _search(items: List[Dict[str, Any]], raw_filter: Optional[str]) -> List[Dict[str, Any]]:
+    """Case-insensitive substring match on each field of a JSON search_filter."""
+    if not raw_filter:
+        return items
+    try:
+        criteria = json.loads(raw_filter)
+    except ValueError:
+        raise MockError(400, "search_filter must be a JSON object") from None
+    if not isinstance(criteria, dict):
+        raise MockError(400, "search_filter must be a JSON object")
+
+    def _field(item, name):
+        value = item.get(name)
+        return value.get("username") if isinstance(value, dict) else value
+
+    return [
+        item for item in items
+        if all(str(v).lower() in str(_field(item, k) or "").lower() for k, v in criteria.items())
+    ]
+
+
+def _page(items: List[Dict[str, Any]], items_key: str, query: Dict[str, str]) -> Dict[str, Any]:
+    items = _search(items, query.get("search_filter"))
+    try:
+        size = int(query.get("page_size") or DEFAULT_PAGE_SIZE)
+    except ValueError:
+        raise MockError(400, "page_size must be an integer") from None
+    size = max(1, min(size, MAX_PAGE_SIZE))
+    offset = _decode_token(query["page_token"]) if query.get("page_token") else 0
+    end = offset + size
+    return {items_key: items[offset:end], "next_page_token": _encode_token(end) if end < len(items) else ""}
+
+
+# -- route handlers ------------------------------------------------------------
+# Each takes (state, match groups, query, body) and returns a JSON-able dict, or a
+# (status, dict) tuple, or a _Download for file content.
+
+
+class _Download:
+    def __init__(self, size: int, content: Optional[bytes]):
+        self.size = size
+        self.content = content
+
+
+def _list_projects(state, groups, query, body):
+    return _page(list(state.projects.values()), "projects", query)
+
+
+def _create_project(state, groups, query, body):
+    with state.lock:
+        pid = f"proj-{len(state.projects):05d}"
+        while pid in state.projects:
+            pid += "x"
+        project = {"id": pid, "name": body.get("name", pid), "description": body.get("description", ""),
+                   "owner": {"username": "mock"}, "created_at": _timestamp(time.time() - _EPOCH.timestamp())}
+        state.projects[pid] = project
+        for table in (state.jobs, state.experiments, state.models, state.applications, state.files):
+            table[pid] = {}
+    return project
+
+
+def _get_project(state, groups, query, body):
+    return _lookup(state.projects, groups[0], "project")
+
+
+def _update_project(state, groups, query, body):
+    project = _lookup(state.projects, groups[0], "project")
+    with state.lock:
+        project.update({k: v for k, v in body.items() if k != "id"})
+    return project
+
+
+def _delete_project(state, groups, query, body):
+    with state.lock:
+        _lookup(state.projects, groups[0], "project")
+        del state.projects[groups[0]]
+    return {}
+
+
+def _project_table(table, kind):
+    def _list(state, groups, query, body):
+        _lookup(state.projects, groups[0], "project")
+        return _page(list(table(state).get(groups[0], {}).values()), kind, query)
+    return _list
+
+
+def _list_all(table, kind):
+    def _list(state, groups, query, body):
+        items = [item for per_project in table(state).values() for item in per_project.values()]
+        return _page(items, kind, query)
+    return _list
+
+
+def _get_child(table, kind):
+    def _get(state, groups, query, body):
+        return _lookup(table(state).get(groups[0], {}), groups[-1], kind)
+    return _get
+
+
+def _list_job_runs(state, groups, query, body):
+    _lookup(state.jobs.get(groups[0], {}), groups[1], "job")
+    return _page(list(state.job_runs.get(groups[1], {}).values()), "job_runs", query)
+
+
+def _create_job_run(state, groups, query, body):
+    job = _lookup(state.jobs.get(groups[0], {}), groups[1], "job")
+    with state.lock:
+        runs = state.job_runs.setdefault(job["id"], {})
+        rid = f"{job['id']}-run-{len(runs)}"
+        run = {"id": rid, "job_id": job["id"], "project_id": groups[0], "status": "ENGINE_SCHEDULING",
+               "created_at": _timestamp(time.time() - _EPOCH.timestamp())}
+        runs[rid] = run
+    return run
+
+
+def _get_job_run(state, groups, query, body):
+    return _lookup(state.job_runs.get(groups[1], {}), groups[2], "job run")
+
+
+def _list_experiment_runs(state, groups, query, body):
+    _lookup(state.experiments.get(groups[0], {}), groups[1], "experiment")
+    return _page(list(state.experiment_runs.get(groups[1], {}).values()), "experiment_runs", query)
+
+
+def _get_experiment_run(state, groups, query, body):
+    return _lookup(state.experiment_runs.get(groups[1], {}), groups[2], "experiment run")
+
+
+def _log_experiment_run_batch(state, groups, query, body):
+    run = _get_experiment_run(state, groups, query, body)
+    with state.lock:
+        data = run.setdefault("data", {})
+        for field in ("metrics", "params", "tags"):
+            data.setdefault(field, []).extend(body.get(field) or [])
+    return {}
+
+
+def _get_experiment_run_metrics(state, groups, query, body):
+    run = _get_experiment_run(state, groups, query, body)
+    key = groups[3]
+    rng = random.Random(f"{run['id']}/{key}")
+    value = rng.random()
+    points = []
+    for step in range(state.metric_points):
+        value = max(0.0, value + rng.uniform(-0.05, 0.05))
+        points.append({"key": key, "value": round(value, 6), "step": step, "timestamp": 1704067200000 + step * 1000})
+    return {"metrics": points}
+
+
+def _list_model_builds(state, groups, query, body):
+    _lookup(state.models.get(groups[0], {}), groups[1], "model")
+    return _page(list(state.builds.get(groups[1], {}).values()), "model_builds", query)
+
+
+def _list_model_deployments(state, groups, query, body):
+    """Deployments of one build, or of every build of the model when no build id is given."""
+    builds = state.builds.get(_lookup(state.models.get(groups[0], {}), groups[1], "model")["id"], {})
+    build_ids = [_lookup(builds, groups[2], "model build")["id"]] if len(groups) > 2 else list(builds)
+    items = [d for bid in build_ids for d in state.deployments.get(bid, {}).values()]
+    return _page(items, "model_deployments", query)
+
+
+def _now() -> str:
+    return _timestamp(time.time() - _EPOCH.timestamp())
+
+
+def _create_application(state, groups, query, body):
+    _lookup(state.projects, groups[0], "project")
+    if not body.get("name"):
+        raise MockError(400, "name is required")
+    with state.lock:
+        apps = state.applications.setdefault(groups[0], {})
+        aid = f"{groups[0]}-app-{len(apps)}"
+        while aid in apps:
+            aid += "x"
+        app = {"status": "APPLICATION_STARTING", "cpu": 1, "memory": 2, **body,
+               "id": aid, "project_id": groups[0], "created_at": _now(), "updated_at": _now()}
+        apps[aid] = app
+    return app
+
+
+def _update_application(state, groups, query, body):
+    app = _lookup(state.applications.get(groups[0], {}), groups[1], "application")
+    with state.lock:
+        app.update({k: v for k, v in body.items() if k not in ("id", "project_id")}, updated_at=_now())
+    return app
+
+
+def _delete_application(state, groups, query, body):
+    with state.lock:
+        apps = state.applications.get(groups[0], {})
+        _lookup(apps, groups[1], "application")
+        del apps[groups[1]]
+    return {}
+
+
+def _set_application_status(status):
+    def _action(state, groups, query, body):
+        app = _lookup(state.applications.get(groups[0], {}), groups[1], "application")
+        with state.lock:
+            app.update(status=status, updated_at=_now())
+        return app
+    return _action
+
+
+def _project_files(state, project_id: str) -> Dict[str, Dict[str, Any]]:
+    _lookup(state.projects, project_id, "project")
+    return state.files.setdefault(project_id, {})
+
+
+def _list_project_files(state, groups, query, body):
+    files = _project_files(state, groups[0])
+    directory = unquote(groups[1] or "").strip("/")
+    prefix = f"{directory}/" if directory else ""
+    if directory in files:
+        raise MockError(400, f"{directory} is a file")
+    entries: Dict[str, Dict[str, Any]] = {}
+    with state.lock:
+        for path, meta in files.items():
+            if not path.startswith(prefix):
+                continue
+            rest = path[len(prefix):]
+            name = rest.split("/", 1)[0]
+            child = prefix + name
+            if "/" in rest:
+                entries.setdefault(child, {"path": child, "is_dir": True, "file_size": "0", "last_modified": meta["mtime"]})
+            else:
+                entries[child] = {"path": child, "is_dir": False, "file_size": str(meta["size"]), "last_modified": meta["mtime"]}
+    if directory and not entries:
+        raise MockError(404, f"path {directory} not found")
+    return {"files": sorted(entries.values(), key=lambda e: e["path"])}
+
+
+def _download_project_file(state, groups, query, body):
+    files = _project_files(state, groups[0])
+    meta = _lookup(files, unquote(groups[1]).strip("/"), "file")
+    return _Download(meta["size"], meta["content"])
+
+
+def _delete_project_file(state, groups, query, body):
+    files = _project_files(state, groups[0])
+    path = unquote(groups[1]).strip("/")
+    with state.lock:
+        doomed = [p for p in files if p == path or p.startswith(path + "/")]
+        if not doomed:
+            raise MockError(404, f"path {path} not found")
+        for p in doomed:
+            del files[p]
+    return {}
+
+
+def _update_project_file_metadata(state, groups, query, body):
+    files = _project_files(state, groups[0])
+    path = unquote(groups[1]).strip("/")
+    with state.lock:
+        meta = _lookup(files, path, "file")
+        if body.get("path") and body["path"] != path:
+            files[body["path"].strip("/")] = files.pop(path)
+            path = body["path"].strip("/")
+    return {"path": path, "is_dir": False, "file_size": str(meta["size"]), "last_modified": meta["mtime"]}
+
+
+_ID = r"([^/:]+)"
+ROUTES: List[Tuple[str, "re.Pattern[str]", str, Callable]] = [
+    (method, re.compile(f"^/api/v2{pattern}$"), name, handler)
+    for method, pattern, name, handler in [
+        ("GET", "/projects", "list_projects", _list_projects),
+        ("POST", "/projects", "create_project", _create_project),
+        ("GET", f"/projects/{_ID}", "get_project", _get_project),
+        ("PATCH", f"/projects/{_ID}", "update_project", _update_project),
+        ("DELETE", f"/projects/{_ID}", "delete_project", _delete_project),
+        ("GET", "/jobs", "list_all_jobs", _list_all(lambda s: s.jobs, "jobs")),
+        ("GET", f"/projects/{_ID}/jobs", "list_jobs", _project_table(lambda s: s.jobs, "jobs")),
+        ("GET", f"/projects/{_ID}/jobs/{_ID}", "get_job", _get_child(lambda s: s.jobs, "job")),
+        ("GET", f"/projects/{_ID}/jobs/{_ID}/runs", "list_job_runs", _list_job_runs),
+        ("POST", f"/projects/{_ID}/jobs/{_ID}/runs", "create_job_run", _create_job_run),
+        ("GET", f"/projects/{_ID}/jobs/{_ID}/runs/{_ID}", "get_job_run", _get_job_run),
+        ("GET", "/experiments", "list_all_experiments", _list_all(lambda s: s.experiments, "experiments")),
+        ("GET", f"/projects/{_ID}/experiments", "list_experiments", _project_table(lambda s: s.experiments, "experiments")),
+        ("GET", f"/projects/{_ID}/experiments/{_ID}", "get_experiment", _get_child(lambda s: s.experiments, "experiment")),
+        ("GET", f"/projects/{_ID}/experiments/{_ID}/runs", "list_experiment_runs", _list_experiment_runs),
+        ("GET", f"/projects/{_ID}/experiments/{_ID}/runs/{_ID}", "get_experiment_run", _get_experiment_run),
+        ("POST", f"/projects/{_ID}/experiments/{_ID}/runs/{_ID}:logBatch", "log_experiment_run_batch", _log_experiment_run_batch),
+        ("GET", f"/projects/{_ID}/experiments/{_ID}/runs/{_ID}/metrics/{_ID}", "get_experiment_run_metrics", _get_experiment_run_metrics),
+        ("GET", "/models", "list_all_models", _list_all(lambda s: s.models, "models")),
+        ("GET", f"/projects/{_ID}/models", "list_models", _project_table(lambda s: s.models, "models")),
+        ("GET", f"/projects/{_ID}/models/{_ID}", "get_model", _get_child(lambda s: s.models, "model")),
+        ("GET", f"/projects/{_ID}/models/{_ID}/builds", "list_model_builds", _list_model_builds),
+        ("GET", f"/projects/{_ID}/models/{_ID}/deployments", "list_model_deployments", _list_model_deployments),
+        ("GET", f"/projects/{_ID}/models/{_ID}/builds/{_ID}/deployments", "list_build_deployments", _list_model_deployments),
+        ("GET", f"/projects/{_ID}/applications", "list_applications", _project_table(lambda s: s.applications, "applications")),
+        ("POST", f"/projects/{_ID}/applications", "create_application", _create_application),
+        ("GET", f"/projects/{_ID}/applications/{_ID}", "get_application", _get_child(lambda s: s.applications, "application")),
+        ("PATCH", f"/projects/{_ID}/applications/{_ID}", "update_application", _update_application),
+        ("DELETE", f"/projects/{_ID}/applications/{_ID}", "delete_application", _delete_application),
+        ("POST", f"/projects/{_ID}/applications/{_ID}:restart", "restart_application", _set_application_status("APPLICATION_RUNNING")),
+        ("POST", f"/projects/{_ID}/applications/{_ID}:stop", "stop_application", _set_application_status("APPLICATION_STOPPED")),
+        ("GET", f"/projects/{_ID}/files/(.+):download", "download_project_file", _download_project_file),
+        ("GET", f"/projects/{_ID}/files(?:/(.*?))?", "list_project_files", _list_project_files),
+        ("PATCH", f"/projects/{_ID}/files/(.+)", "update_project_file_metadata", _update_project_file_metadata),
+        ("DELETE", f"/projects/{_ID}/files/(.+)", "delete_project_file", _delete_project_file),
+    ]
+]
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    server_version = "MockCML/1.0"
+    protocol_version = "HTTP/1.1"
+    state: MockState
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        path = url.path
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        body_bytes = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        state = self.state
+
+        if path.startswith("/_mock/"):
+            self._admin(method, path, body_bytes)
+            return
+
+        route, handler, groups = self._route(method, path)
+        try:
+            if state.api_key and self.headers.get("Authorization") != f"Bearer {state.api_key}":
+                raise MockError(401, "invalid or missing API key")
+            if state.limiter:
+                wait = state.limiter.take()
+                if wait:
+                    with state.lock:
+                        state.stats["throttled"] += 1
+                    raise MockError(429, "rate limit exceeded", {"Retry-After": f"{max(1, round(wait))}"})
+            state.delay()
+            fault = state.take_fault(method, path)
+            if fault:
+                with state.lock:
+                    state.stats["injected_errors"] += 1
+                headers = {"Retry-After": str(fault["retry_after"])} if fault["retry_after"] is not None else {}
+                raise MockError(fault["status"], fault["body"], headers)
+            if state.random_error():
+                with state.lock:
+                    state.stats["injected_errors"] += 1
+                raise MockError(state.error_status, "injected failure")
+            if handler is None:
+                raise MockError(404, f"no route for {method} {path}")
+            if method == "PUT":
+                result = self._upload(groups[0], body_bytes)
+            else:
+                result = handler(state, groups, query, self._json(body_bytes))
+        except Exception as e:  # noqa: BLE001 - surface handler bugs as 500s, like a real server
+            if not isinstance(e, MockError):
+                e = MockError(500, f"internal error: {e}")
+            state.record(route, e.status)
+            self._send_json(e.status, {"error": e.message, "code": e.status, "message": e.message}, e.headers)
+            return
+
+        status = 200
+        if isinstance(result, tuple):
+            status, result = result
+        state.record(route, status)
+        if isinstance(result, _Download):
+            self._send_download(result)
+        else:
+            self._send_json(status, result)
+
+    def _route(self, method: str, path: str):
+        if method == "PUT":
+            match = re.match(f"^/api/v2/projects/{_ID}/files/?$", path)
+            if match:
+                return "upload_project_files", True, match.groups()
+        for route_method, pattern, name, handler in ROUTES:
+            if route_method != method:
+                continue
+            match = pattern.match(path)
+            if match:
+                return name, handler, match.groups()
+        return "unknown", None, ()
+
+    @staticmethod
+    def _json(body: bytes) -> Dict[str, Any]:
+        if not body:
+            return {}
+        try:
+            parsed = json.loads(body)
+        except ValueError:
+            raise MockError(400, "request body must be JSON") from None
+        return parsed if isinstance(parsed, dict) else {"items": parsed}
+
+    def _upload(self, project_id: str, body: bytes) -> Dict[str, Any]:
+        """Multipart PUT as sent by upload_file/upload_folder: the form field name is the target path."""
+        files = _project_files(self.state, project_id)
+        content_type = self.headers.get("Content-Type", "")
+        if not content_type.startswith("multipart/form-data"):
+            raise MockError(400, "expected multipart/form-data")
+        message = BytesParser(policy=HTTP).parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+        uploaded = []
+        for part in message.iter_parts():
+            target = part.get_param("name", header="content-disposition")
+            if not target:
+                continue
+            content = part.get_payload(decode=True) or b""
+            with self.state.lock:
+                files[target.strip("/")] = {
+                    "size": len(content), "content": content,
+                    "mtime": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+                }
+            uploaded.append(target)
+        if not uploaded:
+            raise MockError(400, "no files in request")
+        return {"uploaded": uploaded}
+
+    def _send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_download(self, download: _Download) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(download.size))
+        self.end_headers()
+        if download.content is not None:
+            self.wfile.write(download.content)
+            return
+        block = b"0123456789abcdef" * (DOWNLOAD_CHUNK // 16)
+        remaining = download.size
+        while remaining:
+            chunk = block[:min(remaining, DOWNLOAD_CHUNK)]
+            self.wfile.write(chunk)
+            remaining -= len(chunk)
+
+    def _admin(self, method: str, path: str, body: bytes) -> None:
+        state = self.state
+        try:
+            if method == "GET" and path == "/_mock/stats":
+                with state.lock:
+                    self._send_json(200, json.loads(json.dumps(state.stats)))
+                return
+            if method == "POST" and path == "/_mock/faults":
+                spec = self._json(body)
+                state.add_fault(**{k: spec[k] for k in ("status", "count", "path", "method", "retry_after", "body") if k in spec})
+                self._send_json(200, {"queued": len(state.faults)})
+                return
+            if method == "POST" and path == "/_mock/reset":
+                state.reset_stats()
+                with state.lock:
+                    state.faults.clear()
+                self._send_json(200, {})
+                return
+            raise MockError(404, f"no admin route for {method} {path}")
+        except MockError as e:
+            self._send_json(e.status, {"error": e.message})
+
+
+class MockCMLServer:
+    """Run the mock API on a background thread; .url is the host to configure tools with."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, state: Optional[MockState] = None, **options: Any):
+        self.state = state or MockState(**options)
+        handler = type("BoundMockRequestHandler", (MockRequestHandler,), {"state": self.state})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockCMLServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05},
+                                        name="mock-cml-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "MockCMLServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Local mock of the Cloudera AI Workbench REST v2 API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--jobs-per-project", type=int, default=5)
+    parser.add_argument("--runs-per-job", type=int, default=3)
+    parser.add_argument("--experiments-per-project", type=int, default=3)
+    parser.add_argument("--runs-per-experiment", type=int, default=10)
+    parser.add_argument("--metric-points", type=int, default=100)
+    parser.add_argument("--files-per-project", type=int, default=20)
+    parser.add_argument("--file-size", type=int, default=1024, help="bytes per synthetic file")
+    parser.add_argument("--models-per-project", type=int, default=2)
+    parser.add_argument("--applications-per-project", type=int, default=2)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests to fail")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--rate-limit", type=float, default=None, help="requests per second before 429")
+    parser.add_argument("--burst", type=float, default=None)
+    parser.add_argument("--api-key", default=None, help="require this bearer token")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    options = {k: v for k, v in vars(args).items() if k not in ("host", "port")}
+    server = MockCMLServer(args.host, args.port, **options)
+    print(f"Mock CML API listening on {server.url} "
+          f"({len(server.state.projects)} projects)", flush=True)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
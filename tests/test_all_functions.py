@@ -3,7 +3,7 @@
 Comprehensive test suite for all CAI Workbench MCP Server functions
 Suitable for CI/CD pipeline unit testing
 
-This test suite covers all 105 tools/functions in the repository with:
+This test suite covers all 116 tools/functions in the repository with:
 - Security validation (no subprocess/curl vulnerabilities)
 - Function signature validation
 - Error handling validation
@@ -124,6 +124,15 @@ from cai_workbench_mcp_server.src.functions.get_default_quota import get_default
 from cai_workbench_mcp_server.src.functions.get_default_quotas import get_default_quotas
 from cai_workbench_mcp_server.src.functions.list_all_resource_groups import list_all_resource_groups
 from cai_workbench_mcp_server.src.functions.list_all_accelerator_node_labels import list_all_accelerator_node_labels
+from cai_workbench_mcp_server.src.functions.batch_create_job_runs import batch_create_job_runs
+from cai_workbench_mcp_server.src.functions.run_job_dag import run_job_dag
+from cai_workbench_mcp_server.src.functions.list_across_projects import list_across_projects
+from cai_workbench_mcp_server.src.functions.bulk_get_experiment_run_metrics import bulk_get_experiment_run_metrics
+from cai_workbench_mcp_server.src.functions.experiment_leaderboard import experiment_leaderboard
+from cai_workbench_mcp_server.src.functions.log_experiment_runs_buffered import log_experiment_runs_buffered
+from cai_workbench_mcp_server.src.functions.walk_project_files import walk_project_files
+from cai_workbench_mcp_server.src.functions.download_folder import download_folder
+from cai_workbench_mcp_server.src.functions.delete_project_files import delete_project_files
 
 # upload_folder requires cmlapi (optional dependency)
 try:
@@ -260,6 +269,15 @@ def all_functions():
         (get_default_quotas, {}),
         (list_all_resource_groups, {}),
         (list_all_accelerator_node_labels, {}),
+        (batch_create_job_runs, {"project_id": "test", "job_ids": ["test1", "test2"]}),
+        (run_job_dag, {"project_id": "test", "dag": {"b": ["a"]}, "poll_interval": 0, "timeout": 0}),
+        (list_across_projects, {"resource": "jobs"}),
+        (bulk_get_experiment_run_metrics, {"project_id": "test", "experiment_id": "test", "metric_keys": "loss", "run_ids": "r1"}),
+        (experiment_leaderboard, {"project_id": "test", "experiment_id": "test"}),
+        (log_experiment_runs_buffered, {"project_id": "test", "experiment_id": "test", "updates": "[]"}),
+        (walk_project_files, {"project_id": "test"}),
+        (download_folder, {"project_id": "test", "local_dir": "/tmp/test_download_folder"}),
+        (delete_project_files, {"project_id": "test", "paths": "test.txt"}),
     ]
     
     # Conditionally add upload_folder if cmlapi is available
@@ -598,6 +616,15 @@ def test_all_modules_import_successfully():
     import cai_workbench_mcp_server.src.functions.get_default_quotas
     import cai_workbench_mcp_server.src.functions.list_all_resource_groups
     import cai_workbench_mcp_server.src.functions.list_all_accelerator_node_labels
+    import cai_workbench_mcp_server.src.functions.batch_create_job_runs
+    import cai_workbench_mcp_server.src.functions.run_job_dag
+    import cai_workbench_mcp_server.src.functions.list_across_projects
+    import cai_workbench_mcp_server.src.functions.bulk_get_experiment_run_metrics
+    import cai_workbench_mcp_server.src.functions.experiment_leaderboard
+    import cai_workbench_mcp_server.src.functions.log_experiment_runs_buffered
+    import cai_workbench_mcp_server.src.functions.walk_project_files
+    import cai_workbench_mcp_server.src.functions.download_folder
+    import cai_workbench_mcp_server.src.functions.delete_project_files
     import cai_workbench_mcp_server.src.functions.http_helpers
     
     # upload_folder requires cmlapi (optional), only import if available
@@ -0,0 +1,69 @@
+"""Unit tests for batch_create_job_runs."""
+
+from unittest.mock import MagicMock, patch
+
+from cai_workbench_mcp_server.src.functions.batch_create_job_runs import batch_create_job_runs
+
+
+def _config():
+    return {"host": "https://ml.example", "api_key": "token", "project_id": "p1"}
+
+
+def _response(payload):
+    result = MagicMock()
+    result.to_dict.return_value = payload
+    return result
+
+
+@patch("cai_workbench_mcp_server.src.functions.batch_create_job_runs.setup_client")
+def test_batch_create_job_runs_merges_env_and_reports_failures(mock_setup_client):
+    mock_client = MagicMock()
+    mock_setup_client.return_value = mock_client
+
+    def create_job_run(body, project_id, job_id):
+        if job_id == "bad":
+            raise RuntimeError("boom")
+        return _response({"id": f"run-{job_id}", "status": "ENGINE_SCHEDULING", "env": body})
+
+    mock_client.create_job_run.side_effect = create_job_run
+
+    result = batch_create_job_runs(_config(), {
+        "job_ids": "j1, j2,bad",
+        "environment_variables": '{"STAGE": "nightly", "DEBUG": "0"}',
+        "job_overrides": {"j2": {"environment_variables": {"DEBUG": "1"}}},
+        "max_workers": 2,
+    })
+
+    assert result["success"] is True
+    assert [r["run_id"] for r in result["data"]["runs"]] == ["run-j1", "run-j2"]
+    assert result["data"]["failed"] == [{"job_id": "bad", "error": "boom"}]
+    bodies = {c.args[2]: c.args[0] for c in mock_client.create_job_run.call_args_list}
+    assert bodies["j1"]["environment_variables"] == {"STAGE": "nightly", "DEBUG": "0"}
+    assert bodies["j2"]["environment_variables"] == {"STAGE": "nightly", "DEBUG": "1"}
+
+
+@patch("cai_workbench_mcp_server.src.functions.batch_create_job_runs.setup_client")
+def test_batch_create_job_runs_resolves_search_filter(mock_setup_client):
+    mock_client = MagicMock()
+    mock_setup_client.return_value = mock_client
+    mock_client.list_jobs.side_effect = [
+        _response({"jobs": [{"id": "j1"}], "next_page_token": "next"}),
+        _response({"jobs": [{"id": "j2"}], "next_page_token": ""}),
+    ]
+    mock_client.create_job_run.side_effect = lambda body, pid, jid: _response({"id": f"run-{jid}"})
+
+    result = batch_create_job_runs(_config(), {"search_filter": '{"name": "nightly"}'})
+
+    assert [r["job_id"] for r in result["data"]["runs"]] == ["j1", "j2"]
+    assert mock_client.list_jobs.call_count == 2
+
+
+def test_batch_create_job_runs_requires_selection():
+    result = batch_create_job_runs(_config(), {})
+    assert result["success"] is False
+
+
+def test_batch_create_job_runs_rejects_invalid_overrides():
+    result = batch_create_job_runs(_config(), {"job_ids": "j1", "job_overrides": "{not json"})
+    assert result["success"] is False
+    assert "job_overrides" in result["message"]
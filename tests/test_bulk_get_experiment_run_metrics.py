@@ -0,0 +1,67 @@
+"""Unit tests for bulk_get_experiment_run_metrics."""
+
+from unittest.mock import MagicMock, patch
+
+from cai_workbench_mcp_server.src.functions.bulk_get_experiment_run_metrics import (
+    bulk_get_experiment_run_metrics,
+)
+
+
+def _config():
+    return {"host": "https://ml.example", "api_key": "token", "project_id": "p1"}
+
+
+def _response(payload):
+    result = MagicMock()
+    result.to_dict.return_value = payload
+    return result
+
+
+def _metrics(run_id, key):
+    if run_id == "r2" and key == "acc":
+        raise RuntimeError("missing")
+    base = 1.0 if run_id == "r1" else 2.0
+    return _response({"metrics": [
+        {"key": key, "value": base + 0.5, "step": "2"},
+        {"key": key, "value": base, "step": "1"},
+    ]})
+
+
+@patch("cai_workbench_mcp_server.src.functions.bulk_get_experiment_run_metrics.setup_client")
+def test_bulk_metrics_builds_dense_matrix_for_all_runs(mock_setup_client):
+    client = MagicMock()
+    mock_setup_client.return_value = client
+    client.list_experiment_runs.return_value = _response({
+        "experiment_runs": [{"id": "r1", "name": "baseline"}, {"id": "r2", "name": "tuned"}],
+    })
+    client.get_experiment_run_metrics.side_effect = lambda pid, eid, run_id, key: _metrics(run_id, key)
+
+    result = bulk_get_experiment_run_metrics(_config(), {
+        "experiment_id": "e1", "metric_keys": "loss,acc", "max_workers": 4,
+    })
+
+    data = result["data"]
+    assert data["run_ids"] == ["r1", "r2"]
+    assert data["run_names"] == ["baseline", "tuned"]
+    assert data["matrix"] == [[1.5, 1.5], [2.5, None]]
+    assert data["failed"] == [{"run_id": "r2", "metric_key": "acc", "error": "missing"}]
+    assert client.get_experiment_run_metrics.call_count == 4
+
+
+@patch("cai_workbench_mcp_server.src.functions.bulk_get_experiment_run_metrics.setup_client")
+def test_bulk_metrics_reduces_history(mock_setup_client):
+    client = MagicMock()
+    mock_setup_client.return_value = client
+    client.get_experiment_run_metrics.side_effect = lambda pid, eid, run_id, key: _metrics(run_id, key)
+
+    result = bulk_get_experiment_run_metrics(_config(), {
+        "experiment_id": "e1", "metric_keys": ["loss"], "run_ids": "r1", "reduce": "min",
+    })
+
+    assert result["data"]["matrix"] == [[1.0]]
+    client.list_experiment_runs.assert_not_called()
+
+
+def test_bulk_metrics_requires_metric_keys():
+    result = bulk_get_experiment_run_metrics(_config(), {"experiment_id": "e1"})
+    assert result["success"] is False
@@ -0,0 +1,110 @@
+"""Unit tests for chunked and selector-based delete_experiment_run_batch."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cai_workbench_mcp_server.src.functions.delete_experiment_run_batch import (
+    delete_experiment_run_batch,
+    select_runs,
+)
+
+NOW = 1_700_000_000.0
+DAY = 86400
+
+
+def _config():
+    return {"host": "https://ml.example", "api_key": "token", "project_id": "p1"}
+
+
+def _run(run_id, age_days, loss=None, status="FINISHED"):
+    metrics = [{"key": "loss", "value": loss}] if loss is not None else []
+    return {"id": run_id, "name": run_id, "status": status,
+            "start_time": int((NOW - age_days * DAY) * 1000), "data": {"metrics": metrics}}
+
+
+RUNS = [
+    _run("old-bad", 40, loss=2.0),
+    _run("old-good", 40, loss=0.1),
+    _run("new-bad", 1, loss=3.0),
+    _run("old-failed", 60, status="FAILED"),
+]
+
+
+def test_select_runs_combines_criteria():
+    assert [r["id"] for r in select_runs(RUNS, {"older_than_days": 30}, now=NOW)] == [
+        "old-bad", "old-good", "old-failed"]
+    assert [r["id"] for r in select_runs(RUNS, {"older_than_days": 30, "metric_key": "loss",
+                                                "metric_above": 1}, now=NOW)] == ["old-bad"]
+    assert [r["id"] for r in select_runs(RUNS, {"status": "failed"}, now=NOW)] == ["old-failed"]
+
+
+def test_select_runs_parses_iso_start_times():
+    runs = [{"id": "a", "start_time": "2023-01-01 00:00:00+00:00"}, {"id": "b", "start_time": "2023-11-14T00:00:00Z"}]
+    assert [r["id"] for r in select_runs(runs, {"older_than_days": 30}, now=NOW)] == ["a"]
+
+
+@patch("cai_workbench_mcp_server.src.functions.delete_experiment_run_batch.setup_client")
+def test_large_id_lists_are_chunked_and_failures_isolated(mock_setup_client):
+    client = MagicMock()
+    mock_setup_client.return_value = client
+
+    def _delete(body, project_id, experiment_id):
+        if "r120" in body["run_ids"]:
+            raise RuntimeError("boom")
+
+    client.delete_experiment_run_batch.side_effect = _delete
+    run_ids = [f"r{i}" for i in range(250)]
+
+    result = delete_experiment_run_batch(_config(), {
+        "experiment_id": "e1", "run_ids": ",".join(run_ids), "chunk_size": 100, "max_workers": 3,
+    })
+
+    assert client.delete_experiment_run_batch.call_count == 3
+    data = result["data"]
+    assert result["success"] is False
+    assert data["deleted"] == 150
+    assert data["failed_run_ids"] == run_ids[100:200]
+    assert [c["success"] for c in data["chunks"]] == [True, False, True]
+    assert data["chunks"][1]["error"] == "boom"
+
+
+@patch("cai_workbench_mcp_server.src.functions.delete_experiment_run_batch.setup_client")
+def test_selector_mode_lists_runs_and_supports_dry_run(mock_setup_client):
+    client = MagicMock()
+    mock_setup_client.return_value = client
+    response = MagicMock()
+    response.to_dict.return_value = {"experiment_runs": [
+        {"id": "a", "status": "FAILED"}, {"id": "b", "status": "FINISHED"}, {"id": "c", "status": "FAILED"},
+    ]}
+    client.list_experiment_runs.return_value = response
+    params = {"experiment_id": "e1", "status": "FAILED", "dry_run": True}
+
+    preview = delete_experiment_run_batch(_config(), params)
+    assert preview["data"]["run_ids"] == ["a", "c"]
+    client.delete_experiment_run_batch.assert_not_called()
+
+    result = delete_experiment_run_batch(_config(), {**params, "dry_run": False})
+    assert result["success"] is True
+    assert result["data"]["deleted"] == 2
+    client.delete_experiment_run_batch.assert_called_once_with({"run_ids": ["a", "c"]}, "p1", "e1")
+
+
+def test_requires_run_ids_or_selector():
+    assert delete_experiment_run_batch(_config(), {"experiment_id": "e1"})["success"] is False
+    result = delete_experiment_run_batch(_config(), {"experiment_id": "e1", "metric_key": "loss"})
+    assert result["message"] == "metric_key needs metric_below or metric_above"
+
+
+
+def test_metric_threshold_requires_metric_key():
+    with pytest.raises(ValueError, match="need metric_key"):
+        select_runs(RUNS, {"older_than_days": 30, "metric_below": 0.5}, now=NOW)
+    result = delete_experiment_run_batch(_config(), {"experiment_id": "e1", "metric_below": 0.5})
+    assert result["success"] is False
+    assert result["message"] == "metric_below and metric_above need metric_key"
+
+
+def test_status_matches_exactly():
+    runs = [_run("a", 1, status="FINISHED"), _run("b", 1, status="UNFINISHED")]
+    assert [r["id"] for r in select_runs(runs, {"status": "finished"}, now=NOW)] == ["a"]
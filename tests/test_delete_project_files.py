@@ -0,0 +1,96 @@
+"""Unit tests for bulk project file deletion."""
+
+from unittest.mock import MagicMock, patch
+
+from cai_workbench_mcp_server.src.functions.delete_project_files import delete_project_files, expand_paths
+
+CONFIG = {"host": "https://example.com", "api_key": "key", "project_id": "p1"}
+
+TREE = {
+    "": [
+        {"path": "README.md", "is_dir": False},
+        {"path": "__pycache__", "is_dir": True},
+        {"path": "data", "is_dir": True},
+    ],
+    "__pycache__": [{"path": "__pycache__/a.pyc", "is_dir": False}],
+    "data": [{"path": "data/tmp", "is_dir": True}, {"path": "data/keep.csv", "is_dir": False}],
+    "data/tmp": [
+        {"path": "data/tmp/a.csv", "is_dir": False},
+        {"path": "data/tmp/b.csv", "is_dir": False},
+        {"path": "data/tmp/notes.txt", "is_dir": False},
+        {"path": "data/tmp/__pycache__", "is_dir": True},
+    ],
+    "data/tmp/__pycache__": [{"path": "data/tmp/__pycache__/x.pyc", "is_dir": False}],
+}
+
+
+class _NotFound(Exception):
+    status = 404
+
+
+def _client(missing=(), broken=()):
+    client = MagicMock()
+
+    def _list(project_id, path):
+        response = MagicMock()
+        response.to_dict.return_value = {"files": TREE[path]}
+        return response
+
+    def _delete(project_id, path):
+        if path in missing:
+            raise _NotFound("missing")
+        if path in broken:
+            raise RuntimeError("permission denied")
+
+    client.list_project_files.side_effect = _list
+    client.delete_project_file.side_effect = _delete
+    return client
+
+
+def test_expand_paths_matches_directories_and_collapses_children():
+    paths, failed = expand_paths(_client(), "p1", ["**/__pycache__", "data/tmp/*.csv", "data/tmp/__pycache__/x.pyc"])
+
+    assert paths == ["__pycache__", "data/tmp/__pycache__", "data/tmp/a.csv", "data/tmp/b.csv"]
+    assert failed == []
+
+
+def test_expand_paths_lists_only_below_the_static_prefix():
+    client = _client()
+
+    expand_paths(client, "p1", ["data/tmp/*.csv", "old/report.pdf"])
+
+    listed = {c.args[1] for c in client.list_project_files.call_args_list}
+    assert listed == {"data/tmp", "data/tmp/__pycache__"}
+
+
+@patch("cai_workbench_mcp_server.src.functions.delete_project_files.setup_client")
+def test_delete_reports_per_path_outcomes(mock_setup_client):
+    client = _client(missing={"gone.txt"}, broken={"data/tmp/b.csv"})
+    mock_setup_client.return_value = client
+
+    result = delete_project_files(CONFIG, {"paths": "data/tmp/*.csv,gone.txt", "max_workers": 4})
+
+    assert result["success"] is False
+    data = result["data"]
+    assert (data["deleted"], data["not_found"], data["failed"]) == (1, 1, 1)
+    by_path = {r["path"]: r for r in data["results"]}
+    assert by_path["data/tmp/a.csv"]["status"] == "deleted"
+    assert by_path["gone.txt"]["status"] == "not_found"
+    assert by_path["data/tmp/b.csv"] == {"path": "data/tmp/b.csv", "status": "failed", "error": "permission denied"}
+
+
+@patch("cai_workbench_mcp_server.src.functions.delete_project_files.setup_client")
+def test_dry_run_deletes_nothing(mock_setup_client):
+    client = _client()
+    mock_setup_client.return_value = client
+
+    result = delete_project_files(CONFIG, {"paths": ["**/__pycache__"], "dry_run": True})
+
+    assert result["success"] is True
+    assert result["data"]["paths"] == ["__pycache__", "data/tmp/__pycache__"]
+    client.delete_project_file.assert_not_called()
+
+
+def test_delete_requires_paths_and_project():
+    assert delete_project_files(CONFIG, {})["message"] == "paths is required"
+    assert delete_project_files({"host": "h", "api_key": "k"}, {"paths": "a"})["message"] == "project_id is required"
@@ -0,0 +1,81 @@
+"""Unit tests for download_folder."""
+
+import io
+import os
+from unittest.mock import MagicMock, patch
+
+from cai_workbench_mcp_server.src.functions.download_folder import download_folder
+
+MTIME = "2024-01-02T03:04:05+00:00"
+CONTENT = {"data/a.csv": b"a,b\n1,2\n", "data/sub/b.txt": b"hello", "data/sub/skip.log": b"x" * 10}
+LISTINGS = {
+    "data": [
+        {"path": "data/a.csv", "is_dir": False, "file_size": "8", "last_modified": MTIME},
+        {"path": "data/sub", "is_dir": True},
+    ],
+    "data/sub": [
+        {"path": "data/sub/b.txt", "is_dir": False, "file_size": "5", "last_modified": MTIME},
+        {"path": "data/sub/skip.log", "is_dir": False, "file_size": "10", "last_modified": MTIME},
+    ],
+}
+
+
+def _client(fail=()):
+    client = MagicMock()
+
+    def _list(project_id, path):
+        response = MagicMock()
+        response.to_dict.return_value = {"files": LISTINGS[path]}
+        return response
+
+    def _download(project_id, path, _preload_content=True):
+        if path in fail:
+            raise RuntimeError("download failed")
+        response = io.BytesIO(CONTENT[path])
+        response.headers = {"Content-Length": str(len(CONTENT[path]))}
+        return response
+
+    client.list_project_files.side_effect = _list
+    client.download_project_file.side_effect = _download
+    return client
+
+
+@patch("cai_workbench_mcp_server.src.functions.download_folder.setup_client")
+def test_download_folder_mirrors_tree_and_skips_unchanged_files(mock_setup_client, tmp_path):
+    client = _client()
+    mock_setup_client.return_value = client
+    config = {"host": "https://ml.example", "api_key": "token", "project_id": "p1"}
+    params = {"path": "data", "local_dir": str(tmp_path), "exclude": "*.log", "max_workers": 4}
+
+    result = download_folder(config, params)
+
+    assert result["success"] is True
+    assert sorted(result["data"]["downloaded"]) == ["data/a.csv", "data/sub/b.txt"]
+    assert result["data"]["bytes_downloaded"] == 13
+    assert (tmp_path / "sub" / "b.txt").read_bytes() == b"hello"
+    assert not (tmp_path / "sub" / "skip.log").exists()
+    assert os.path.getmtime(tmp_path / "a.csv") == 1704164645
+
+    client.download_project_file.reset_mock()
+    (tmp_path / "a.csv").write_bytes(b"changed!!")
+    again = download_folder(config, params)
+
+    assert again["data"]["skipped"] == 1
+    assert again["data"]["downloaded"] == ["data/a.csv"]
+    assert client.download_project_file.call_count == 1
+
+
+@patch("cai_workbench_mcp_server.src.functions.download_folder.setup_client")
+def test_download_folder_reports_failed_files(mock_setup_client, tmp_path):
+    mock_setup_client.return_value = _client(fail={"data/sub/b.txt"})
+
+    result = download_folder({"host": "h", "api_key": "k", "project_id": "p1"},
+                             {"path": "data", "local_dir": str(tmp_path), "include": "*.txt,*.csv"})
+
+    assert result["success"] is False
+    assert result["data"]["failed"] == [{"path": "data/sub/b.txt", "error": "download failed"}]
+    assert result["data"]["downloaded"] == ["data/a.csv"]
+
+
+def test_download_folder_requires_local_dir():
+    assert download_folder({"host": "h", "api_key": "k", "project_id": "p1"}, {})["success"] is False
@@ -0,0 +1,106 @@
+"""Unit tests for streaming and preview modes of download_project_file."""
+
+import hashlib
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cai_workbench_mcp_server.src.functions.download_project_file import (
+    download_project_file,
+    preview_project_file,
+    stream_project_file,
+)
+
+
+class FakeResponse(io.BytesIO):
+    """Minimal stand-in for a urllib3 response returned with _preload_content=False."""
+
+    def __init__(self, body, content_length=None):
+        super().__init__(body)
+        self.headers = {} if content_length is None else {"Content-Length": str(content_length)}
+        self.released = False
+
+    def release_conn(self):
+        self.released = True
+
+
+def _client(body, content_length=None):
+    client = MagicMock()
+    client.response = FakeResponse(body, len(body) if content_length is None else content_length)
+    client.download_project_file.return_value = client.response
+    return client
+
+
+def test_stream_writes_chunks_and_reports_checksum(tmp_path):
+    body = bytes(range(256)) * 1000
+    client = _client(body)
+    target = tmp_path / "out" / "model.bin"
+
+    data = stream_project_file(client, "p1", "models/model.bin", str(target), chunk_size=4096)
+
+    assert target.read_bytes() == body
+    assert data["bytes"] == len(body)
+    assert data["sha256"] == hashlib.sha256(body).hexdigest()
+    assert client.response.released is True
+    client.download_project_file.assert_called_once_with("p1", "models/model.bin", _preload_content=False)
+
+
+def test_stream_rejects_truncated_body(tmp_path):
+    client = _client(b"short", content_length=100)
+    target = tmp_path / "file.txt"
+
+    with pytest.raises(IOError, match="size mismatch"):
+        stream_project_file(client, "p1", "file.txt", str(target))
+
+    assert not target.exists()
+    assert not (tmp_path / "file.txt.part").exists()
+
+
+def test_preview_head_and_tail():
+    body = b"".join(f"line {i}\n".encode() for i in range(1000))
+
+    head = preview_project_file(_client(body), "p1", "log.txt", max_bytes=14, chunk_size=5)
+    assert head["content"] == "line 0\nline 1\n"
+    assert head["truncated"] is True
+
+    tail = preview_project_file(_client(body), "p1", "log.txt", max_bytes=18, mode="tail", chunk_size=7)
+    assert tail["content"] == "line 998\nline 999\n"
+    assert tail["total_bytes"] == len(body)
+
+
+def test_preview_reads_in_chunk_size_blocks_for_small_windows():
+    body = b"x" * 100 + b"end"
+    client = _client(body)
+    reads = []
+    read = client.response.read
+    client.response.read = lambda size=-1: reads.append(size) or read(size)
+
+    tail = preview_project_file(client, "p1", "log.txt", max_bytes=3, mode="tail", chunk_size=64)
+    assert tail["content"] == "end"
+    assert set(reads) == {64}
+
+    empty = preview_project_file(_client(body), "p1", "log.txt", max_bytes=0, mode="tail", chunk_size=64)
+    assert empty["content"] == "" and empty["truncated"] is True
+
+
+@patch("cai_workbench_mcp_server.src.functions.download_project_file.setup_client")
+def test_download_project_file_modes(mock_setup_client, tmp_path):
+    mock_setup_client.return_value = _client(b"hello world")
+    config = {"host": "https://ml.example", "api_key": "token", "project_id": "p1"}
+
+    result = download_project_file(config, {"path": "a.txt", "local_path": str(tmp_path / "a.txt")})
+    assert result["success"] is True
+    assert "content" not in result["data"]
+    assert result["data"]["bytes"] == 11
+
+    mock_setup_client.return_value = _client(b"hello world")
+    result = download_project_file(config, {"path": "a.txt", "max_bytes": 5})
+    assert result["data"]["content"] == "hello"
+
+    mock_setup_client.return_value = _client(b"hello world")
+    result = download_project_file(config, {"path": "a.txt", "max_bytes": 0})
+    assert result["data"]["content"] == "" and result["data"]["truncated"] is True
+    assert result["data"]["total_bytes"] == 11
+
+    assert download_project_file(config, {"path": "a.txt", "preview": "middle"})["success"] is False
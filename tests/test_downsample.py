@@ -0,0 +1,92 @@
+"""Unit tests for metric series downsampling."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from cai_workbench_mcp_server.src.functions.downsample import (
+    lttb_indices,
+    minmax_indices,
+    series_summary,
+)
+from cai_workbench_mcp_server.src.functions.get_experiment_run_metrics import get_experiment_run_metrics
+
+
+def test_lttb_keeps_endpoints_and_spike():
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[537] = 10.0
+
+    keep = lttb_indices(x, y, 50)
+
+    assert len(keep) == 50
+    assert keep[0] == 0 and keep[-1] == 999
+    assert 537 in keep
+    assert np.all(np.diff(keep) > 0)
+
+
+def test_minmax_keeps_bucket_extremes():
+    y = np.sin(np.linspace(0, 20, 5000))
+    y[1234] = -5.0
+    y[4321] = 5.0
+
+    keep = minmax_indices(y, 100)
+
+    assert len(keep) <= 100
+    assert {0, 1234, 4321, 4999} <= set(keep.tolist())
+
+
+@pytest.mark.parametrize("max_points", [2, 3, 4, 5, 10, 99, 100, 999])
+def test_minmax_never_exceeds_max_points(max_points):
+    y = np.random.default_rng(0).normal(size=1000)
+
+    keep = minmax_indices(y, max_points)
+
+    assert len(keep) <= max_points
+    assert keep[0] == 0 and keep[-1] == 999
+
+
+def test_short_series_is_returned_unchanged():
+    assert lttb_indices(np.arange(5.0), np.arange(5.0), 10).tolist() == [0, 1, 2, 3, 4]
+    assert minmax_indices(np.arange(5.0), 10).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_series_summary_slope():
+    x = np.arange(10, dtype=float)
+    summary = series_summary(x, 3.0 - 0.5 * x)
+    assert summary == {"count": 10, "min": -1.5, "max": 3.0, "last": -1.5, "slope": -0.5}
+
+
+@patch("cai_workbench_mcp_server.src.functions.get_experiment_run_metrics.setup_client")
+def test_get_experiment_run_metrics_downsamples_when_requested(mock_setup_client):
+    client = MagicMock()
+    mock_setup_client.return_value = client
+    response = MagicMock()
+    response.to_dict.return_value = {
+        "metrics": [{"key": "loss", "value": 1.0 / (i + 1), "step": str(i)} for i in range(2000)],
+    }
+    client.get_experiment_run_metrics.return_value = response
+    config = {"host": "https://ml.example", "api_key": "token", "project_id": "p1"}
+    params = {"experiment_id": "e1", "run_id": "r1", "metric_key": "loss", "max_points": 100}
+
+    data = get_experiment_run_metrics(config, params)["data"]
+
+    assert len(data["metrics"]) == 100
+    assert data["metrics"][0] == {"key": "loss", "step": 0, "timestamp": None, "value": 1.0}
+    assert data["downsampling"] == {"method": "lttb", "original_points": 2000, "returned_points": 100}
+    assert data["summary"]["count"] == 2000
+    assert data["summary"]["last"] == 1.0 / 2000
+    assert data["summary"]["slope"] < 0
+
+    unbounded = get_experiment_run_metrics(config, {**params, "max_points": None})["data"]
+    assert len(unbounded["metrics"]) == 2000
+    assert "summary" not in unbounded
+
+
+def test_get_experiment_run_metrics_rejects_unknown_method():
+    result = get_experiment_run_metrics(
+        {"host": "h", "api_key": "k", "project_id": "p1"},
+        {"experiment_id": "e1", "run_id": "r1", "metric_key": "loss", "downsample": "mean"},
+    )
+    assert result["success"] is False
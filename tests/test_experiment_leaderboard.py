@@ -0,0 +1,96 @@
+"""Unit tests for the NumPy-backed experiment leaderboard."""
+
+from unittest.mock import MagicMock, patch
+
+from cai_workbench_mcp_server.src.functions.experiment_leaderboard import (
+    build_leaderboard,
+    experiment_leaderboard,
+)
+
+
+def _run(run_id, metrics, params=None):
+    return {
+        "id": run_id,
+        "name": f"run-{run_id}",
+        "data": {
+            "metrics": [{"key": k, "value": v} for k, v in metrics.items()],
+            "params": [{"key": k, "value": v} for k, v in (params or {}).items()],
+        },
+    }
+
+
+RUNS = [
+    _run("a", {"loss": 0.9, "acc": 0.60}, {"lr": "0.1", "optimizer": "sgd"}),
+    _run("b", {"loss": 0.3, "acc": 0.85}, {"lr": "0.01", "optimizer": "adam"}),
+    _run("c", {"loss": 0.5}, {"lr": "0.05", "optimizer": "adam"}),
+    _run("d", {"loss": 0.7, "acc": 0.70}, {"lr": "0.08"}),
+]
+
+
+def test_leaderboard_ranks_with_minimized_metric():
+    board = build_leaderboard(RUNS, rank_by="loss", minimize=["loss"])
+
+    assert board["columns"] == ["rank", "run_id", "run_name", "acc", "loss"]
+    assert [row[1] for row in board["rows"]] == ["b", "c", "d", "a"]
+    assert board["rows"][1] == [2, "c", "run-c", None, 0.5]
+    assert board["best"]["loss"] == {"run_id": "b", "run_name": "run-b", "value": 0.3, "direction": "min"}
+    assert board["best"]["acc"]["run_id"] == "b"
+
+
+def test_leaderboard_summary_skips_missing_values():
+    board = build_leaderboard(RUNS, metric_keys=["acc"], top_n=2)
+
+    assert board["summary"]["acc"]["count"] == 3
+    assert board["summary"]["acc"]["max"] == 0.85
+    assert board["summary"]["acc"]["median"] == 0.7
+    assert [row[1] for row in board["rows"]] == ["b", "d"]
+
+
+def test_leaderboard_correlates_numeric_params_only():
+    board = build_leaderboard(RUNS, minimize=["loss"])
+
+    pairs = {(c["param"], c["metric"]): c for c in board["correlations"]}
+    assert set(pairs) == {("lr", "loss"), ("lr", "acc")}
+    assert pairs[("lr", "loss")]["r"] > 0.9
+    assert pairs[("lr", "loss")]["n"] == 4
+    assert pairs[("lr", "acc")]["n"] == 3
+
+
+@patch("cai_workbench_mcp_server.src.functions.experiment_leaderboard.setup_client")
+def test_experiment_leaderboard_lists_runs(mock_setup_client):
+    client = MagicMock()
+    mock_setup_client.return_value = client
+    response = MagicMock()
+    response.to_dict.return_value = {"experiment_runs": RUNS}
+    client.list_experiment_runs.return_value = response
+
+    result = experiment_leaderboard(
+        {"host": "https://ml.example", "api_key": "token", "project_id": "p1"},
+        {"experiment_id": "e1", "rank_by": "loss", "minimize": "loss", "top_n": 1},
+    )
+
+    assert result["success"] is True
+    assert result["data"]["rows"] == [[1, "b", "run-b", 0.85, 0.3]]
+    assert result["message"] == "Ranked 4 runs by loss"
+
+
+@patch("cai_workbench_mcp_server.src.functions.experiment_leaderboard.setup_client")
+def test_experiment_leaderboard_rejects_unknown_rank_by(mock_setup_client):
+    response = MagicMock()
+    response.to_dict.return_value = {"experiment_runs": RUNS}
+    mock_setup_client.return_value.list_experiment_runs.return_value = response
+    config = {"host": "https://ml.example", "api_key": "token", "project_id": "p1"}
+
+    result = experiment_leaderboard(config, {"experiment_id": "e1", "rank_by": "f1"})
+    assert result == {"success": False,
+                      "message": "rank_by metric 'f1' not found in 4 runs (available metrics: acc, loss)"}
+
+    response.to_dict.return_value = {"experiment_runs": [{"id": "a", "name": "run-a"}]}
+    result = experiment_leaderboard(config, {"experiment_id": "e1"})
+    assert result["success"] is True
+    assert result["message"] == "Listed 1 runs (no metrics to rank by)"
+
+
+def test_experiment_leaderboard_requires_experiment_id():
+    result = experiment_leaderboard({"host": "h", "api_key": "k", "project_id": "p1"}, {})
+    assert result["success"] is False
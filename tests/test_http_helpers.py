@@ -59,7 +59,8 @@ def test_setup_client_sets_ssl_ca_cert_when_bundle_exists():
             client = http_helpers.setup_client("https://ml.example", "token")
 
     assert mock_config.ssl_ca_cert == "/etc/ssl/certs/ca-certificates.crt"
-    assert client is mock_service
+    # setup_client wraps the service so upstream calls are timed in metrics
+    assert client._client is mock_service
 
 
 def test_setup_client_skips_ssl_ca_cert_when_bundle_missing():
@@ -86,10 +87,10 @@ def test_upload_file_uses_requests_verify(tmp_path, monkeypatch):
 
     mock_response = MagicMock(status_code=200)
     with patch(
-        "cai_workbench_mcp_server.src.functions.upload_file.requests_verify",
+        "cai_workbench_mcp_server.src.functions.http_helpers.requests_verify",
         return_value="/etc/ssl/certs/ca-certificates.crt",
     ):
-        with patch("cai_workbench_mcp_server.src.functions.upload_file.requests.put", return_value=mock_response) as mock_put:
+        with patch("cai_workbench_mcp_server.src.functions.http_helpers.requests.put", return_value=mock_response) as mock_put:
             result = upload_file(config, {"file_path": str(source)})
 
     assert result["success"] is True
@@ -102,10 +103,10 @@ def test_upload_file_to_project_uses_requests_verify(tmp_path):
 
     mock_response = MagicMock(status_code=200)
     with patch(
-        "cai_workbench_mcp_server.src.functions.upload_folder.requests_verify",
+        "cai_workbench_mcp_server.src.functions.http_helpers.requests_verify",
         return_value="/etc/ssl/certs/ca-certificates.crt",
     ):
-        with patch("cai_workbench_mcp_server.src.functions.upload_folder.requests.put", return_value=mock_response) as mock_put:
+        with patch("cai_workbench_mcp_server.src.functions.http_helpers.requests.put", return_value=mock_response) as mock_put:
             success = upload_file_to_project(
                 host="https://ml.example",
                 api_key="token",
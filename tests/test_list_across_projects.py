@@ -0,0 +1,69 @@
+"""Unit tests for list_across_projects."""
+
+from unittest.mock import MagicMock, patch
+
+from cai_workbench_mcp_server.src.functions.list_across_projects import list_across_projects
+
+
+def _config():
+    return {"host": "https://ml.example", "api_key": "token"}
+
+
+def _response(payload):
+    result = MagicMock()
+    result.to_dict.return_value = payload
+    return result
+
+
+def _client():
+    client = MagicMock()
+    client.list_projects.return_value = _response({
+        "projects": [{"id": "p1", "name": "alpha"}, {"id": "p2", "name": "beta"}, {"id": "p3", "name": "gamma"}],
+    })
+    return client
+
+
+@patch("cai_workbench_mcp_server.src.functions.list_across_projects.setup_client")
+def test_applications_are_merged_with_project_names_and_filtered(mock_setup_client):
+    client = _client()
+    mock_setup_client.return_value = client
+
+    def list_applications(project_id, **kwargs):
+        if project_id == "p3":
+            raise RuntimeError("forbidden")
+        return _response({"applications": [
+            {"id": f"{project_id}-a", "status": "APPLICATION_RUNNING"},
+            {"id": f"{project_id}-b", "status": "APPLICATION_STOPPED"},
+        ]})
+
+    client.list_applications.side_effect = list_applications
+
+    result = list_across_projects(_config(), {"resource": "applications", "status": "running", "max_workers": 3})
+
+    assert result["success"] is True
+    apps = result["data"]["applications"]
+    assert [(a["id"], a["project_name"]) for a in apps] == [("p1-a", "alpha"), ("p2-a", "beta")]
+    assert result["data"]["failed_projects"] == [{"project_id": "p3", "project_name": "gamma", "error": "forbidden"}]
+    assert client.list_projects.call_count == 1
+
+
+@patch("cai_workbench_mcp_server.src.functions.list_across_projects.setup_client")
+def test_model_deployments_walk_models_per_project(mock_setup_client):
+    client = _client()
+    mock_setup_client.return_value = client
+    client.list_models.side_effect = lambda project_id, **kw: _response(
+        {"models": [{"id": f"{project_id}-m", "name": "churn"}]} if project_id == "p2" else {"models": []}
+    )
+    client.list_model_deployments.return_value = _response({"model_deployments": [{"id": "d1", "status": "deployed"}]})
+
+    result = list_across_projects(_config(), {"resource": "model_deployments", "project_name": "BET"})
+
+    assert result["data"]["projects_scanned"] == 1
+    assert result["data"]["model_deployments"] == [
+        {"id": "d1", "status": "deployed", "model_name": "churn", "project_id": "p2", "project_name": "beta"}
+    ]
+
+
+def test_list_across_projects_rejects_unknown_resource():
+    result = list_across_projects(_config(), {"resource": "sessions"})
+    assert result["success"] is False
@@ -0,0 +1,143 @@
+"""Unit tests for buffered experiment run logging."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from cai_workbench_mcp_server.src.functions.log_experiment_runs_buffered import (
+    ExperimentRunBatchLogger,
+    log_experiment_runs_buffered,
+)
+from cai_workbench_mcp_server.src.functions.parallel import ApiException
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+def _api_error(status):
+    error = ApiException()
+    error.status = status
+    error.body = "error"
+    return error
+
+
+def _sent(client):
+    return [c.args[0] for c in client.log_experiment_run_batch.call_args_list]
+
+
+def test_updates_are_merged_per_run_and_chunked():
+    client = MagicMock()
+    logger = ExperimentRunBatchLogger(client, "p1", "e1", max_entries=500, flush_interval=None,
+                                      flush_entries=10_000)
+    for step in range(600):
+        logger.log_metrics("r1", {"loss": 1.0 / (step + 1), "acc": step / 600}, step=step)
+    logger.log_params("r1", {f"p{i}": i for i in range(150)})
+    logger.log_param("r1", "p0", "overridden")
+    logger.set_tag("r2", "stage", "dev")
+
+    stats = logger.flush()
+
+    bodies = _sent(client)
+    assert stats["entries_logged"] == 1200 + 150 + 1
+    assert stats["requests"] == len(bodies) == 4
+    assert all(len(b["metrics"]) + len(b["params"]) + len(b["tags"]) <= 500 for b in bodies)
+    assert all(len(b["params"]) <= 100 for b in bodies)
+    assert bodies[0]["params"][0] == {"key": "p0", "value": "overridden"}
+    assert bodies[0]["metrics"][0]["step"] == 0
+    assert bodies[-1] == {"run_id": "r2", "params": [], "tags": [{"key": "stage", "value": "dev"}], "metrics": []}
+
+
+def test_auto_flush_on_size_and_time():
+    client = MagicMock()
+    clock = FakeClock()
+    logger = ExperimentRunBatchLogger(client, "p1", "e1", flush_entries=3, flush_interval=5,
+                                      clock=clock, sleep=clock.sleep)
+
+    logger.log_metric("r1", "loss", 1.0)
+    logger.log_metric("r1", "loss", 0.9)
+    assert client.log_experiment_run_batch.call_count == 0
+    logger.log_metric("r1", "loss", 0.8)
+    assert client.log_experiment_run_batch.call_count == 1
+    assert logger.pending == 0
+
+    logger.log_metric("r1", "loss", 0.7)
+    clock.now = 6
+    logger.log_metric("r1", "loss", 0.6)
+    assert client.log_experiment_run_batch.call_count == 2
+
+
+def test_retries_transient_failures_but_not_client_errors():
+    client = MagicMock()
+    clock = FakeClock()
+    client.log_experiment_run_batch.side_effect = [_api_error(429), _api_error(503), None, _api_error(400)]
+    logger = ExperimentRunBatchLogger(client, "p1", "e1", flush_interval=None, backoff=1,
+                                      clock=clock, sleep=clock.sleep)
+
+    logger.log_metric("r1", "loss", 1.0)
+    logger.flush()
+    logger.log_metric("r2", "loss", 1.0)
+    stats = logger.close()
+
+    assert clock.sleeps == [1, 2]
+    assert stats["retries"] == 2
+    assert stats["entries_logged"] == 1
+    assert stats["failed"] == [{"run_id": "r2", "entries": 1, "error": "API error: 400 - error"}]
+
+
+@patch("cai_workbench_mcp_server.src.functions.log_experiment_runs_buffered.setup_client")
+def test_log_experiment_runs_buffered_tool_function(mock_setup_client):
+    client = MagicMock()
+    mock_setup_client.return_value = client
+    updates = [{"run_id": "r1", "step": s, "metrics": {"loss": 1.0 / (s + 1)}} for s in range(5)]
+    updates.append({"id": "r1", "parameters": {"lr": 0.1}})
+
+    result = log_experiment_runs_buffered(
+        {"host": "https://ml.example", "api_key": "token", "project_id": "p1"},
+        {"experiment_id": "e1", "updates": updates},
+    )
+
+    assert result["success"] is True
+    assert mock_setup_client.call_args.kwargs == {"retries": False}
+    assert result["data"]["requests"] == 1
+    assert result["data"]["entries_logged"] == 6
+    body = _sent(client)[0]
+    assert [m["step"] for m in body["metrics"]] == [0, 1, 2, 3, 4]
+    assert body["params"] == [{"key": "lr", "value": "0.1"}]
+
+
+def test_log_experiment_runs_buffered_validates_input():
+    config = {"host": "h", "api_key": "k", "project_id": "p1"}
+    assert log_experiment_runs_buffered(config, {"experiment_id": "e1"})["success"] is False
+    assert log_experiment_runs_buffered(config, {"experiment_id": "e1", "updates": "{bad"})["success"] is False
+    result = log_experiment_runs_buffered(config, {"experiment_id": "e1", "updates": [{"metrics": {"a": 1}}]})
+    assert result["message"] == "each update needs a run_id"
+    for bad in ('["r1"]', [{"run_id": "r1"}, 3], "42"):
+        result = log_experiment_runs_buffered(config, {"experiment_id": "e1", "updates": bad})
+        assert result == {"success": False, "message": "updates must be an object or a list of objects"}
+
+
+def test_concurrent_flushes_count_every_request():
+    client = MagicMock()
+    logger = ExperimentRunBatchLogger(client, "p1", "e1", flush_entries=1, flush_interval=None)
+
+    def log(worker):
+        for step in range(200):
+            logger.log_metric(f"r{worker}", "loss", 0.5, step=step)
+
+    threads = [threading.Thread(target=log, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = logger.close()
+
+    assert stats["entries_logged"] == 1600
+    assert stats["requests"] == client.log_experiment_run_batch.call_count
@@ -0,0 +1,113 @@
+"""Tests for the in-process metrics registry and the /metrics endpoint."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from starlette.testclient import TestClient
+
+from cai_workbench_mcp_server.src.functions import metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    metrics.REGISTRY.clear()
+    yield
+    metrics.REGISTRY.clear()
+
+
+def test_track_tool_counts_calls_errors_and_latency():
+    with metrics.track_tool("list_jobs_tool"):
+        pass
+    with metrics.track_tool("list_jobs_tool") as call:
+        call.failed = metrics.tool_result_failed(json.dumps({"success": False, "message": "x"}, indent=2))
+    with pytest.raises(RuntimeError):
+        with metrics.track_tool("get_job_tool"):
+            raise RuntimeError("boom")
+
+    assert metrics.TOOL_CALLS.value("list_jobs_tool") == 2
+    assert metrics.TOOL_ERRORS.value("list_jobs_tool") == 1
+    assert metrics.TOOL_ERRORS.value("get_job_tool") == 1
+    assert metrics.TOOL_LATENCY.count("list_jobs_tool") == 2
+    assert metrics.TOOLS_IN_FLIGHT.value() == 0
+
+
+def test_instrumented_client_times_methods_and_counts_api_errors():
+    class _ApiError(Exception):
+        status = 503
+
+    raw = MagicMock()
+    raw.list_jobs.return_value = "jobs"
+    raw.get_job.side_effect = _ApiError("unavailable")
+    client = metrics.instrument_client(raw)
+
+    assert client.list_jobs("p1", page_size=5) == "jobs"
+    with pytest.raises(_ApiError):
+        client.get_job("p1", "j1")
+
+    raw.list_jobs.assert_called_once_with("p1", page_size=5)
+    assert metrics.UPSTREAM_LATENCY.count("list_jobs") == 1
+    assert metrics.UPSTREAM_ERRORS.value("get_job", "503") == 1
+
+
+def test_render_exposition_format_and_cache_ratio():
+    metrics.TOOL_LATENCY.observe(0.02, "list_jobs_tool")
+    for hit in (True, True, True, False):
+        metrics.record_cache("content_hash", hit)
+
+    text = metrics.render()
+
+    assert "# TYPE cai_mcp_tool_duration_seconds histogram" in text
+    assert 'cai_mcp_tool_duration_seconds_bucket{tool="list_jobs_tool",le="0.01"} 0' in text
+    assert 'cai_mcp_tool_duration_seconds_bucket{tool="list_jobs_tool",le="0.025"} 1' in text
+    assert 'cai_mcp_tool_duration_seconds_bucket{tool="list_jobs_tool",le="+Inf"} 1' in text
+    assert 'cai_mcp_tool_duration_seconds_count{tool="list_jobs_tool"} 1' in text
+    assert 'cai_mcp_cache_lookups_total{cache="content_hash",result="hit"} 3' in text
+    assert 'cai_mcp_cache_hit_ratio{cache="content_hash"} 0.75' in text
+
+
+def test_http_server_metrics_endpoint_reports_mcp_api_calls(monkeypatch):
+    from cai_workbench_mcp_server.http_server import mcp
+
+    monkeypatch.delenv("CAI_WORKBENCH_HOST", raising=False)
+
+    with TestClient(mcp.http_app()) as client:
+        response = client.post("/mcp-api", json={
+            "jsonrpc": "2.0", "id": 1, "method": "tools/call",
+            "params": {"name": "get_job_tool", "arguments": {"job_id": "j1"}},
+        })
+        assert response.status_code == 200
+        payload = json.loads(response.json()["result"]["content"][0]["text"])
+        assert payload["success"] is False
+        text = client.get("/metrics").text
+
+    assert 'cai_mcp_tool_calls_total{tool="get_job_tool"} 1' in text
+    assert 'cai_mcp_tool_errors_total{tool="get_job_tool"} 1' in text
+
+
+def test_sync_tools_run_off_the_event_loop():
+    import asyncio
+    import threading
+    import time
+
+    from fastmcp import Client
+
+    from cai_workbench_mcp_server.instrumentation import ThreadedFastMCP, ToolMetricsMiddleware
+
+    server = ThreadedFastMCP("threads")
+    server.add_middleware(ToolMetricsMiddleware())
+
+    @server.tool()
+    def backoff(seconds: float) -> str:
+        time.sleep(seconds)
+        return threading.current_thread().name
+
+    async def calls():
+        async with Client(server) as client:
+            started = time.perf_counter()
+            results = await asyncio.gather(*[client.call_tool("backoff", {"seconds": 0.3}) for _ in range(4)])
+            return time.perf_counter() - started, results
+
+    elapsed, results = asyncio.run(calls())
+    assert elapsed < 1.0
+    assert all(r.content[0].text != threading.main_thread().name for r in results)
@@ -0,0 +1,117 @@
+"""Tests for the local mock CML v2 API server."""
+
+import pytest
+import requests
+
+from mock_cml_api import MockCMLServer
+from cai_workbench_mcp_server.src.functions.upload_file import upload_file
+
+
+@pytest.fixture
+def server():
+    with MockCMLServer(projects=25, files_per_project=6, file_size=200_000) as mock:
+        yield mock
+
+
+@pytest.fixture
+def session():
+    with requests.Session() as s:
+        yield s
+
+
+def test_list_projects_paginates_with_tokens(server, session):
+    seen, token = [], None
+    while True:
+        params = {"page_size": 10, **({"page_token": token} if token else {})}
+        page = session.get(f"{server.url}/api/v2/projects", params=params).json()
+        seen.extend(p["id"] for p in page["projects"])
+        token = page["next_page_token"]
+        if not token:
+            break
+
+    assert len(seen) == 25 and len(set(seen)) == 25
+    filtered = session.get(f"{server.url}/api/v2/projects", params={"search_filter": '{"name": "project-2"}'}).json()
+    assert {p["name"] for p in filtered["projects"]} == {"project-2", "project-20", "project-21", "project-22",
+                                                         "project-23", "project-24"}
+
+
+def test_upload_list_download_and_delete_files(server, session, tmp_path):
+    local = tmp_path / "hello.txt"
+    local.write_bytes(b"hello mock")
+    config = {"host": server.url, "api_key": "k", "project_id": "proj-00000"}
+
+    result = upload_file(config, {"file_path": str(local), "target_dir": "notes"})
+    assert result["success"] is True
+
+    files = session.get(f"{server.url}/api/v2/projects/proj-00000/files/notes").json()["files"]
+    assert files == [{"path": "notes/hello.txt", "is_dir": False, "file_size": "10",
+                      "last_modified": files[0]["last_modified"]}]
+    download = session.get(f"{server.url}/api/v2/projects/proj-00000/files/notes/hello.txt:download")
+    assert download.content == b"hello mock"
+
+    root = session.get(f"{server.url}/api/v2/projects/proj-00000/files").json()["files"]
+    assert {e["path"] for e in root if e["is_dir"]} == {"data", "notes", "src"}
+    synthetic = session.get(f"{server.url}/api/v2/projects/proj-00000/files/src/module_0.py:download")
+    assert synthetic.headers["Content-Length"] == "200000" and len(synthetic.content) == 200_000
+
+    assert session.delete(f"{server.url}/api/v2/projects/proj-00000/files/notes").status_code == 200
+    assert session.get(f"{server.url}/api/v2/projects/proj-00000/files/notes").status_code == 404
+
+
+def test_scripted_faults_and_stats(server, session):
+    session.post(f"{server.url}/_mock/faults", json={"status": 502, "count": 2, "path": "/jobs$", "retry_after": 1})
+
+    url = f"{server.url}/api/v2/projects/proj-00001/jobs"
+    first, second, third = (session.get(url) for _ in range(3))
+
+    assert (first.status_code, second.status_code, third.status_code) == (502, 502, 200)
+    assert first.headers["Retry-After"] == "1"
+    assert len(third.json()["jobs"]) == 5
+    stats = session.get(f"{server.url}/_mock/stats").json()
+    assert stats["injected_errors"] == 2
+    assert stats["routes"]["list_jobs"]["statuses"] == {"502": 2, "200": 1}
+
+
+def test_rate_limit_returns_429_with_retry_after(session):
+    with MockCMLServer(projects=1, rate_limit=1, burst=2) as mock:
+        statuses = [session.get(f"{mock.url}/api/v2/projects").status_code for _ in range(4)]
+        throttled = session.get(f"{mock.url}/api/v2/projects")
+
+    assert statuses[:2] == [200, 200] and 429 in statuses[2:]
+    assert throttled.status_code == 429 and int(throttled.headers["Retry-After"]) >= 1
+
+
+def test_experiment_runs_and_metrics(server, session):
+    base = f"{server.url}/api/v2/projects/proj-00003/experiments"
+    experiment = session.get(base).json()["experiments"][0]["id"]
+    runs = session.get(f"{base}/{experiment}/runs", params={"page_size": 100}).json()["experiment_runs"]
+    metrics = session.get(f"{base}/{experiment}/runs/{runs[0]['id']}/metrics/loss").json()["metrics"]
+
+    assert len(runs) == 10
+    assert [p["step"] for p in metrics] == list(range(100))
+    assert session.get(f"{base}/missing").status_code == 404
+
+
+def test_model_deployments_are_listed_per_model(server, session):
+    base = f"{server.url}/api/v2/projects/proj-00002/models/proj-00002-model-1"
+    per_model = session.get(f"{base}/deployments").json()["model_deployments"]
+    per_build = session.get(f"{base}/builds/proj-00002-model-1-build-0/deployments").json()["model_deployments"]
+
+    assert [d["model_id"] for d in per_model] == ["proj-00002-model-1"]
+    assert per_build == per_model
+    assert session.get(f"{server.url}/api/v2/projects/proj-00002/models/missing/deployments").status_code == 404
+
+
+def test_application_lifecycle(server, session):
+    base = f"{server.url}/api/v2/projects/proj-00004/applications"
+    assert len(session.get(base).json()["applications"]) == 2
+
+    app = session.post(base, json={"name": "dash", "subdomain": "dash", "script": "app.py"}).json()
+    assert app["status"] == "APPLICATION_STARTING"
+    assert session.post(f"{base}/{app['id']}:stop").json()["status"] == "APPLICATION_STOPPED"
+    assert session.post(f"{base}/{app['id']}:restart").json()["status"] == "APPLICATION_RUNNING"
+    assert session.patch(f"{base}/{app['id']}", json={"cpu": 4}).json()["cpu"] == 4
+    assert session.get(f"{base}/{app['id']}").json()["name"] == "dash"
+    assert session.delete(f"{base}/{app['id']}").status_code == 200
+    assert session.get(f"{base}/{app['id']}").status_code == 404
+    assert session.post(base, json={}).status_code == 400
@@ -0,0 +1,59 @@
+"""Unit tests for gitignore-style upload filtering."""
+
+from cai_workbench_mcp_server.src.functions.path_filter import PathFilter, walk_filtered
+
+
+def test_gitignore_semantics():
+    f = PathFilter([
+        "# comment", "*.log", "!keep.log", "/build/", "docs/*.tmp", "**/cache/**", "data/", "file?.txt",
+    ])
+
+    assert f.is_ignored("app.log") and f.is_ignored("deep/nested/app.log")
+    assert not f.is_ignored("keep.log")
+    assert f.is_ignored("build", is_dir=True)
+    assert not f.is_ignored("src/build", is_dir=True)
+    assert not f.is_ignored("build")  # dir-only pattern never matches a file
+    assert f.is_ignored("docs/a.tmp") and not f.is_ignored("other/docs/a.tmp")
+    assert f.is_ignored("x/cache/y/z.bin")
+    assert f.is_ignored("a/b/data", is_dir=True)
+    assert f.is_ignored("file1.txt") and not f.is_ignored("file10.txt")
+
+
+def test_last_matching_pattern_wins():
+    assert PathFilter(["!keep.log", "*.log"]).is_ignored("keep.log")
+    f = PathFilter(["*.log", "!keep*.log", "keep-tmp.log", "tmp/", "!tmp/"])
+    assert not f.is_ignored("keep.log")
+    assert f.is_ignored("keep-tmp.log") and f.is_ignored("other.log")
+    assert not f.is_ignored("tmp", is_dir=True)
+
+
+def test_walk_prunes_ignored_directories_and_applies_filters(tmp_path):
+    for name, size in {
+        "main.py": 10, "notes.md": 5, "big.py": 5000, "app.log": 1,
+        ".venv/lib/site.py": 1, "pkg/__pycache__/m.pyc": 1, "pkg/mod.py": 3, "out/result.py": 1,
+    }.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * size)
+    (tmp_path / ".caiignore").write_text("*.log\nout/\n", encoding="utf-8")
+    path_filter = PathFilter.from_directory(str(tmp_path), [".venv/", "__pycache__/"])
+    stats = {}
+
+    files = [rel for _, rel, _ in walk_filtered(str(tmp_path), path_filter, max_file_size=1000,
+                                                include_extensions=["py"], stats=stats)]
+
+    assert files == ["main.py", "pkg/mod.py"]
+    assert stats == {"pruned_dirs": 3, "ignored_files": 1, "too_large": 1, "extension_filtered": 2}
+
+
+def test_walk_follows_file_symlinks_but_not_directory_symlinks(tmp_path):
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "dir" / "a.py").write_text("a", encoding="utf-8")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "link").symlink_to(tmp_path / "dir", target_is_directory=True)
+    (tmp_path / "src" / "b.py").symlink_to(tmp_path / "dir" / "a.py")
+    (tmp_path / "src" / "broken.py").symlink_to(tmp_path / "missing.py")
+
+    files = [rel for _, rel, _ in walk_filtered(str(tmp_path / "src"), PathFilter())]
+
+    assert files == ["b.py"]
@@ -0,0 +1,87 @@
+"""Tests for the sampling profiler and the /debug/profile endpoint."""
+
+import threading
+import time
+
+import pytest
+from starlette.testclient import TestClient
+
+from cai_workbench_mcp_server.src.functions.profiler import SamplingProfiler, start_from_env
+
+
+def _busy_serializer(stop):
+    while not stop.is_set():
+        sum(i * i for i in range(2000))
+
+
+def _run_busy():
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_serializer, args=(stop,), daemon=True)
+    worker.start()
+    return stop, worker
+
+
+def test_profiler_collects_collapsed_stacks_of_busy_threads():
+    stop, worker = _run_busy()
+    try:
+        profiler = SamplingProfiler(interval=0.002).start()
+        time.sleep(0.2)
+        text = profiler.stop()
+    finally:
+        stop.set()
+        worker.join()
+
+    lines = text.splitlines()
+    assert profiler.samples > 10
+    busy = [line for line in lines if "test_profiler:_busy_serializer" in line]
+    assert busy
+    stack, count = busy[0].rsplit(" ", 1)
+    assert stack.startswith("threading:Thread._bootstrap") and int(count) > 0
+    # Threads parked in threading/selectors waits are dropped by default
+    assert not any(line.split(" ")[0].endswith("threading:Event.wait") for line in lines)
+
+
+def test_only_one_profile_runs_at_a_time_and_until_stops_it():
+    done = {"value": False}
+    profiler = SamplingProfiler(interval=0.001, until=lambda: done["value"]).start()
+    with pytest.raises(RuntimeError):
+        SamplingProfiler().start()
+    done["value"] = True
+    assert profiler.wait(timeout=2)
+    assert not profiler.running
+
+
+def test_start_from_env_writes_profile_after_n_calls(tmp_path, monkeypatch):
+    output = tmp_path / "stdio.collapsed"
+    calls = {"n": 0}
+    monkeypatch.setenv("CAI_MCP_PROFILE", str(output))
+    monkeypatch.setenv("CAI_MCP_PROFILE_CALLS", "2")
+    stop, worker = _run_busy()
+    try:
+        profiler = start_from_env(lambda: calls["n"])
+        time.sleep(0.05)
+        calls["n"] = 2
+        assert profiler.wait(timeout=2)
+    finally:
+        stop.set()
+        worker.join()
+
+    assert "_busy_serializer" in output.read_text()
+
+
+def test_debug_profile_endpoint_returns_collapsed_stacks():
+    from cai_workbench_mcp_server.http_server import mcp
+
+    stop, worker = _run_busy()
+    try:
+        with TestClient(mcp.http_app()) as client:
+            response = client.get("/debug/profile", params={"seconds": 0.2, "interval_ms": 2})
+            bad = client.get("/debug/profile", params={"seconds": "soon"})
+    finally:
+        stop.set()
+        worker.join()
+
+    assert response.status_code == 200
+    assert int(response.headers["X-Profile-Samples"]) > 0
+    assert "_busy_serializer" in response.text
+    assert bad.status_code == 400
@@ -0,0 +1,147 @@
+"""Tests for the adaptive client-side rate limiter."""
+
+import pytest
+import requests
+
+from mock_cml_api import MockCMLServer
+from cai_workbench_mcp_server.src.functions import metrics, ratelimit
+from cai_workbench_mcp_server.src.functions.parallel import map_bounded
+from cai_workbench_mcp_server.src.functions.ratelimit import AdaptiveTokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+class ApiError(Exception):
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.headers = headers or {}
+
+
+@pytest.fixture(autouse=True)
+def reset_limits():
+    ratelimit.reset_rate_limit()
+    yield
+    ratelimit.reset_rate_limit()
+
+
+def _bucket(clock, rate=10.0, burst=2):
+    return AdaptiveTokenBucket(rate, burst, clock=clock, sleep=clock.sleep)
+
+
+def test_bucket_admits_burst_then_paces_at_rate():
+    clock = FakeClock()
+    bucket = _bucket(clock)
+    for _ in range(5):
+        bucket.acquire()
+    assert clock.sleeps == [0.1, 0.1, 0.1]
+
+
+def test_throttle_halves_rate_once_per_interval_and_honours_retry_after():
+    clock = FakeClock()
+    bucket = _bucket(clock)
+    bucket.on_throttle()
+    bucket.on_throttle(retry_after=2)
+    assert bucket.rate == 5.0 and bucket.throttles == 2
+
+    assert bucket.acquire() == pytest.approx(2.0)
+    clock.now += 1.0
+    bucket.on_throttle()
+    assert bucket.rate == 2.5
+
+
+def test_throttling_cuts_to_the_sent_rate_and_shrinks_the_burst():
+    clock = FakeClock()
+    bucket = AdaptiveTokenBucket(100.0, 50, clock=clock, sleep=clock.sleep)
+    for _ in range(20):
+        bucket.acquire()
+    bucket.on_throttle()
+    assert bucket.rate == 10.0 and bucket.capacity == 5.0
+
+    clock.now += 60
+    for _ in range(6):
+        bucket.acquire()
+    assert clock.sleeps == [0.1]
+
+    for _ in range(6):
+        clock.now += 1.0
+        bucket.on_throttle()
+    assert bucket.rate == bucket.min_rate == 5.0 and bucket.capacity == 2.5
+
+
+def test_rate_recovers_stepwise_after_quiet_period():
+    clock = FakeClock()
+    bucket = _bucket(clock, rate=10.0)
+    bucket.on_throttle()
+    clock.now += ratelimit.RECOVERY_DELAY - 0.5
+    bucket.on_success()
+    assert bucket.rate == 5.0
+
+    clock.now += 1.5
+    bucket.on_success()
+    assert bucket.rate == pytest.approx(5.5)
+    clock.now += 10
+    bucket.on_success()
+    assert bucket.rate == 10.0
+
+
+def test_buckets_are_shared_per_host_and_optionally_per_class():
+    ratelimit.configure_rate_limit(20, per_class={"upload": 2})
+    read = ratelimit.limiter_for("https://ml.example/api/v2", "read")
+    assert ratelimit.limiter_for("ml.example", "create") is read
+    assert ratelimit.limiter_for("https://other.example", "read") is not read
+    upload = ratelimit.limiter_for("https://ml.example/api/v2/projects/p1/files", "upload")
+    assert upload is not read and upload.max_rate == 2
+
+    ratelimit.configure_rate_limit(None)
+    assert ratelimit.limiter_for("https://ml.example", "read") is None
+
+
+def test_limited_feeds_429_back_and_metrics_expose_rate():
+    ratelimit.configure_rate_limit(10, per_class={"upload": 10})
+    with pytest.raises(ApiError):
+        with ratelimit.limited("https://ml.example", "read"):
+            raise ApiError(429)
+    with ratelimit.limited("https://ml.example", "upload") as slot:
+        slot.status = 429
+
+    # One request in the last second is no estimate of the server's limit: just halve
+    for kind in ("read", "upload"):
+        bucket = ratelimit.limiter_for("https://ml.example", kind)
+        assert bucket.throttles == 1 and bucket.rate == 5.0
+    text = metrics.render()
+    assert 'cai_mcp_rate_limit_requests_per_second{host="ml.example",bucket="*"} 5' in text
+    assert 'cai_mcp_rate_limit_throttled_total{host="ml.example",bucket="upload"} 1' in text
+
+
+def test_client_adapts_to_workbench_rate_limit():
+    """Concurrent calls against a throttled mock all succeed once the limiter backs off."""
+    with MockCMLServer(projects=2, rate_limit=40, burst=4) as server:
+        class Raw:
+            def list_jobs(self, project_id):
+                response = requests.get(f"{server.url}/api/v2/projects/{project_id}/jobs")
+                if response.status_code != 200:
+                    raise ApiError(response.status_code, response.headers)
+                return response.json()
+
+        ratelimit.configure_rate_limit(1000, burst=5)
+        client = metrics.instrument_client(Raw(), retries=True, host=server.url)
+        results = map_bounded(lambda _: client.list_jobs("proj-00000"), range(12), max_workers=6)
+        stats = requests.get(f"{server.url}/_mock/stats").json()
+
+    bucket = ratelimit.limiter_for(server.url)
+    assert all(error is None and len(r["jobs"]) == 5 for r, error in results)
+    assert stats["throttled"] >= 1
+    assert bucket.throttles == stats["throttled"]
+    assert bucket.rate < 1000
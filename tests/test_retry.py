@@ -0,0 +1,163 @@
+"""Tests for the shared retry policy, including against the mock API's scripted faults."""
+
+import pytest
+import requests
+
+from mock_cml_api import MockCMLServer
+from cai_workbench_mcp_server.src.functions import metrics, ratelimit, retry
+from cai_workbench_mcp_server.src.functions.retry import RetryPolicy
+from cai_workbench_mcp_server.src.functions.upload_file import upload_file
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class ApiError(Exception):
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.headers = headers or {}
+
+
+def _policy(clock, **kwargs):
+    return RetryPolicy(sleep=clock.sleep, clock=clock, jitter=False, **kwargs)
+
+
+def _flaky(*outcomes):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        outcome = outcomes[len(calls) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return fn, calls
+
+
+def test_backoff_is_exponential_capped_and_jittered():
+    policy = RetryPolicy(base_delay=1, max_delay=5, jitter=False)
+    assert [policy.backoff(n) for n in range(5)] == [1, 2, 4, 5, 5]
+    jittered = RetryPolicy(base_delay=1, max_delay=5, rng=lambda: 0.5)
+    assert jittered.backoff(2) == 2
+
+
+def test_retries_transient_errors_until_success():
+    clock = FakeClock()
+    fn, calls = _flaky(ApiError(502), ConnectionResetError(), "ok")
+    assert _policy(clock, base_delay=1).call(fn) == "ok"
+    assert len(calls) == 3 and clock.sleeps == [1, 2]
+
+
+@pytest.mark.parametrize("status", [400, 401, 403, 404, 409])
+def test_never_retries_client_errors(status):
+    clock = FakeClock()
+    fn, calls = _flaky(ApiError(status), "ok")
+    with pytest.raises(ApiError):
+        _policy(clock).call(fn)
+    assert len(calls) == 1 and clock.sleeps == []
+
+
+def test_non_idempotent_calls_retry_only_on_429():
+    clock = FakeClock()
+    fn, calls = _flaky(ApiError(503), "ok")
+    with pytest.raises(ApiError):
+        _policy(clock).call(fn, idempotent=False)
+    fn, calls = _flaky(ApiError(429), "ok")
+    assert _policy(clock).call(fn, idempotent=False) == "ok"
+
+
+def test_retry_after_overrides_shorter_backoff():
+    clock = FakeClock()
+    fn, _ = _flaky(ApiError(429, {"Retry-After": "3"}), "ok")
+    _policy(clock, base_delay=0.5).call(fn)
+    assert clock.sleeps == [3.0]
+
+
+def test_elapsed_budget_stops_retrying():
+    clock = FakeClock()
+    fn, calls = _flaky(*[ApiError(503)] * 10)
+    with pytest.raises(ApiError):
+        _policy(clock, max_attempts=10, base_delay=1, max_delay=100, max_elapsed=5).call(fn)
+    assert clock.sleeps == [1, 2] and len(calls) == 3
+
+
+def test_instrumented_client_retries_by_method_class(monkeypatch):
+    clock = FakeClock()
+    for kind in ("read", "create"):
+        monkeypatch.setitem(retry.POLICIES, kind, _policy(clock))
+
+    class Raw:
+        def __init__(self):
+            self.calls = {"list_jobs": 0, "create_job": 0}
+
+        def list_jobs(self, project_id):
+            self.calls["list_jobs"] += 1
+            if self.calls["list_jobs"] < 3:
+                raise ApiError(503)
+            return "jobs"
+
+        def create_job(self, body, project_id):
+            self.calls["create_job"] += 1
+            raise ApiError(503)
+
+    raw = Raw()
+    client = metrics.instrument_client(raw, retries=True)
+    before = metrics.UPSTREAM_RETRIES.value("list_jobs", "503")
+
+    assert client.list_jobs("p1") == "jobs"
+    with pytest.raises(ApiError):
+        client.create_job({}, "p1")
+    assert raw.calls == {"list_jobs": 3, "create_job": 1}
+    assert metrics.UPSTREAM_RETRIES.value("list_jobs", "503") - before == 2
+
+
+def test_log_batch_is_retried_as_an_idempotent_write():
+    assert retry.call_class("log_experiment_run_batch") == "write"
+    assert retry.policy_for("log_experiment_run_batch")[1] is True
+    assert retry.policy_for("create_experiment_run")[1] is False
+
+
+@pytest.fixture
+def no_rate_limit():
+    # Retry-After also pauses the rate limiter; keep these tests about the retry policy
+    ratelimit.configure_rate_limit(None)
+    yield
+    ratelimit.reset_rate_limit()
+
+
+def test_upload_retries_injected_faults_on_mock_api(monkeypatch, tmp_path, no_rate_limit):
+    clock = FakeClock()
+    monkeypatch.setitem(retry.POLICIES, "upload", _policy(clock, base_delay=0.01))
+    local = tmp_path / "model.pkl"
+    local.write_bytes(b"weights")
+
+    with MockCMLServer(projects=2) as server:
+        config = {"host": server.url, "api_key": "k", "project_id": "proj-00000"}
+        faults = f"{server.url}/_mock/faults"
+
+        requests.post(faults, json={"status": 503, "count": 2, "path": "/files$", "method": "PUT"})
+        assert upload_file(config, {"file_path": str(local)})["success"] is True
+
+        requests.post(faults, json={"status": 429, "count": 1, "path": "/files$", "method": "PUT",
+                                    "retry_after": 2})
+        assert upload_file(config, {"file_path": str(local)})["success"] is True
+
+        requests.post(faults, json={"status": 400, "count": 1, "path": "/files$", "method": "PUT"})
+        assert upload_file(config, {"file_path": str(local)})["success"] is False
+
+        stats = requests.get(f"{server.url}/_mock/stats").json()
+
+    assert clock.sleeps == [0.01, 0.02, 2.0]
+    assert stats["injected_errors"] == 4
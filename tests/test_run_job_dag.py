@@ -0,0 +1,142 @@
+"""Unit tests for the run_job_dag scheduler, driven by a local job-run stub."""
+
+import pytest
+
+from cai_workbench_mcp_server.src.functions.run_job_dag import JobDagScheduler, parse_dag, run_job_dag
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class StubJobRunApi:
+    """Each job finishes after a fixed number of seconds with a fixed final status."""
+
+    def __init__(self, clock, durations, failures=()):
+        self.clock = clock
+        self.durations = durations
+        self.failures = set(failures)
+        self.started = {}
+        self.launch_order = []
+        self.poll_batches = []
+
+    def create_job_run(self, job_id):
+        self.started[job_id] = self.clock()
+        self.launch_order.append(job_id)
+        return f"run-{job_id}"
+
+    def get_job_run(self, job_id, run_id):
+        self.poll_batches.append(job_id)
+        if self.clock() - self.started[job_id] < self.durations[job_id]:
+            return "ENGINE_RUNNING"
+        return "ENGINE_FAILED" if job_id in self.failures else "ENGINE_SUCCEEDED"
+
+
+def _scheduler(graph, durations, failures=(), **kwargs):
+    clock = FakeClock()
+    api = StubJobRunApi(clock, durations, failures)
+    scheduler = JobDagScheduler(api, parse_dag(graph), clock=clock, sleep=clock.sleep,
+                                poll_interval=1, **kwargs)
+    return scheduler, api
+
+
+def test_parallel_branches_and_critical_path():
+    graph = {"extract": [], "train": ["extract"], "report": ["extract"], "publish": ["train", "report"]}
+    scheduler, api = _scheduler(graph, {"extract": 2, "train": 5, "report": 1, "publish": 1})
+
+    report = scheduler.run()
+
+    assert report["succeeded"] is True
+    assert api.launch_order[0] == "extract"
+    assert set(api.launch_order[1:3]) == {"train", "report"}
+    assert report["jobs"]["train"]["started_at"] == report["jobs"]["report"]["started_at"]
+    assert report["critical_path"] == ["extract", "train", "publish"]
+    assert report["critical_path_seconds"] == 8
+    assert report["wall_clock_seconds"] == 8
+
+
+def test_fail_fast_stops_launching_new_jobs():
+    graph = {"a": [], "b": [], "c": ["a"], "d": ["b"]}
+    scheduler, api = _scheduler(graph, {"a": 1, "b": 3, "c": 1, "d": 1}, failures={"a"})
+
+    report = scheduler.run()
+
+    assert report["aborted"] is True
+    assert report["jobs"]["a"]["status"] == "failed"
+    assert report["jobs"]["b"]["status"] == "succeeded"
+    assert report["jobs"]["c"]["status"] == "skipped"
+    assert report["jobs"]["d"]["status"] == "skipped"
+    assert "d" not in api.launch_order
+
+
+def test_continue_policy_runs_independent_branches():
+    graph = {"a": [], "b": [], "c": ["a"], "d": ["b"]}
+    scheduler, api = _scheduler(graph, {"a": 1, "b": 3, "c": 1, "d": 1}, failures={"a"},
+                                on_failure="continue")
+
+    report = scheduler.run()
+
+    assert report["jobs"]["c"]["status"] == "skipped"
+    assert report["jobs"]["d"]["status"] == "succeeded"
+    assert report["succeeded"] is False
+
+
+def test_max_parallel_and_timeout():
+    graph = {"a": [], "b": [], "c": []}
+    scheduler, api = _scheduler(graph, {"a": 100, "b": 100, "c": 100}, max_parallel=2, timeout=5)
+
+    report = scheduler.run()
+
+    assert report["timed_out"] is True
+    assert api.launch_order == ["a", "b"]
+    assert report["jobs"]["c"]["status"] == "skipped"
+    assert report["jobs"]["a"]["status"] == "timed_out"
+
+
+def test_parse_dag_rejects_cycles():
+    with pytest.raises(ValueError, match="cycle"):
+        parse_dag({"a": ["b"], "b": ["a"]})
+
+
+def test_run_job_dag_validates_input():
+    config = {"host": "https://ml.example", "api_key": "token", "project_id": "p1"}
+    assert run_job_dag(config, {})["success"] is False
+    assert run_job_dag(config, {"dag": '{"a": ["a"]}'})["success"] is False
+    assert run_job_dag(config, {"dag": {"a": []}, "timeout": -1})["success"] is False
+    bad_env = run_job_dag(config, {"dag": {"a": []}, "job_overrides": {"a": {"environment_variables": "{bad"}}})
+    assert bad_env == {"success": False, "message": "Invalid dag parameters: Invalid JSON for environment_variables of a"}
+
+
+def test_run_job_dag_honours_zero_and_parses_per_job_env(monkeypatch):
+    import importlib
+
+    module = importlib.import_module("cai_workbench_mcp_server.src.functions.run_job_dag")
+
+    captured = {}
+
+    class Scheduler:
+        def __init__(self, api, graph, **kwargs):
+            captured.update(kwargs, api=api)
+
+        def run(self):
+            return {"succeeded": True, "counts": {"succeeded": 1}}
+
+    monkeypatch.setattr(module, "setup_client", lambda host, api_key: object())
+    monkeypatch.setattr(module, "JobDagScheduler", Scheduler)
+    result = run_job_dag({"host": "h", "api_key": "k", "project_id": "p1"}, {
+        "dag": {"a": []}, "poll_interval": 0, "timeout": 0,
+        "environment_variables": '{"SHARED": "1"}',
+        "job_overrides": {"a": {"environment_variables": '{"ONLY_A": "2"}'}},
+    })
+
+    assert result["success"] is True
+    assert (captured["poll_interval"], captured["timeout"]) == (0.0, 0.0)
+    assert captured["api"].run_params("a")["environment_variables"] == {"SHARED": "1", "ONLY_A": "2"}
+    assert captured["api"].run_params("b") == {"environment_variables": {"SHARED": "1"}}
@@ -0,0 +1,127 @@
+"""Tests for the slow-call log."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from cai_workbench_mcp_server.src.functions import slow_calls, timing, tracing
+from cai_workbench_mcp_server.src.functions.http_helpers import collect_pages
+from cai_workbench_mcp_server.src.functions.metrics import instrument_client
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = tmp_path / "slow.jsonl"
+    yield path
+    slow_calls.shutdown()
+
+
+def _read(path):
+    slow_calls.shutdown()
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_disabled_without_threshold(monkeypatch):
+    monkeypatch.delenv("CAI_MCP_SLOW_CALL_MS", raising=False)
+    assert slow_calls.configure_slow_call_log() is False
+    assert slow_calls.record_call("list_jobs_tool", {}, 10_000, False) is False
+
+
+def test_fingerprint_redacts_strings_and_keeps_numbers():
+    first = slow_calls.fingerprint({"project_id": "abc", "api_key": "secret", "page_size": 100, "tags": ["a"]})
+    again = slow_calls.fingerprint({"page_size": 100, "tags": ["a"], "api_key": "secret", "project_id": "abc"})
+    other = slow_calls.fingerprint({"project_id": "abd", "api_key": "secret", "page_size": 100, "tags": ["a"]})
+
+    assert first == again and first["hash"] != other["hash"]
+    assert first["shape"] == {"api_key": "str[6]", "page_size": 100, "project_id": "str[3]", "tags": "list[1]"}
+    assert "secret" not in json.dumps(first)
+
+
+def test_only_calls_over_threshold_are_logged_with_upstream_breakdown(log_path):
+    slow_calls.configure_slow_call_log(threshold=50, path=str(log_path))
+    raw = MagicMock()
+    raw.list_jobs.side_effect = [{"jobs": [1], "next_page_token": "t"}, {"jobs": [2], "next_page_token": ""}]
+    client = instrument_client(raw)
+
+    with timing.collect(record=True) as timer:
+        jobs = collect_pages(client.list_jobs, "jobs", "p1")
+    assert slow_calls.record_call("list_jobs_tool", {"project_id": "p1"}, 10, False, timer) is False
+    assert slow_calls.record_call("list_jobs_tool", {"project_id": "p1"}, 75, False, timer) is True
+
+    [entry] = _read(log_path)
+    assert jobs == [1, 2]
+    assert entry["tool"] == "list_jobs_tool"
+    assert entry["arguments"]["shape"] == {"project_id": "str[2]"}
+    assert entry["upstream_calls"] == 2
+    assert entry["pages"] == 2
+    assert entry["by_method"]["list_jobs"]["calls"] == 2
+    assert entry["bytes"] > 0
+    assert tracing.current_page() is None
+
+
+def test_pages_add_up_across_loops_over_the_same_method(log_path):
+    slow_calls.configure_slow_call_log(threshold=0, path=str(log_path))
+    raw = MagicMock()
+    raw.list_jobs.side_effect = [{"jobs": [1], "next_page_token": "t"}, {"jobs": [2], "next_page_token": ""},
+                                 {"jobs": [3], "next_page_token": "t"}, {"jobs": [4], "next_page_token": ""}]
+    client = instrument_client(raw)
+
+    with timing.collect(record=True) as timer:
+        collect_pages(client.list_jobs, "jobs", "p1")
+        collect_pages(client.list_jobs, "jobs", "p2")
+    slow_calls.record_call("list_jobs_tool", {}, 1, False, timer)
+
+    [entry] = _read(log_path)
+    assert entry["pages"] == 4
+    assert entry["by_method"]["list_jobs"]["pages"] == 4
+
+
+@pytest.mark.parametrize("tool", ["get_project_id", "batch_list_projects", "list_teams"])
+def test_paginating_tools_tag_their_pages(tool, monkeypatch):
+    import importlib
+
+    module = importlib.import_module(f"cai_workbench_mcp_server.src.functions.{tool}")
+    raw = MagicMock()
+    pages = [{"projects": [{"name": "a", "id": "p1"}], "team_accelerator_quota": [{"team_name": "t1"}],
+              "next_page_token": "t"},
+             {"projects": [{"name": "b", "id": "p2"}], "team_accelerator_quota": [{"team_name": "t2"}],
+              "next_page_token": ""}]
+    raw.list_projects.side_effect = list(pages)
+    raw.list_teams_accelerator_quota.side_effect = list(pages)
+    monkeypatch.setattr(module, "setup_client", lambda host, api_key: instrument_client(raw))
+
+    with timing.collect(record=True) as timer:
+        getattr(module, tool)({"host": "h", "api_key": "k"}, {"project_name": "b"})
+
+    assert [call["page"] for call in timer.as_dict()["upstream_calls"]] == [1, 2]
+
+
+def test_log_rotates(log_path):
+    slow_calls.configure_slow_call_log(threshold=0, path=str(log_path), max_bytes=400, backups=2)
+    for _ in range(20):
+        slow_calls.record_call("list_projects_tool", {"search": "x" * 50}, 1, False)
+    slow_calls.shutdown()
+    assert (log_path.parent / "slow.jsonl.1").exists()
+    assert not (log_path.parent / "slow.jsonl.3").exists()
+
+
+def test_mcp_tool_calls_are_logged_without_timing_block(log_path, monkeypatch):
+    from fastmcp import Client
+
+    from cai_workbench_mcp_server.http_server import mcp
+
+    monkeypatch.delenv("CAI_WORKBENCH_HOST", raising=False)
+    slow_calls.configure_slow_call_log(threshold=0, path=str(log_path))
+
+    async def call():
+        async with Client(mcp) as client:
+            return await client.call_tool("get_job_tool", {"job_id": "j1"}, raise_on_error=False)
+
+    result = asyncio.run(call())
+    [entry] = _read(log_path)
+    assert "_timing" not in json.loads(result.content[0].text)
+    assert entry["tool"] == "get_job_tool"
+    assert entry["failed"] is True
+    assert entry["arguments"]["shape"] == {"job_id": "str[2]"}
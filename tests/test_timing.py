@@ -0,0 +1,71 @@
+"""Tests for the opt-in per-call _timing breakdown."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from cai_workbench_mcp_server.src.functions import timing
+from cai_workbench_mcp_server.src.functions.http_helpers import serialize_result
+from cai_workbench_mcp_server.src.functions.metrics import instrument_client
+from cai_workbench_mcp_server.src.functions.parallel import map_bounded
+
+
+@pytest.fixture
+def timing_enabled():
+    timing.set_enabled(True)
+    yield
+    timing.set_enabled(False)
+
+
+def test_collect_yields_none_when_disabled():
+    timing.set_enabled(False)
+    with timing.collect() as timer:
+        with timing.phase("config_load"):
+            pass
+        timing.record_upstream("list_jobs", 0.01, None, None)
+    assert timer is None
+
+
+def test_breakdown_records_phases_upstream_calls_and_payload_size(timing_enabled):
+    raw = MagicMock()
+    raw.list_jobs.return_value = {"jobs": [{"id": "j1"}]}
+    client = instrument_client(raw)
+
+    with timing.collect() as timer:
+        with timing.phase("client_setup"):
+            pass
+        data = serialize_result(client.list_jobs("p1"))
+    block = timer.as_dict()
+
+    assert data == {"jobs": [{"id": "j1"}]}
+    assert set(block) >= {"client_setup_ms", "serialization_ms", "upstream_ms", "total_ms", "other_ms"}
+    [call] = block["upstream_calls"]
+    assert call["method"] == "list_jobs"
+    assert call["bytes"] == len(json.dumps({"jobs": [{"id": "j1"}]}))
+    assert block["total_ms"] >= block["upstream_ms"]
+
+
+def test_map_bounded_calls_record_into_the_callers_timer(timing_enabled):
+    with timing.collect() as timer:
+        map_bounded(lambda i: timing.record_upstream(f"get_job_{i}", 0.001, 200, 10), range(5), max_workers=3)
+    assert sorted(c["method"] for c in timer.as_dict()["upstream_calls"]) == [f"get_job_{i}" for i in range(5)]
+
+
+def test_tool_response_gets_timing_block_over_mcp(timing_enabled, monkeypatch):
+    from fastmcp import Client
+
+    from cai_workbench_mcp_server.http_server import mcp
+
+    monkeypatch.delenv("CAI_WORKBENCH_HOST", raising=False)
+
+    async def call():
+        async with Client(mcp) as client:
+            return await client.call_tool("get_job_tool", {"job_id": "j1"}, raise_on_error=False)
+
+    result = asyncio.run(call())
+    data = json.loads(result.content[0].text)
+    assert data["success"] is False
+    assert "config_load_ms" in data["_timing"]
+    assert data["_timing"]["upstream_calls"] == []
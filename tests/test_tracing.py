@@ -0,0 +1,71 @@
+"""Tests for optional OpenTelemetry tracing of tool calls and upstream requests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from cai_workbench_mcp_server.src.functions import metrics, tracing
+from cai_workbench_mcp_server.src.functions.http_helpers import collect_pages
+
+in_memory = pytest.importorskip("opentelemetry.sdk.trace.export.in_memory_span_exporter")
+
+
+@pytest.fixture
+def exporter():
+    span_exporter = in_memory.InMemorySpanExporter()
+    assert tracing.configure_tracing(span_exporter=span_exporter)
+    yield span_exporter
+    tracing.disable_tracing()
+
+
+def _paged_client():
+    pages = {None: {"jobs": [{"id": "a"}], "next_page_token": "t2"}, "t2": {"jobs": [{"id": "b"}]}}
+    raw = MagicMock()
+
+    def _list_jobs(project_id, page_token=None):
+        response = MagicMock()
+        response.to_dict.return_value = pages[page_token]
+        return response
+
+    raw.list_jobs.side_effect = _list_jobs
+    return metrics.instrument_client(raw)
+
+
+def test_tool_span_parents_upstream_and_serialization_spans(exporter):
+    client = _paged_client()
+
+    with metrics.track_tool("list_jobs_tool"):
+        jobs = collect_pages(client.list_jobs, "jobs", "p1")
+
+    assert [j["id"] for j in jobs] == ["a", "b"]
+    spans = {s.name: s for s in exporter.get_finished_spans()}
+    tool = spans["tool list_jobs_tool"]
+    upstream = [s for s in exporter.get_finished_spans() if s.name == "cmlapi list_jobs"]
+    serialize = [s for s in exporter.get_finished_spans() if s.name == "serialize_result"]
+
+    assert [s.attributes["cmlapi.page"] for s in upstream] == [1, 2]
+    assert all(s.parent.span_id == tool.context.span_id for s in upstream + serialize)
+    assert serialize[0].attributes["serialize.bytes"] > 0
+    assert tool.attributes["mcp.tool.failed"] is False
+
+
+def test_upstream_error_status_recorded_on_span(exporter):
+    class _ApiError(Exception):
+        status = 429
+
+    raw = MagicMock()
+    raw.get_job.side_effect = _ApiError("slow down")
+
+    with pytest.raises(_ApiError):
+        metrics.instrument_client(raw).get_job("p1", "j1")
+
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes["http.status_code"] == 429
+    assert not span.status.is_ok
+
+
+def test_span_is_noop_when_tracing_disabled():
+    tracing.disable_tracing()
+    with tracing.span("anything", key="value") as current:
+        assert current is None
+    assert tracing.configure_tracing(mode="off") is False
@@ -0,0 +1,156 @@
+"""Unit tests for resumable upload_folder, its on-disk journal and content dedupe."""
+
+import hashlib
+from unittest.mock import patch
+
+from cai_workbench_mcp_server.src.functions.content_index import ContentIndex, hash_file
+from cai_workbench_mcp_server.src.functions.delete_project_file import delete_project_file
+from cai_workbench_mcp_server.src.functions.upload_folder import upload_folder
+from cai_workbench_mcp_server.src.functions.upload_journal import UploadJournal
+
+
+def _tree(tmp_path):
+    source = tmp_path / "src"
+    (source / "pkg").mkdir(parents=True)
+    for name in ("a.py", "b.py", "pkg/c.py"):
+        (source / name).write_text(name, encoding="utf-8")
+    return source
+
+
+def _upload(source, journal, fail=(), **params):
+    uploaded = []
+
+    def _put(host, api_key, project_id, file_path, relative_path):
+        if str(relative_path) in fail:
+            return False
+        uploaded.append(str(relative_path))
+        return True
+
+    config = {"host": "https://ml.example", "api_key": "token", "project_id": "p1"}
+    with patch("cai_workbench_mcp_server.src.functions.upload_folder.upload_file_to_project", side_effect=_put):
+        result = upload_folder(config, {
+            "folder_path": str(source),
+            "journal_path": str(journal),
+            "index_path": str(journal.parent / "index.sqlite3"),
+            **params,
+        })
+    return result, uploaded
+
+
+def test_interrupted_upload_resumes_from_journal(tmp_path):
+    source = _tree(tmp_path)
+    journal = tmp_path / "journal.jsonl"
+
+    first, uploaded = _upload(source, journal, fail={"b.py"})
+    assert first["failed_count"] == 1
+    assert sorted(uploaded) == ["a.py", "pkg/c.py"]
+    assert journal.exists()
+
+    (source / "a.py").write_text("changed content", encoding="utf-8")
+    second, uploaded = _upload(source, journal)
+
+    assert sorted(uploaded) == ["a.py", "b.py"]
+    assert second["skipped_count"] == 1
+    assert second["results"]["skipped"] == ["pkg/c.py"]
+    assert not journal.exists()
+
+
+def test_journal_batches_fsync_and_ignores_torn_lines(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    with patch("cai_workbench_mcp_server.src.functions.upload_journal.os.fsync") as fsync:
+        journal = UploadJournal(str(path), fsync_every=3)
+        for i in range(7):
+            journal.record(f"f{i}", i, 1.5)
+        assert fsync.call_count == 2
+        journal.close()
+        assert fsync.call_count == 3
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"path": "f7", "si')
+    reloaded = UploadJournal(str(path))
+
+    assert len(reloaded.completed) == 7
+    assert reloaded.is_done("f3", 3, 1.5)
+    assert not reloaded.is_done("f3", 4, 1.5)
+
+    reloaded.record("f8", 8, 1.5)
+    reloaded.close()
+    assert UploadJournal(str(path)).is_done("f8", 8, 1.5)
+
+
+def test_upload_folder_honours_ignore_files_and_filters(tmp_path):
+    source = _tree(tmp_path)
+    (source / ".venv" / "lib").mkdir(parents=True)
+    (source / ".venv" / "lib" / "site.py").write_text("x", encoding="utf-8")
+    (source / "pkg" / "model.ckpt").write_bytes(b"0" * 100)
+    (source / ".caiignore").write_text("b.py\n", encoding="utf-8")
+
+    result, uploaded = _upload(source, tmp_path / "journal.jsonl")
+
+    assert sorted(uploaded) == [".caiignore", "a.py", "pkg/c.py", "pkg/model.ckpt"]
+    assert result["filtered"]["pruned_dirs"] == 1
+
+
+def test_unchanged_content_is_not_uploaded_again(tmp_path):
+    source = _tree(tmp_path)
+    journal = tmp_path / "journal.jsonl"
+    _upload(source, journal, dedupe=True)
+
+    (source / "a.py").write_text("a.py", encoding="utf-8")  # same bytes, new mtime
+    (source / "b.py").write_text("new b", encoding="utf-8")
+    result, uploaded = _upload(source, journal, dedupe=True)
+
+    assert uploaded == ["b.py"]
+    assert result["deduplicated_count"] == 2
+    assert result["dedupe"]["hash_cache_hits"] == 1
+
+    _, uploaded = _upload(source, journal)
+    assert len(uploaded) == 3
+
+
+def test_remote_deletes_invalidate_the_content_index(tmp_path, monkeypatch):
+    source = _tree(tmp_path)
+    journal = tmp_path / "journal.jsonl"
+    monkeypatch.setenv("CAI_CONTENT_INDEX_PATH", str(tmp_path / "index.sqlite3"))
+    _upload(source, journal, dedupe=True)
+
+    with patch("cai_workbench_mcp_server.src.functions.delete_project_file.setup_client"):
+        assert delete_project_file({"host": "https://ml.example", "api_key": "token"},
+                                   {"project_id": "p1", "file_path": "pkg"})["success"]
+    (source / "a.py").write_text("a.py", encoding="utf-8")
+    _, uploaded = _upload(source, journal, dedupe=True)
+
+    assert uploaded == ["pkg/c.py"]
+
+
+def test_content_index_tracks_locations_and_hashes_large_files(tmp_path):
+    big = tmp_path / "weights.bin"
+    big.write_bytes(b"\x01" * (9 * 1024 * 1024))
+    index = ContentIndex(":memory:")
+
+    digest = index.file_hash(str(big), big.stat())
+    assert digest == hash_file(str(big)) == hashlib.sha256(big.read_bytes()).hexdigest()
+    assert index.file_hash(str(big), big.stat()) == digest
+    assert index.stats["hashed"] == 1 and index.stats["hash_cache_hits"] == 1
+
+    index.record_upload("h", "p1", "models/w.bin", digest, 10)
+    index.record_upload("h", "p2", "shared/w.bin", digest, 10)
+    assert {loc["project_id"] for loc in index.locations(digest)} == {"p1", "p2"}
+    assert index.is_uploaded("h", "p1", "models/w.bin", digest)
+    assert not index.is_uploaded("h", "p1", "other.bin", digest)
+    index.forget("h", "p1")
+    assert [loc["project_id"] for loc in index.locations(digest)] == ["p2"]
+    index.record_upload("h", "p2", "shared2/w.bin", digest, 10)
+    index.forget("h", "p2", "shared")
+    assert [loc["remote_path"] for loc in index.locations(digest)] == ["shared2/w.bin"]
+
+
+def test_content_index_does_not_hold_the_write_lock_between_uploads(tmp_path):
+    path = str(tmp_path / "index.sqlite3")
+    first, second = ContentIndex(path), ContentIndex(path)
+    first.record_upload("h", "p1", "a.py", "0" * 64, 1)
+    second.record_upload("h", "p1", "b.py", "1" * 64, 1)
+
+    assert first.is_uploaded("h", "p1", "b.py", "1" * 64)
+    first.close()
+    second.close()
@@ -0,0 +1,68 @@
+"""Unit tests for the recursive project file walker."""
+
+from unittest.mock import MagicMock, patch
+
+from cai_workbench_mcp_server.src.functions.walk_project_files import walk_project_files, walk_remote_tree
+
+TREE = {
+    "": [
+        {"path": "README.md", "is_dir": False, "file_size": "10", "last_modified": "2024-01-01"},
+        {"path": "src", "is_dir": True},
+        {"path": ".git", "is_dir": True},
+    ],
+    "src": [
+        {"path": "src/app.py", "is_dir": False, "file_size": "200"},
+        {"path": "src/app.pyc", "is_dir": False, "file_size": "300"},
+        {"path": "src/pkg", "is_dir": True},
+    ],
+    # Some listings return names relative to the listed directory.
+    "src/pkg": [{"path": "util.py", "is_dir": False, "file_size": "5"}],
+    ".git": [{"path": ".git/HEAD", "is_dir": False, "file_size": "1"}],
+}
+
+
+def _client(broken=()):
+    client = MagicMock()
+
+    def _list(project_id, path):
+        if path in broken:
+            raise RuntimeError("listing failed")
+        response = MagicMock()
+        response.to_dict.return_value = {"files": TREE[path]}
+        return response
+
+    client.list_project_files.side_effect = _list
+    return client
+
+
+def test_walk_prunes_excluded_directories_and_filters_files():
+    client = _client()
+
+    tree = walk_remote_tree(client, "p1", exclude=[".git", "*.pyc"], include=["*.py"], max_workers=4)
+
+    assert [f["path"] for f in tree["files"]] == ["src/app.py", "src/pkg/util.py"]
+    assert tree["directories"] == ["src", "src/pkg"]
+    listed = [c.args[1] for c in client.list_project_files.call_args_list]
+    assert ".git" not in listed
+
+
+def test_walk_respects_max_depth_and_reports_failures():
+    tree = walk_remote_tree(_client(), "p1", max_depth=1, exclude=[".git"])
+    assert [f["path"] for f in tree["files"]] == ["README.md", "src/app.py", "src/app.pyc"]
+
+    tree = walk_remote_tree(_client(broken={"src/pkg"}), "p1", exclude=[".git"])
+    assert tree["failed"] == [{"path": "src/pkg", "error": "listing failed"}]
+
+
+@patch("cai_workbench_mcp_server.src.functions.walk_project_files.setup_client")
+def test_walk_project_files_returns_manifest_totals(mock_setup_client):
+    mock_setup_client.return_value = _client()
+
+    result = walk_project_files({"host": "https://ml.example", "api_key": "token"},
+                                {"project_id": "p1", "path": "src", "exclude": "*.pyc"})
+
+    data = result["data"]
+    assert data["file_count"] == 2
+    assert data["total_bytes"] == 205
+    assert data["files"][0] == {"path": "src/app.py", "size": 200, "mtime": None, "depth": 0}
+    assert data["files"][1]["depth"] == 1